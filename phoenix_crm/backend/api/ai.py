@@ -1,6 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
-from services.gpt4all_client import get_gpt4all_client
+from backend.metrics import registry, PROMETHEUS_CONTENT_TYPE
+from services import inference
+from services.prompt_builder import build_prompts, prompt_stats, MAX_TOKENS
 from typing import List
 
 router = APIRouter()
@@ -17,58 +21,50 @@ class SuggestionRequest(BaseModel):
     lead_data: dict
     worksheet_data: dict
 
+async def _generate(endpoint: str, *inputs) -> inference.InferenceResult:
+    """Build the endpoint's prompt, run the model off the event loop and record prompt savings and telemetry."""
+    prompt, naive_prompt = build_prompts(endpoint, *inputs)
+    result = await run_in_threadpool(inference.generate, prompt, MAX_TOKENS[endpoint], endpoint)
+    if not result.cache_hit:
+        prompt_stats.record(naive_prompt, prompt, latency=result.duration - result.queue_wait)
+    return result
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_ai(request: ChatMessage):
     try:
-        gpt4all = get_gpt4all_client()
-        
-        prompt = f"Context: {request.context}\n\nUser: {request.message}\n\nAssistant:"
-        response = gpt4all.generate(prompt, max_tokens=500)
-        
-        return ChatResponse(response=response, confidence=0.8)
-        
+        result = await _generate("chat", request.message, request.context)
+
+        return ChatResponse(response=result.text, confidence=result.confidence)
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI service error: {str(e)}")
 
 @router.post("/suggestions")
 async def get_suggestions(request: SuggestionRequest):
     try:
-        gpt4all = get_gpt4all_client()
-        
-        prompt = f"""
-        Based on the following lead and worksheet data, provide suggestions for next steps:
-        
-        Lead Data: {request.lead_data}
-        Worksheet Data: {request.worksheet_data}
-        
-        Provide 3-5 actionable suggestions:
-        """
-        
-        suggestions = gpt4all.generate(prompt, max_tokens=300)
-        
-        return {"suggestions": suggestions.split('\n')}
-        
+        result = await _generate("suggestions", request.lead_data, request.worksheet_data)
+
+        return {"suggestions": result.text.split('\n')}
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI service error: {str(e)}")
 
 @router.post("/analyze-lead")
 async def analyze_lead(lead_data: dict):
     try:
-        gpt4all = get_gpt4all_client()
-        
-        prompt = f"""
-        Analyze this lead and provide insights:
-        {lead_data}
-        
-        Provide analysis on:
-        1. Lead quality score (1-10)
-        2. Potential challenges
-        3. Recommended approach
-        """
-        
-        analysis = gpt4all.generate(prompt, max_tokens=400)
-        
-        return {"analysis": analysis}
-        
+        result = await _generate("analyze-lead", lead_data)
+
+        return {"analysis": result.text}
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI service error: {str(e)}")
+
+@router.get("/prompt-stats")
+async def get_prompt_stats():
+    """Prompt tokens saved by the compact builder and the estimated latency saved."""
+    return prompt_stats.snapshot()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_ai_metrics():
+    """Inference histograms (tokens, tokens/sec, time to first token, queue wait) in Prometheus format."""
+    return PlainTextResponse(registry.render(prefix="phoenix_ai_"), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,14 +1,24 @@
 """
 Authentication API Router
 """
-from fastapi import APIRouter, HTTPException, Depends
+import os
+import hmac
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Optional
 from backend.database import get_supabase_client
+from backend.tracing import start_span
+from backend.resilience import CircuitOpenError, is_transient
+from backend.ratelimit import verified_tokens
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 security = HTTPBearer()
+logger = logging.getLogger(__name__)
+
+# Shared secret for operator endpoints (index rebuilds and the like); unset disables them
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 
 
 class LoginRequest(BaseModel):
@@ -28,19 +38,17 @@ async def login(credentials: LoginRequest):
     supabase = get_supabase_client()
     
     try:
-        print(f"Attempting login for: {credentials.email}")
-        
         # Authenticate with Supabase
         response = supabase.auth.sign_in_with_password({
             "email": credentials.email,
             "password": credentials.password
         })
         
-        print(f"Supabase response: {response}")
-        
         if not response.user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         
+        logger.info("Login succeeded", extra={"user_id": response.user.id})
+        
         return {
             "access_token": response.session.access_token,
             "token_type": "bearer",
@@ -53,7 +61,7 @@ async def login(credentials: LoginRequest):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Login error: {e}")
+        logger.warning("Login failed: %s", type(e).__name__)
         raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
 
 
@@ -82,18 +90,34 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     token = credentials.credentials
     
     try:
-        # Verify the token with Supabase
-        user = supabase.auth.get_user(token)
-        
-        if not user or not user.user:
-            raise HTTPException(status_code=401, detail="Invalid authentication token")
-        
-        return {"id": user.user.id, "email": user.user.email}
+        with start_span("auth.verify_token") as span:
+            # Verify the token with Supabase
+            user = supabase.auth.get_user(token)
+            
+            if not user or not user.user:
+                raise HTTPException(status_code=401, detail="Invalid authentication token")
+            
+            span.set_attribute("enduser.id", user.user.id)
+            # From now on the rate limiter charges this token to its user instead of the client address
+            verified_tokens.add(token, user.user.id)
+            return {"id": user.user.id, "email": user.user.email}
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Auth error: {e}")
+        if isinstance(e, CircuitOpenError) or is_transient(e):
+            # The auth service is unreachable; a 401 would make the client discard a valid token
+            logger.warning("Token verification unavailable: %s", e)
+            raise HTTPException(status_code=503, detail="Authentication service unavailable")
+        logger.info("Token verification failed: %s", e)
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
 
+async def require_admin(x_admin_token: str = Header(default="")):
+    """Operator access: the X-Admin-Token header must match ADMIN_TOKEN."""
+    if not ADMIN_TOKEN or not hmac.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Valid X-Admin-Token required")
+
+
 @router.get("/me")
 async def get_current_user_info(current_user: dict = Depends(get_current_user)):
     """Get current user information."""
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
 from datetime import datetime
 from backend.api.auth import get_current_user
+from backend.pagination import Page, pagination
 from services.lead_service import LeadService
+from services.lead_scoring import LeadScorer
 
 router = APIRouter(prefix="/api/leads", tags=["leads"])  # Add prefix here
 lead_service = LeadService()
+lead_scorer = LeadScorer()
+logger = logging.getLogger(__name__)
 
 class LeadBase(BaseModel):
     first_name: str
@@ -43,23 +48,40 @@ class Lead(LeadBase):
     assigned_to: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+    score: Optional[float] = None
+
+LEAD_ORDER_COLUMNS = ("created_at", "updated_at", "first_name", "last_name", "company", "status", "priority", "value")
 
 @router.get("/", response_model=List[Lead])
-async def get_leads(current_user: dict = Depends(get_current_user)):
-    """Get all leads for the current user."""
+async def get_leads(
+    sort: Optional[str] = Query(default=None, regex="^score$"),
+    page: Page = Depends(pagination(None, LEAD_ORDER_COLUMNS)),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Get all leads for the current user.
+    
+    - **sort**: Pass `score` to rank leads best-first by the rule-based lead score
+    - **limit** / **offset** / **order**: Page through the leads, e.g. `order=-created_at&limit=5`;
+      `order` cannot be combined with `sort=score`
+    """
+    if sort == "score" and page.column:
+        raise HTTPException(status_code=422, detail="order cannot be combined with sort=score")
+    
     try:
         user_id = current_user.get("id")
-        print(f"Fetching leads for user_id: {user_id}")  # Debug log
         
-        leads = lead_service.get_all_leads(user_id)
+        if sort == "score":
+            # The score is computed here, so every lead is needed before the page can be cut
+            leads = page.slice(lead_scorer.rank(lead_service.get_all_leads(user_id)))
+        else:
+            leads = lead_service.get_all_leads(user_id, page=page)
         
-        print(f"Found {len(leads)} leads")  # Debug log
+        logger.debug("Fetched leads", extra={"user_id": user_id, "count": len(leads)})
         
         return leads
     except Exception as e:
-        print(f"Error fetching leads: {type(e).__name__}: {str(e)}")  # Debug log
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching leads")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/", response_model=Lead)
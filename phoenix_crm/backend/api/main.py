@@ -1,3 +1,4 @@
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import sys
@@ -8,6 +9,11 @@ root_dir = Path(__file__).parent.parent
 if str(root_dir) not in sys.path:
     sys.path.insert(0, str(root_dir))
 
+from backend.log import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Try to import from backend - adjust based on your actual structure
 try:
     # Try importing routers from backend.routers
@@ -18,7 +24,7 @@ except ModuleNotFoundError:
         from backend import auth, leads
     except ModuleNotFoundError:
         # Create placeholder routers if backend doesn't exist yet
-        print("Warning: Backend auth/leads routers not found. Using placeholders.")
+        logger.warning("Backend auth/leads routers not found. Using placeholders.")
         from fastapi import APIRouter
         
         class AuthRouter:
@@ -74,5 +80,6 @@ async def health_check():
     return {"status": "healthy"}
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Production by default; pass --reload for the development file watcher
+    from backend.server import main
+    main(app="backend.api.main:app")
\ No newline at end of file
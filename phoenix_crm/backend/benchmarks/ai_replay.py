@@ -0,0 +1,104 @@
+"""
+Replay a prompt corpus through the local model and summarize inference telemetry.
+
+Usage (from the backend directory):
+    python -m benchmarks.ai_replay
+    python -m benchmarks.ai_replay --corpus my_prompts.jsonl --repeat 2 --concurrency 4
+
+Each corpus line is a JSON object with an "endpoint" of chat, suggestions or
+analyze-lead plus that endpoint's request fields. Prompts are built exactly as
+the API builds them, so the numbers reflect what the AI router sees.
+"""
+import sys
+import json
+import argparse
+import statistics
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Make both `backend.*` and `services.*` importable, as backend/main.py does
+backend_dir = Path(__file__).resolve().parent.parent
+for path in (backend_dir.parent, backend_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from services import inference
+from services.prompt_builder import (
+    build_chat_prompt, build_suggestions_prompt, build_analysis_prompt, MAX_TOKENS,
+)
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "prompt_corpus.jsonl"
+
+
+def build_prompt(entry):
+    endpoint = entry["endpoint"]
+    max_tokens = MAX_TOKENS[endpoint]
+    if endpoint == "chat":
+        return build_chat_prompt(entry["message"], entry.get("context", ""), max_tokens), max_tokens
+    if endpoint == "suggestions":
+        return build_suggestions_prompt(entry["lead_data"], entry["worksheet_data"], max_tokens), max_tokens
+    if endpoint == "analyze-lead":
+        return build_analysis_prompt(entry["lead_data"], max_tokens), max_tokens
+    raise ValueError(f"Unknown endpoint in corpus: {endpoint}")
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(results):
+    summary = {"requests": len(results), "cache_hits": sum(r.cache_hit for r in results)}
+    fields = ("prompt_tokens", "generated_tokens", "tokens_per_second", "time_to_first_token", "queue_wait", "duration")
+    generated = [r for r in results if not r.cache_hit]
+    for field in fields:
+        # Cache hits never touch the model, so only prompt size is meaningful for them
+        source = results if field == "prompt_tokens" else generated
+        values = [getattr(r, field) for r in source if getattr(r, field) is not None]
+        if not values:
+            continue
+        summary[field] = {
+            "mean": round(statistics.fmean(values), 4),
+            "p50": round(percentile(values, 50), 4),
+            "p95": round(percentile(values, 95), 4),
+            "max": round(max(values), 4),
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a prompt corpus through the local model")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the corpus this many times (later passes hit the cache)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent callers, to measure queue wait")
+    parser.add_argument("--output", type=Path, help="Write the JSON summary here as well")
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as corpus:
+        entries = [json.loads(line) for line in corpus if line.strip()]
+    jobs = [(entry["endpoint"],) + build_prompt(entry) for entry in entries] * args.repeat
+
+    print(f"Replaying {len(jobs)} prompts with concurrency {args.concurrency}...")
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda job: inference.generate(job[1], job[2], job[0]), jobs))
+
+    by_endpoint = {}
+    for (endpoint, _, _), result in zip(jobs, results):
+        by_endpoint.setdefault(endpoint, []).append(result)
+
+    report = {"overall": summarize(results)}
+    report.update({endpoint: summarize(items) for endpoint, items in sorted(by_endpoint.items())})
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Load and latency benchmark for the API against the in-memory Supabase fake.
+
+Usage (from the backend directory):
+    python -m benchmarks.api_load --scale 1k
+    python -m benchmarks.api_load --scale 1k,100k,1m --concurrency 1,8,32 --output run.json
+    python -m benchmarks.api_load --scale 100k --baseline previous.json
+    python -m benchmarks.api_load --compare previous.json run.json
+
+backend.main:app is driven in-process over ASGI, so numbers cover routing,
+validation, serialization and the data layer without socket noise. Each
+route is timed at every concurrency level, then replayed sequentially under
+tracemalloc to measure per-request allocations. --compare (or --baseline)
+flags routes whose p95 latency rose or throughput fell by more than
+--threshold, and exits non-zero when any did.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import gc
+import platform
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Make both `backend.*` and `services.*` importable, as backend/main.py does
+backend_dir = Path(__file__).resolve().parent.parent
+for path in (backend_dir.parent, backend_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# Keep request logging, the on-disk search index and per-user rate limits out of the measurements
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SEMANTIC_INDEX_DIR", tempfile.mkdtemp(prefix="phoenix-bench-index-"))
+
+import httpx
+import numpy as np
+from backend.database import set_supabase_client
+from backend.fake_supabase import FakeSupabase
+from benchmarks.datagen import DataGenerator, load_fake
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: Optional[Dict[str, Any]] = None
+
+
+SCENARIOS = [
+    Scenario("health", "GET", "/health"),
+    Scenario("leads.list", "GET", "/api/leads/"),
+    Scenario("leads.list_by_score", "GET", "/api/leads/?sort=score"),
+    Scenario("leads.get", "GET", "/api/leads/{lead_id}"),
+    Scenario("leads.create", "POST", "/api/leads/", {
+        "first_name": "Bench", "last_name": "Mark", "email": "bench@example.com", "source": "website", "value": 25000,
+    }),
+    Scenario("leads.update", "PUT", "/api/leads/{lead_id}", {"status": "contacted"}),
+    Scenario("appointments.list", "GET", "/api/appointments/"),
+    Scenario("goals.list", "GET", "/api/goals/"),
+    Scenario("notifications.list", "GET", "/api/notifications/"),
+    Scenario("worksheets.list", "GET", "/api/worksheets/"),
+    Scenario("training.list", "GET", "/api/training/"),
+    Scenario("leaderboard", "GET", "/api/leaderboard/"),
+    Scenario("leaderboard.my_stats", "GET", "/api/leaderboard/my-stats"),
+    Scenario("search.semantic", "GET", "/api/search/semantic?q=trade+in+financing"),
+]
+
+
+def parse_scale(value: str) -> int:
+    value = value.strip().lower()
+    return SCALES[value] if value in SCALES else int(value)
+
+
+def seed(fake: FakeSupabase, leads: int, users: int, seed_value: int) -> List[Dict[str, Any]]:
+    """Load a generated dataset with `leads` leads spread over `users` sales people.
+
+    Returns one context per user: its bearer token and a sample of its lead IDs.
+    """
+    fake.clear()
+    generator = DataGenerator(leads=leads, users=users, seed=seed_value)
+    load_fake(generator, fake)
+    by_owner = fake.get_table("leads").index("assigned_to")
+    contexts = []
+    for n in range(users):
+        user_id = generator.user_id(n)
+        lead_ids = sorted(by_owner.get(user_id, ()))[:100]
+        if not lead_ids:
+            continue
+        user = fake.auth.sign_in_with_password({"email": generator.user_email(n), "password": "phoenix"}).user
+        contexts.append({"user_id": user_id, "token": fake.auth.issue_token(user), "lead_ids": lead_ids})
+    return contexts
+
+
+def _request_args(scenario: Scenario, ctx: Dict[str, Any], n: int):
+    path = scenario.path
+    if "{lead_id}" in path:
+        path = path.replace("{lead_id}", ctx["lead_ids"][n % len(ctx["lead_ids"])])
+    return scenario.method, path, {"Authorization": f"Bearer {ctx['token']}"}, scenario.body
+
+
+async def drive(client: httpx.AsyncClient, scenario: Scenario, contexts, concurrency: int, requests: int):
+    """Run `requests` calls through `concurrency` workers; return latencies (s), errors and wall time."""
+    latencies: List[float] = []
+    errors = 0
+    issued = 0
+
+    async def worker():
+        nonlocal issued, errors
+        while issued < requests:
+            n = issued
+            issued += 1
+            method, path, headers, body = _request_args(scenario, contexts[n % len(contexts)], n)
+            start = time.perf_counter()
+            response = await client.request(method, path, headers=headers, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def allocations(client: httpx.AsyncClient, scenario: Scenario, contexts, samples: int) -> Dict[str, float]:
+    """Peak and retained traced memory per request, plus gen-0 collections, measured sequentially."""
+    peaks, retained = [], []
+    collections_before = gc.get_stats()[0]["collections"]
+    tracemalloc.start()
+    try:
+        for n in range(samples):
+            method, path, headers, body = _request_args(scenario, contexts[n % len(contexts)], n)
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await client.request(method, path, headers=headers, json=body)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+    collections = gc.get_stats()[0]["collections"] - collections_before
+    return {
+        "alloc_peak_kib": round(float(np.mean(peaks)) / 1024, 1),
+        "alloc_retained_kib": round(float(np.mean(retained)) / 1024, 1),
+        "gc_gen0_per_1k": round(collections * 1000 / samples, 1),
+    }
+
+
+def summarize(latencies: List[float], errors: int, wall: float) -> Dict[str, float]:
+    ms = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 1),
+        "mean_ms": round(float(ms.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+    }
+
+
+async def run(args) -> Dict[str, Any]:
+    from backend.main import app
+
+    fake = FakeSupabase(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000, seed=args.seed)
+    set_supabase_client(fake)
+    selected = [s for s in SCENARIOS if not args.routes or any(s.name.startswith(r) for r in args.routes)]
+    report = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "users": args.users,
+            "seed": args.seed,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "requests": args.requests,
+        },
+        "results": [],
+    }
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for scale in args.scale:
+            started = time.perf_counter()
+            contexts = seed(fake, scale, args.users, args.seed)
+            print(f"Seeded {scale:,} leads for {args.users} users in {time.perf_counter() - started:.1f}s")
+            for scenario in selected:
+                # Warm caches and lazy indexes so the first timed request is not an outlier
+                await drive(client, scenario, contexts, 1, 1)
+                alloc = await allocations(client, scenario, contexts, args.alloc_samples)
+                for concurrency in args.concurrency:
+                    latencies, errors, wall = await drive(client, scenario, contexts, concurrency, args.requests)
+                    row = {"scale": scale, "route": scenario.name, "method": scenario.method,
+                           "path": scenario.path, "concurrency": concurrency}
+                    row.update(summarize(latencies, errors, wall))
+                    row.update(alloc)
+                    report["results"].append(row)
+                    print(f"  {scenario.name:<24} c={concurrency:<3} {row['throughput_rps']:>9.1f} req/s  "
+                          f"p50 {row['p50_ms']:>8.2f}ms  p95 {row['p95_ms']:>8.2f}ms  p99 {row['p99_ms']:>8.2f}ms  "
+                          f"peak {row['alloc_peak_kib']:>8.1f}KiB  errors {row['errors']}")
+    return report
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Describe each route whose p95 rose or throughput fell by more than `threshold` (a fraction)."""
+    def key(row):
+        return row["scale"], row["route"], row["concurrency"]
+
+    previous = {key(row): row for row in baseline["results"]}
+    regressions = []
+    for row in current["results"]:
+        old = previous.get(key(row))
+        if old is None:
+            continue
+        label = f"{row['route']} scale={row['scale']} c={row['concurrency']}"
+        if old["p95_ms"] > 0 and row["p95_ms"] > old["p95_ms"] * (1 + threshold):
+            regressions.append(f"{label}: p95 {old['p95_ms']:.2f}ms -> {row['p95_ms']:.2f}ms")
+        if old["throughput_rps"] > 0 and row["throughput_rps"] < old["throughput_rps"] * (1 - threshold):
+            regressions.append(f"{label}: throughput {old['throughput_rps']:.1f} -> {row['throughput_rps']:.1f} req/s")
+    return regressions
+
+
+def _report_regressions(regressions: List[str]) -> int:
+    if not regressions:
+        print("No regressions beyond threshold")
+        return 0
+    print(f"{len(regressions)} regression(s):")
+    for line in regressions:
+        print(f"  {line}")
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load and latency benchmark for the Phoenix CRM API")
+    parser.add_argument("--scale", type=lambda v: [parse_scale(s) for s in v.split(",")], default=[1_000],
+                        help="Comma-separated lead counts: 1k, 100k, 1m or plain integers")
+    parser.add_argument("--users", type=int, default=20, help="Sales people the leads are spread across")
+    parser.add_argument("--concurrency", type=lambda v: [int(c) for c in v.split(",")], default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per route and concurrency level")
+    parser.add_argument("--alloc-samples", type=int, default=20, help="Requests replayed under tracemalloc per route")
+    parser.add_argument("--routes", type=lambda v: v.split(","), help="Only run scenarios whose name starts with one of these")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated data-store round trip")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Compare this run against an earlier report")
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="Compare two saved reports without running")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown before flagging")
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (json.loads(path.read_text()) for path in args.compare)
+        sys.exit(_report_regressions(compare(baseline, current, args.threshold)))
+
+    report = asyncio.run(run(args))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Wrote {args.output}")
+    if args.baseline:
+        sys.exit(_report_regressions(compare(json.loads(args.baseline.read_text()), report, args.threshold)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,492 @@
+"""
+Deterministic synthetic data for a dealership group, at millions-of-rows scale.
+
+Usage (from the backend directory):
+    python -m benchmarks.datagen --leads 1000000 --users 250 --seed 7 --output-dir /tmp/phoenix-data
+    psql "$DATABASE_URL" -f /tmp/phoenix-data/load.sql
+
+Every table is produced by a generator that yields one row at a time, and rows
+are streamed straight to PostgreSQL COPY text files (or into the in-memory
+FakeSupabase with load_fake), so memory stays flat however many rows are
+requested. Each table draws from its own random stream seeded from --seed
+and the table name, and row IDs are derived from (seed, table, row number),
+so the same seed and --as-of date always produce identical output and rows
+can reference each other without keeping anything in memory.
+
+Sales are aggregated per user while they stream, which is what
+sales_leaderboard is built from (only per-user totals are kept).
+"""
+import sys
+import json
+import uuid
+import math
+import bisect
+import random
+import hashlib
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+# Make both `backend.*` and `services.*` importable, as backend/main.py does
+backend_dir = Path(__file__).resolve().parent.parent
+for path in (backend_dir.parent, backend_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+FIRST_NAMES = (
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Karen",
+    "Daniel", "Lisa", "Matthew", "Nancy", "Anthony", "Sandra", "Mark", "Ashley", "Wei", "Priya",
+    "Jose", "Emily", "Kevin", "Michelle", "Brian", "Amanda", "Luis", "Melissa", "Hiroshi", "Fatima",
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Nguyen", "Patel", "Kim", "Chen", "Okafor",
+)
+EMAIL_DOMAINS = ("gmail.com", "yahoo.com", "outlook.com", "icloud.com", "hotmail.com", "aol.com")
+FLEET_COMPANIES = (
+    "Metro Plumbing", "Sunrise Landscaping", "Apex Logistics", "Riverside Electric", "Summit Builders",
+    "Blue Sky Rentals", "Harbor Catering", "Prairie Ag Supply",
+)
+VEHICLES = (
+    ("Civic", 26000), ("Accord", 31000), ("CR-V", 34000), ("Pilot", 44000), ("Odyssey", 41000),
+    ("Camry", 30000), ("RAV4", 33000), ("Highlander", 45000), ("Tacoma", 38000), ("Tundra", 52000),
+    ("F-150", 48000), ("Explorer", 42000), ("Mustang", 39000), ("Silverado", 47000), ("Equinox", 30000),
+    ("Model 3", 42000), ("Outback", 33000), ("Wrangler", 40000), ("Grand Cherokee", 46000), ("Tucson", 31000),
+)
+LEAD_SOURCES = (
+    ("website", 34), ("walk_in", 18), ("phone", 12), ("third_party", 14), ("referral", 9),
+    ("social", 6), ("event", 4), ("service_drive", 3),
+)
+LEAD_STATUSES = (
+    ("new", 22), ("contacted", 24), ("qualified", 16), ("proposal", 9), ("negotiation", 6),
+    ("won", 12), ("lost", 11),
+)
+PRIORITIES = (("low", 30), ("medium", 50), ("high", 20))
+NOTE_TEMPLATES = (
+    "Interested in a {year} {model}. Has a trade-in and wants a payoff quote.",
+    "Asked about lease specials on the {model}. Prefers texts after 5pm.",
+    "Test drove the {model} on Saturday. Comparing financing with their credit union.",
+    "Wants a certified pre-owned {model} under {budget}. Spouse needs to see it first.",
+    "Came in through the service drive; current vehicle has high mileage. Showed the {model}.",
+    "Fleet inquiry for {count} units of the {model}. Needs a quote by month end.",
+    "Credit app submitted. Waiting on lender approval for the {model}.",
+    "Lost to a competitor on price last time. Re-engaged about the {year} {model}.",
+)
+APPOINTMENT_TITLES = ("Test drive", "Trade-in appraisal", "Finance review", "Vehicle delivery", "Follow-up visit")
+APPOINTMENT_STATUSES = (("scheduled", 45), ("completed", 35), ("cancelled", 12), ("no_show", 8))
+NOTIFICATION_KINDS = (
+    ("info", "New lead assigned", "{name} was assigned to you from {source}."),
+    ("reminder", "Appointment reminder", "{title} with {name} starts in one hour."),
+    ("success", "Deal closed", "Congratulations! {name} took delivery of a {model}."),
+    ("warning", "Lead going cold", "{name} has not been contacted in 7 days."),
+)
+GOAL_TEMPLATES = (
+    ("Monthly units", "Sell {target} vehicles this month", 12, 30),
+    ("Appointments set", "Book {target} showroom appointments", 40, 90),
+    ("Gross profit", "Reach ${target} front-end gross", 25000, 80000),
+    ("CSI score", "Keep customer satisfaction at {target}", 90, 98),
+)
+TRAINING_CATEGORIES = ("sales process", "product knowledge", "finance & insurance", "compliance", "customer experience")
+TRAINING_TOPICS = (
+    "Overcoming price objections", "Walkaround presentation", "Handling trade-in negotiations",
+    "Explaining lease vs finance", "Follow-up cadence for internet leads", "Red flags rule compliance",
+    "Phone skills for appointment setting", "Delivering a memorable delivery", "EV charging questions",
+)
+WORKSHEET_TYPES = ("deal", "trade_appraisal", "finance", "lease")
+WORKSHEET_STATUSES = (("draft", 55), ("submitted", 25), ("approved", 15), ("rejected", 5))
+
+# Column order of each table, used for COPY files and to build rows
+COLUMNS = {
+    "users": ("id", "email", "full_name", "role", "status", "created_at", "updated_at"),
+    "leads": ("id", "first_name", "last_name", "email", "phone", "company", "title", "source", "status",
+              "priority", "value", "notes", "assigned_to", "created_at", "updated_at"),
+    "appointments": ("id", "user_id", "client_name", "appointment_title", "appointment_time", "status", "notes",
+                     "created_at", "updated_at"),
+    "notifications": ("id", "user_id", "title", "message", "type", "read", "created_at"),
+    "goals": ("id", "user_id", "title", "description", "target_value", "current_value", "progress", "deadline",
+              "status", "created_at", "updated_at"),
+    "worksheets": ("id", "user_id", "title", "type", "data", "status", "last_modified", "created_at"),
+    "training_center": ("id", "title", "description", "category", "media_url", "published", "created_by",
+                        "created_at", "updated_at"),
+    "sales": ("id", "user_id", "lead_id", "vehicle", "amount", "commission", "sale_date", "created_at"),
+    "sales_leaderboard": ("user_id", "full_name", "email", "total_sales", "total_revenue", "total_commission",
+                          "avg_deal_size", "monthly_sales", "monthly_revenue", "weekly_sales", "weekly_revenue",
+                          "last_sale_date"),
+}
+
+
+class _Weighted:
+    """Weighted choice by bisecting cumulative weights (random.choices rebuilds them every call)."""
+
+    def __init__(self, pairs: Sequence[Tuple[Any, float]]):
+        self.values = [value for value, _ in pairs]
+        self.cumulative = []
+        total = 0.0
+        for _, weight in pairs:
+            total += weight
+            self.cumulative.append(total)
+        self.total = total
+
+    def pick(self, rng: random.Random):
+        return self.values[bisect.bisect_right(self.cumulative, rng.random() * self.total)]
+
+
+def row_id(seed: int, table: str, n: int) -> str:
+    """Stable UUID for row `n` of `table`, so other tables can reference it without a lookup."""
+    digest = hashlib.blake2b(f"{seed}:{table}:{n}".encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest, version=4))
+
+
+@dataclass
+class _UserTotals:
+    total_sales: int = 0
+    total_revenue: float = 0.0
+    total_commission: float = 0.0
+    monthly_sales: int = 0
+    monthly_revenue: float = 0.0
+    weekly_sales: int = 0
+    weekly_revenue: float = 0.0
+    last_sale_date: Optional[datetime] = None
+
+
+@dataclass
+class DataGenerator:
+    """Row generators for every table, sized from the lead count."""
+    leads: int = 10_000
+    users: int = 50
+    seed: int = 0
+    days: int = 730
+    as_of: datetime = field(default_factory=lambda: datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0))
+    appointments_per_lead: float = 0.3
+    sales_per_lead: float = 0.12
+    worksheets_per_lead: float = 0.15
+    notifications_per_user: int = 200
+    goals_per_user: int = 6
+    training_items: int = 150
+
+    def __post_init__(self):
+        self._totals: Dict[int, _UserTotals] = {}
+        # A few top performers carry a large share of the floor traffic
+        self._rep_picker = _Weighted([(n, 1.0 / (1 + n) ** 0.6) for n in range(self.users)])
+
+    def _rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def _timestamp(self, rng: random.Random, max_days: Optional[int] = None) -> datetime:
+        span = (max_days or self.days) * 86400
+        # Skew toward recent activity: more leads arrive as the group grows
+        offset = span * (1 - math.sqrt(rng.random()))
+        return self.as_of - timedelta(seconds=int(offset))
+
+    def user_id(self, n: int) -> str:
+        return row_id(self.seed, "users", n)
+
+    def user_email(self, n: int) -> str:
+        return f"rep{n}@phoenix-auto.example"
+
+    def user_name(self, n: int) -> str:
+        rng = random.Random(f"{self.seed}:user-name:{n}")
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    def tables(self) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """(table, rows) pairs in load order; sales_leaderboard must come after sales."""
+        yield "users", self.users_rows()
+        yield "leads", self.lead_rows()
+        yield "appointments", self.appointment_rows()
+        yield "notifications", self.notification_rows()
+        yield "goals", self.goal_rows()
+        yield "worksheets", self.worksheet_rows()
+        yield "training_center", self.training_rows()
+        yield "sales", self.sale_rows()
+        yield "sales_leaderboard", self.leaderboard_rows()
+
+    def users_rows(self) -> Iterator[Dict[str, Any]]:
+        created = (self.as_of - timedelta(days=self.days)).isoformat()
+        for n in range(self.users):
+            yield {
+                "id": self.user_id(n), "email": self.user_email(n), "full_name": self.user_name(n),
+                "role": "manager" if n % 25 == 0 else "user", "status": "active" if n % 40 else "inactive",
+                "created_at": created, "updated_at": created,
+            }
+
+    def lead_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("leads")
+        sources, statuses, priorities = _Weighted(LEAD_SOURCES), _Weighted(LEAD_STATUSES), _Weighted(PRIORITIES)
+        for n in range(self.leads):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            model, base_price = rng.choice(VEHICLES)
+            created = self._timestamp(rng)
+            fleet = rng.random() < 0.04
+            status = statuses.pick(rng)
+            updated = created + timedelta(hours=rng.randint(0, 24 * 21)) if status != "new" else created
+            note = rng.choice(NOTE_TEMPLATES).format(
+                year=self.as_of.year - rng.randint(0, 4), model=model,
+                budget=f"${int(base_price * 0.8):,}", count=rng.randint(3, 12),
+            )
+            yield {
+                "id": row_id(self.seed, "leads", n),
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first}.{last}{n}@{rng.choice(EMAIL_DOMAINS)}".lower(),
+                "phone": f"+1-{rng.randint(201, 989)}-555-{rng.randint(0, 9999):04d}",
+                "company": rng.choice(FLEET_COMPANIES) if fleet else None,
+                "title": "Fleet Manager" if fleet else None,
+                "source": sources.pick(rng),
+                "status": status,
+                "priority": priorities.pick(rng),
+                "value": round(base_price * rng.uniform(0.85, 1.25) * (rng.randint(3, 12) if fleet else 1), 2),
+                "notes": note,
+                "assigned_to": self.user_id(self._rep_picker.pick(rng)),
+                "created_at": created.isoformat(),
+                "updated_at": min(updated, self.as_of).isoformat(),
+            }
+
+    def appointment_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("appointments")
+        statuses = _Weighted(APPOINTMENT_STATUSES)
+        for n in range(int(self.leads * self.appointments_per_lead)):
+            created = self._timestamp(rng)
+            # Mostly past appointments, with the last couple of weeks of bookings still ahead
+            at = created + timedelta(days=rng.randint(0, 14), hours=rng.randint(9, 19) - created.hour)
+            status = "scheduled" if at > self.as_of else statuses.pick(rng)
+            yield {
+                "id": row_id(self.seed, "appointments", n),
+                "user_id": self.user_id(self._rep_picker.pick(rng)),
+                "client_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "appointment_title": rng.choice(APPOINTMENT_TITLES),
+                "appointment_time": at.isoformat(),
+                "status": status,
+                "notes": None if rng.random() < 0.6 else f"Bring {rng.choice(VEHICLES)[0]} keys to the front line",
+                "created_at": created.isoformat(),
+                "updated_at": created.isoformat(),
+            }
+
+    def notification_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("notifications")
+        sources = _Weighted(LEAD_SOURCES)
+        n = 0
+        for user in range(self.users):
+            for _ in range(self.notifications_per_user):
+                kind, title, template = rng.choice(NOTIFICATION_KINDS)
+                created = self._timestamp(rng, max_days=90)
+                yield {
+                    "id": row_id(self.seed, "notifications", n),
+                    "user_id": self.user_id(user),
+                    "title": title,
+                    "message": template.format(
+                        name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", source=sources.pick(rng),
+                        title=rng.choice(APPOINTMENT_TITLES), model=rng.choice(VEHICLES)[0],
+                    ),
+                    "type": kind,
+                    "read": created < self.as_of - timedelta(days=3) or rng.random() < 0.5,
+                    "created_at": created.isoformat(),
+                }
+                n += 1
+
+    def goal_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("goals")
+        n = 0
+        for user in range(self.users):
+            for _ in range(self.goals_per_user):
+                title, description, low, high = rng.choice(GOAL_TEMPLATES)
+                target = float(rng.randint(low, high))
+                current = round(target * rng.uniform(0.1, 1.2), 2)
+                created = self._timestamp(rng, max_days=120)
+                deadline = (created + timedelta(days=rng.choice((30, 60, 90)))).date()
+                progress = round(min(100.0, current / target * 100), 1)
+                status = "completed" if progress >= 100 else ("expired" if deadline < self.as_of.date() else "active")
+                yield {
+                    "id": row_id(self.seed, "goals", n),
+                    "user_id": self.user_id(user),
+                    "title": title,
+                    "description": description.format(target=int(target)),
+                    "target_value": target,
+                    "current_value": current,
+                    "progress": progress,
+                    "deadline": deadline.isoformat(),
+                    "status": status,
+                    "created_at": created.isoformat(),
+                    "updated_at": created.isoformat(),
+                }
+                n += 1
+
+    def worksheet_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("worksheets")
+        statuses = _Weighted(WORKSHEET_STATUSES)
+        for n in range(int(self.leads * self.worksheets_per_lead)):
+            model, price = rng.choice(VEHICLES)
+            kind = rng.choice(WORKSHEET_TYPES)
+            created = self._timestamp(rng)
+            sale_price = round(price * rng.uniform(0.9, 1.1), 2)
+            yield {
+                "id": row_id(self.seed, "worksheets", n),
+                "user_id": self.user_id(self._rep_picker.pick(rng)),
+                "title": f"{model} {kind.replace('_', ' ')}",
+                "type": kind,
+                "data": {
+                    "vehicle": model,
+                    "sale_price": sale_price,
+                    "trade_allowance": round(rng.uniform(0, 18000), 2) if rng.random() < 0.45 else 0,
+                    "down_payment": round(rng.uniform(0, 0.2) * sale_price, 2),
+                    "apr": round(rng.uniform(2.9, 11.9), 2),
+                    "term_months": rng.choice((36, 48, 60, 72)),
+                },
+                "status": statuses.pick(rng),
+                "last_modified": (created + timedelta(hours=rng.randint(0, 72))).isoformat(),
+                "created_at": created.isoformat(),
+            }
+
+    def training_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("training_center")
+        for n in range(self.training_items):
+            topic = rng.choice(TRAINING_TOPICS)
+            created = self._timestamp(rng)
+            yield {
+                "id": row_id(self.seed, "training_center", n),
+                "title": f"{topic} ({n + 1})",
+                "description": f"{topic}: scripts, role-play and checklists for the sales floor.",
+                "category": rng.choice(TRAINING_CATEGORIES),
+                "media_url": f"https://training.phoenix-auto.example/modules/{n + 1}" if rng.random() < 0.7 else None,
+                "published": rng.random() < 0.9,
+                "created_by": self.user_id(0),
+                "created_at": created.isoformat(),
+                "updated_at": created.isoformat(),
+            }
+
+    def sale_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("sales")
+        month_start = self.as_of.replace(day=1)
+        week_start = self.as_of - timedelta(days=self.as_of.weekday())
+        self._totals = {}
+        for n in range(int(self.leads * self.sales_per_lead)):
+            user = self._rep_picker.pick(rng)
+            model, price = rng.choice(VEHICLES)
+            amount = round(price * rng.uniform(0.9, 1.15), 2)
+            commission = round(amount * rng.uniform(0.015, 0.035), 2)
+            sold = self._timestamp(rng)
+
+            totals = self._totals.setdefault(user, _UserTotals())
+            totals.total_sales += 1
+            totals.total_revenue += amount
+            totals.total_commission += commission
+            if sold >= month_start:
+                totals.monthly_sales += 1
+                totals.monthly_revenue += amount
+            if sold >= week_start:
+                totals.weekly_sales += 1
+                totals.weekly_revenue += amount
+            if totals.last_sale_date is None or sold > totals.last_sale_date:
+                totals.last_sale_date = sold
+
+            yield {
+                "id": row_id(self.seed, "sales", n),
+                "user_id": self.user_id(user),
+                "lead_id": row_id(self.seed, "leads", rng.randrange(self.leads)) if self.leads else None,
+                "vehicle": model,
+                "amount": amount,
+                "commission": commission,
+                "sale_date": sold.isoformat(),
+                "created_at": sold.isoformat(),
+            }
+
+    def leaderboard_rows(self) -> Iterator[Dict[str, Any]]:
+        """Per-user totals of the sales generated so far (consume sale_rows first)."""
+        for user in range(self.users):
+            totals = self._totals.get(user, _UserTotals())
+            yield {
+                "user_id": self.user_id(user),
+                "full_name": self.user_name(user),
+                "email": self.user_email(user),
+                "total_sales": totals.total_sales,
+                "total_revenue": round(totals.total_revenue, 2),
+                "total_commission": round(totals.total_commission, 2),
+                "avg_deal_size": round(totals.total_revenue / totals.total_sales, 2) if totals.total_sales else 0.0,
+                "monthly_sales": totals.monthly_sales,
+                "monthly_revenue": round(totals.monthly_revenue, 2),
+                "weekly_sales": totals.weekly_sales,
+                "weekly_revenue": round(totals.weekly_revenue, 2),
+                "last_sale_date": totals.last_sale_date.isoformat() if totals.last_sale_date else None,
+            }
+
+
+def _copy_value(value) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, separators=(",", ":"))
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    text = str(value)
+    if any(c in text for c in "\\\t\n\r"):
+        text = text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    return text
+
+
+def write_copy(generator: DataGenerator, output_dir: Path, skip: Sequence[str] = ()) -> Dict[str, int]:
+    """Stream every table to `<table>.copy` plus a psql load.sql script; returns row counts."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    counts = {}
+    script = ["-- Generated by benchmarks.datagen; run with psql from this directory", "BEGIN;"]
+    for table, rows in generator.tables():
+        if table in skip:
+            # Still drain the stream: later tables (the leaderboard) depend on its side effects
+            for _ in rows:
+                pass
+            continue
+        columns = COLUMNS[table]
+        count = 0
+        with open(output_dir / f"{table}.copy", "w", encoding="utf-8", newline="\n") as out:
+            for row in rows:
+                out.write("\t".join(_copy_value(row[column]) for column in columns))
+                out.write("\n")
+                count += 1
+        counts[table] = count
+        script.append(f"\\copy {table} ({', '.join(columns)}) FROM '{table}.copy'")
+    script.append("COMMIT;")
+    (output_dir / "load.sql").write_text("\n".join(script) + "\n", encoding="utf-8")
+    return counts
+
+
+def load_fake(generator: DataGenerator, fake, password: str = "phoenix") -> Dict[str, int]:
+    """Stream every table into a FakeSupabase and register each user for auth with `password`."""
+    counts = {}
+    for table, rows in generator.tables():
+        counts[table] = fake.seed(table, rows)
+    for n in range(generator.users):
+        fake.auth.add_user(generator.user_email(n), password, generator.user_name(n), user_id=generator.user_id(n))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate deterministic Phoenix CRM data as COPY files")
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=100, help="Sales people across the dealership group")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days", type=int, default=730, help="History length in days")
+    parser.add_argument("--as-of", type=lambda v: datetime.fromisoformat(v).replace(tzinfo=timezone.utc),
+                        help="Date the history ends (default: today); fix it for byte-identical output")
+    parser.add_argument("--skip", type=lambda v: v.split(","), default=[],
+                        help="Tables not to write, e.g. sales_leaderboard when it is a database view")
+    parser.add_argument("--output-dir", type=Path, required=True)
+    args = parser.parse_args()
+
+    generator = DataGenerator(leads=args.leads, users=args.users, seed=args.seed, days=args.days)
+    if args.as_of:
+        generator.as_of = args.as_of
+    counts = write_copy(generator, args.output_dir, args.skip)
+    for table, count in counts.items():
+        print(f"{table:<20} {count:>12,} rows")
+    print(f"Load with: cd {args.output_dir} && psql \"$DATABASE_URL\" -f load.sql")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,13 @@
 Database connection and Supabase client
 """
 import os
+import time
+import hashlib
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from backend.metrics import registry
+from backend.tracing import start_span
+from backend.resilience import resilient_call
 
 # Load environment variables
 load_dotenv()
@@ -12,21 +17,169 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+# Run against the in-memory fake instead of a Supabase project (local dev and load tests)
+SUPABASE_FAKE = os.getenv("SUPABASE_FAKE", "").lower() in ("1", "true", "yes")
+SUPABASE_FAKE_LATENCY_MS = float(os.getenv("SUPABASE_FAKE_LATENCY_MS", "0"))
+SUPABASE_FAKE_JITTER_MS = float(os.getenv("SUPABASE_FAKE_JITTER_MS", "0"))
+SUPABASE_FAKE_FAILURE_RATE = float(os.getenv("SUPABASE_FAKE_FAILURE_RATE", "0"))
+
+# How long a token verified before an auth outage keeps being accepted during it
+AUTH_STALE_MAX_AGE = float(os.getenv("AUTH_STALE_MAX_AGE", "300"))
+
 # Global Supabase client
 _supabase_client = None
 
+upstream_duration = registry.histogram(
+    "phoenix_upstream_request_duration_seconds",
+    "Data client call latency by table and operation",
+    ["client", "table", "operation"],
+)
+upstream_errors = registry.counter(
+    "phoenix_upstream_errors_total",
+    "Data client calls that raised, by table and operation",
+    ["client", "table", "operation"],
+)
+
+# Query builder methods that decide what kind of call execute() makes
+_OPERATIONS = {"select", "insert", "update", "upsert", "delete"}
+
+
+def _timed(client_name: str, table: str, operation: str, call, *args, **kwargs):
+    """Run one upstream call in a client span and record its latency and failures."""
+    start = time.perf_counter()
+    try:
+        with start_span(f"{client_name} {operation} {table}", kind="client", **{
+            "db.system": client_name, "db.collection.name": table, "db.operation.name": operation,
+        }):
+            return call(*args, **kwargs)
+    except Exception:
+        upstream_errors.inc(client=client_name, table=table, operation=operation)
+        raise
+    finally:
+        upstream_duration.observe(
+            time.perf_counter() - start, client=client_name, table=table, operation=operation
+        )
+
+
+class _InstrumentedQuery:
+    """Wraps a query builder so chained calls stay wrapped and execute() is timed.
+
+    The chain of builder calls is kept as the query's identity for the
+    stale-response cache; selects are retried and may fall back to it.
+    """
+
+    def __init__(self, builder, client_name: str, table: str, operation: str = "select", chain: tuple = ()):
+        self._builder = builder
+        self._client_name = client_name
+        self._table = table
+        self._operation = operation
+        self._chain = chain
+
+    def execute(self):
+        idempotent = self._operation == "select"
+        return resilient_call(
+            self._client_name, self._table,
+            lambda: _timed(self._client_name, self._table, self._operation, self._builder.execute),
+            idempotent=idempotent,
+            cache_key=(self._client_name, self._table, self._chain) if idempotent else None,
+        )
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+        operation = name if name in _OPERATIONS else self._operation
+
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if hasattr(result, "execute"):
+                return _InstrumentedQuery(result, self._client_name, self._table, operation,
+                                          self._chain + (repr((name, args, kwargs)),))
+            return result
+        return chained
+
+
+class _InstrumentedAuth:
+    """Times auth calls such as get_user and sign_in_with_password.
+
+    Auth shares one breaker. get_user is retried, and while auth is down a
+    token verified in the last AUTH_STALE_MAX_AGE seconds is still accepted,
+    so cached data can be served to users who were already signed in.
+    """
+
+    def __init__(self, auth, client_name: str):
+        self._auth = auth
+        self._client_name = client_name
+
+    def __getattr__(self, name):
+        attr = getattr(self._auth, name)
+        if not callable(attr):
+            return attr
+
+        def timed(*args, **kwargs):
+            cache_key = None
+            if name == "get_user":
+                # Keyed by a digest so raw tokens are not kept around
+                cache_key = (self._client_name, "auth", name,
+                             hashlib.sha256(repr((args, kwargs)).encode()).hexdigest())
+            return resilient_call(
+                self._client_name, "auth",
+                lambda: _timed(self._client_name, "auth", name, attr, *args, **kwargs),
+                idempotent=name == "get_user", cache_key=cache_key, max_stale=AUTH_STALE_MAX_AGE,
+            )
+        return timed
+
+
+class InstrumentedClient:
+    """Data client wrapper labelling every upstream call with its table and operation."""
+
+    def __init__(self, client, client_name: str = "supabase"):
+        self._client = client
+        self._client_name = client_name
+        self.auth = _InstrumentedAuth(client.auth, client_name)
+
+    def table(self, name: str):
+        return _InstrumentedQuery(self._client.table(name), self._client_name, name)
+
+    def from_(self, name: str):
+        return self.table(name)
+
+    def rpc(self, fn: str, params=None, *args, **kwargs):
+        builder = self._client.rpc(fn, params or {}, *args, **kwargs)
+        return _InstrumentedQuery(builder, self._client_name, f"rpc:{fn}", "rpc")
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
 
 def get_supabase_client() -> Client:
     """Get or create Supabase client singleton."""
     global _supabase_client
-    
+
     if _supabase_client is None:
+        if SUPABASE_FAKE:
+            from backend.fake_supabase import FakeSupabase
+            _supabase_client = InstrumentedClient(
+                FakeSupabase(SUPABASE_FAKE_LATENCY_MS / 1000, SUPABASE_FAKE_JITTER_MS / 1000,
+                             failure_rate=SUPABASE_FAKE_FAILURE_RATE), "fake"
+            )
+            return _supabase_client
         if not SUPABASE_URL or not SUPABASE_KEY:
             raise ValueError(
                 "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
             )
-        _supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    
+        _supabase_client = InstrumentedClient(create_client(SUPABASE_URL, SUPABASE_KEY))
+
+    return _supabase_client
+
+
+def set_supabase_client(client, client_name: str = "fake"):
+    """Install `client` (e.g. a seeded FakeSupabase) as the shared client.
+
+    Call before the first request; services cache the client on first use.
+    """
+    global _supabase_client
+    _supabase_client = InstrumentedClient(client, client_name)
     return _supabase_client
 
 
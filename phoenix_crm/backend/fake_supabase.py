@@ -0,0 +1,480 @@
+"""
+In-process stand-in for the Supabase client
+
+Implements the subset of the client this codebase uses - table queries
+(select/insert/update/upsert/delete with eq-style filters, order, limit,
+single), rpc() and the auth calls - against in-memory tables, so the API can
+run and be load-tested without a Supabase project.
+
+Rows live in a dict keyed by primary key. Equality filters build a hash index
+on first use and keep it up to date on writes, so repeated lookups such as
+eq("assigned_to", user_id) do not scan the table. Every execute() can sleep
+for a configurable latency (plus jitter) to simulate the network round trip,
+and fail with a ConnectionError at a configurable rate to simulate outages.
+"""
+import heapq
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from postgrest.exceptions import APIError
+
+
+class FakeAuthError(Exception):
+    """Raised by FakeAuth for bad credentials or tokens, like the real auth client."""
+
+
+@dataclass
+class FakeResponse:
+    data: Any
+    count: Optional[int] = None
+
+
+@dataclass
+class FakeUser:
+    id: str
+    email: str
+    user_metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FakeSession:
+    access_token: str
+    token_type: str = "bearer"
+
+
+@dataclass
+class FakeAuthResponse:
+    user: Optional[FakeUser]
+    session: Optional[FakeSession] = None
+
+
+class FakeTable:
+    """Rows keyed by primary key with lazily built equality indexes."""
+
+    def __init__(self, name: str, primary_key: str = "id"):
+        self.name = name
+        self.primary_key = primary_key
+        self.rows: Dict[Any, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[Any]]] = {}
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def index(self, column: str) -> Dict[Any, Set[Any]]:
+        """Hash index for `column`, built on first use."""
+        existing = self._indexes.get(column)
+        if existing is not None:
+            return existing
+        built: Dict[Any, Set[Any]] = {}
+        for key, row in self.rows.items():
+            built.setdefault(_hashable(row.get(column)), set()).add(key)
+        self._indexes[column] = built
+        return built
+
+    def _index_row(self, key, row: Dict[str, Any]):
+        for column, entries in self._indexes.items():
+            entries.setdefault(_hashable(row.get(column)), set()).add(key)
+
+    def _unindex_row(self, key, row: Dict[str, Any]):
+        for column, entries in self._indexes.items():
+            bucket = entries.get(_hashable(row.get(column)))
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del entries[_hashable(row.get(column))]
+
+    def put(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace a row, assigning a UUID primary key if it has none."""
+        row = dict(row)
+        if row.get(self.primary_key) is None:
+            row[self.primary_key] = str(uuid.uuid4())
+        key = row[self.primary_key]
+        previous = self.rows.get(key)
+        if previous is not None:
+            self._unindex_row(key, previous)
+        self.rows[key] = row
+        self._index_row(key, row)
+        return row
+
+    def put_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Bulk insert without copying the stored rows back out; returns the number written."""
+        written = 0
+        with self.lock:
+            for row in rows:
+                self.put(row)
+                written += 1
+        return written
+
+    def remove(self, key) -> Optional[Dict[str, Any]]:
+        row = self.rows.pop(key, None)
+        if row is not None:
+            self._unindex_row(key, row)
+        return row
+
+
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "neq": lambda a, b: a != b,
+    "gt": lambda a, b: a is not None and a > b,
+    "gte": lambda a, b: a is not None and a >= b,
+    "lt": lambda a, b: a is not None and a < b,
+    "lte": lambda a, b: a is not None and a <= b,
+    "in": lambda a, b: a in b,
+    "is": lambda a, b: a is b,
+}
+
+
+class FakeQuery:
+    """Chainable query builder mirroring the postgrest request builder."""
+
+    def __init__(self, client: "FakeSupabase", table: FakeTable):
+        self._client = client
+        self._table = table
+        self._operation = "select"
+        self._columns: Optional[List[str]] = None
+        self._count: Optional[str] = None
+        self._payload: Any = None
+        self._filters: List[Tuple[str, str, Any]] = []
+        self._order: List[Tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+        self._offset = 0
+        self._single = False
+        self._maybe_single = False
+
+    # Operations
+
+    def select(self, *columns: str, count: Optional[str] = None) -> "FakeQuery":
+        self._operation = "select"
+        names = [c.strip() for spec in columns for c in spec.split(",") if c.strip()]
+        self._columns = None if not names or "*" in names else names
+        self._count = count
+        return self
+
+    def insert(self, rows, **kwargs) -> "FakeQuery":
+        self._operation = "insert"
+        self._payload = rows
+        return self
+
+    def upsert(self, rows, **kwargs) -> "FakeQuery":
+        self._operation = "upsert"
+        self._payload = rows
+        return self
+
+    def update(self, values: Dict[str, Any], **kwargs) -> "FakeQuery":
+        self._operation = "update"
+        self._payload = values
+        return self
+
+    def delete(self, **kwargs) -> "FakeQuery":
+        self._operation = "delete"
+        return self
+
+    # Filters and modifiers
+
+    def _filter(self, op: str, column: str, value) -> "FakeQuery":
+        self._filters.append((op, column, value))
+        return self
+
+    def eq(self, column: str, value) -> "FakeQuery":
+        return self._filter("eq", column, value)
+
+    def neq(self, column: str, value) -> "FakeQuery":
+        return self._filter("neq", column, value)
+
+    def gt(self, column: str, value) -> "FakeQuery":
+        return self._filter("gt", column, value)
+
+    def gte(self, column: str, value) -> "FakeQuery":
+        return self._filter("gte", column, value)
+
+    def lt(self, column: str, value) -> "FakeQuery":
+        return self._filter("lt", column, value)
+
+    def lte(self, column: str, value) -> "FakeQuery":
+        return self._filter("lte", column, value)
+
+    def in_(self, column: str, values) -> "FakeQuery":
+        return self._filter("in", column, set(values))
+
+    def is_(self, column: str, value) -> "FakeQuery":
+        return self._filter("is", column, None if value in (None, "null") else value)
+
+    def match(self, query: Dict[str, Any]) -> "FakeQuery":
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+
+    def order(self, column: str, desc: bool = False, **kwargs) -> "FakeQuery":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int, **kwargs) -> "FakeQuery":
+        self._limit = size
+        return self
+
+    def offset(self, size: int) -> "FakeQuery":
+        self._offset = size
+        return self
+
+    def range(self, start: int, end: int, **kwargs) -> "FakeQuery":
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def single(self) -> "FakeQuery":
+        self._single = True
+        return self
+
+    def maybe_single(self) -> "FakeQuery":
+        self._maybe_single = True
+        return self
+
+    # Execution
+
+    def execute(self) -> FakeResponse:
+        self._client.simulate_latency()
+        with self._table.lock:
+            if self._operation == "select":
+                return self._execute_select()
+            if self._operation in ("insert", "upsert"):
+                return self._execute_insert()
+            if self._operation == "update":
+                return self._execute_update()
+            return self._execute_delete()
+
+    def _matching_keys(self) -> List[Any]:
+        table = self._table
+        equalities = [(column, value) for op, column, value in self._filters if op == "eq"]
+        if equalities:
+            # Start from the smallest index bucket and check the remaining filters per row
+            buckets = [table.index(column).get(_hashable(value), ()) for column, value in equalities]
+            candidates: Iterable[Any] = min(buckets, key=len)
+        else:
+            candidates = table.rows.keys()
+        rows = table.rows
+        return [
+            key for key in candidates
+            if all(_COMPARATORS[op](rows[key].get(column), value) for op, column, value in self._filters)
+        ]
+
+    def _sort_key(self, column: str):
+        rows = self._table.rows
+        # NULLs sort as the largest value: last ascending and first descending, as in Postgres
+        return lambda key: (rows[key].get(column) is None, rows[key].get(column))
+
+    def _sorted(self, keys: List[Any]) -> List[Any]:
+        end = self._offset + self._limit if self._limit is not None else None
+        if not self._order:
+            return keys[self._offset:end]
+
+        if len(self._order) == 1 and end is not None:
+            # Top-k selection instead of a full sort for order().limit() queries
+            column, desc = self._order[0]
+            pick = heapq.nlargest if desc else heapq.nsmallest
+            return pick(end, keys, key=self._sort_key(column))[self._offset:]
+
+        ordered = list(keys)
+        for column, desc in reversed(self._order):
+            ordered.sort(key=self._sort_key(column), reverse=desc)
+        return ordered[self._offset:end]
+
+    def _project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        if self._columns is None:
+            return dict(row)
+        return {column: row.get(column) for column in self._columns}
+
+    def _result(self, rows: List[Dict[str, Any]], count: Optional[int] = None) -> FakeResponse:
+        if self._single or self._maybe_single:
+            if len(rows) == 1:
+                return FakeResponse(data=rows[0], count=count)
+            if self._maybe_single and not rows:
+                return FakeResponse(data=None, count=count)
+            raise APIError({
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "details": f"The result contains {len(rows)} rows",
+                "hint": None,
+            })
+        return FakeResponse(data=rows, count=count)
+
+    def _execute_select(self) -> FakeResponse:
+        keys = self._matching_keys()
+        count = len(keys) if self._count else None
+        rows = self._table.rows
+        return self._result([self._project(rows[k]) for k in self._sorted(keys)], count)
+
+    def _execute_insert(self) -> FakeResponse:
+        payload = self._payload if isinstance(self._payload, list) else [self._payload]
+        table = self._table
+        written = []
+        for row in payload:
+            key = row.get(table.primary_key)
+            if self._operation == "insert" and key is not None and key in table.rows:
+                raise APIError({
+                    "message": f'duplicate key value violates unique constraint "{table.name}_pkey"',
+                    "code": "23505",
+                    "details": None,
+                    "hint": None,
+                })
+            if self._operation == "upsert" and key in table.rows:
+                row = {**table.rows[key], **row}
+            written.append(dict(table.put(row)))
+        return self._result(written)
+
+    def _execute_update(self) -> FakeResponse:
+        table = self._table
+        updated = []
+        for key in self._matching_keys():
+            updated.append(dict(table.put({**table.rows[key], **self._payload})))
+        return self._result(updated)
+
+    def _execute_delete(self) -> FakeResponse:
+        table = self._table
+        removed = [table.remove(key) for key in self._matching_keys()]
+        return self._result([row for row in removed if row is not None])
+
+
+class FakeRPC:
+    def __init__(self, client: "FakeSupabase", fn: Callable[..., Any], params: Dict[str, Any]):
+        self._client = client
+        self._fn = fn
+        self._params = params
+
+    def execute(self) -> FakeResponse:
+        self._client.simulate_latency()
+        return FakeResponse(data=self._fn(self._client, **self._params))
+
+
+class FakeAuth:
+    """Email/password users and opaque bearer tokens."""
+
+    def __init__(self, client: "FakeSupabase"):
+        self._client = client
+        self._users: Dict[str, Tuple[FakeUser, str]] = {}
+        self._tokens: Dict[str, FakeUser] = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+            self._tokens.clear()
+
+    def add_user(self, email: str, password: str, full_name: str = "", user_id: Optional[str] = None) -> FakeUser:
+        user = FakeUser(id=user_id or str(uuid.uuid4()), email=email, user_metadata={"full_name": full_name})
+        with self._lock:
+            self._users[email.lower()] = (user, password)
+        return user
+
+    def issue_token(self, user: FakeUser) -> str:
+        """Mint a token for `user` directly, skipping the password check."""
+        token = f"fake-{uuid.uuid4().hex}"
+        with self._lock:
+            self._tokens[token] = user
+        return token
+
+    def sign_up(self, credentials: Dict[str, Any]) -> FakeAuthResponse:
+        self._client.simulate_latency()
+        email = credentials["email"]
+        if email.lower() in self._users:
+            raise FakeAuthError("User already registered")
+        full_name = credentials.get("options", {}).get("data", {}).get("full_name", "")
+        user = self.add_user(email, credentials["password"], full_name)
+        return FakeAuthResponse(user=user, session=FakeSession(self.issue_token(user)))
+
+    def sign_in_with_password(self, credentials: Dict[str, Any]) -> FakeAuthResponse:
+        self._client.simulate_latency()
+        entry = self._users.get(credentials["email"].lower())
+        if entry is None or entry[1] != credentials["password"]:
+            raise FakeAuthError("Invalid login credentials")
+        user = entry[0]
+        return FakeAuthResponse(user=user, session=FakeSession(self.issue_token(user)))
+
+    def get_user(self, jwt: Optional[str] = None) -> FakeAuthResponse:
+        self._client.simulate_latency()
+        user = self._tokens.get(jwt)
+        if user is None:
+            raise FakeAuthError("Invalid JWT")
+        return FakeAuthResponse(user=user)
+
+    def sign_out(self, *args, **kwargs):
+        # The real client only clears its own stored session; tokens stay valid until expiry
+        return None
+
+
+class FakeSupabase:
+    """Drop-in replacement for supabase.Client backed by in-memory tables.
+
+    `latency` and `jitter` are in seconds; each execute() and auth call
+    sleeps for latency + uniform(0, jitter), then raises ConnectionError with
+    probability `failure_rate`.
+    """
+
+    # Tables whose primary key is not "id"
+    PRIMARY_KEYS = {"sales_leaderboard": "user_id"}
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: Optional[int] = None,
+                 failure_rate: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self.tables: Dict[str, FakeTable] = {}
+        self._tables_lock = threading.Lock()
+        self._functions: Dict[str, Callable[..., Any]] = {"refresh_leaderboard": lambda client: None}
+        self.auth = FakeAuth(self)
+
+    def simulate_latency(self):
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise ConnectionError("simulated upstream failure")
+
+    def get_table(self, name: str) -> FakeTable:
+        table = self.tables.get(name)
+        if table is None:
+            with self._tables_lock:
+                table = self.tables.setdefault(name, FakeTable(name, self.PRIMARY_KEYS.get(name, "id")))
+        return table
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, self.get_table(name))
+
+    def from_(self, name: str) -> FakeQuery:
+        return self.table(name)
+
+    def register_rpc(self, name: str, fn: Callable[..., Any]):
+        """Register fn(client, **params) as a database function."""
+        self._functions[name] = fn
+
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None, *args, **kwargs) -> FakeRPC:
+        if fn not in self._functions:
+            raise APIError({
+                "message": f"Could not find the function public.{fn} in the schema cache",
+                "code": "PGRST202",
+                "details": None,
+                "hint": None,
+            })
+        return FakeRPC(self, self._functions[fn], params or {})
+
+    def clear(self):
+        """Drop every table and auth user, keeping registered functions."""
+        with self._tables_lock:
+            self.tables = {}
+        self.auth.clear()
+
+    def seed(self, table: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Bulk-load rows into `table`, bypassing simulated latency."""
+        return self.get_table(table).put_many(rows)
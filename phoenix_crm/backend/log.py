@@ -0,0 +1,162 @@
+"""
+Structured JSON logging for the Phoenix CRM API
+
+Records are handed to a queue on the request path and rendered and written by
+a background listener thread, so logging never blocks a request on stdout.
+
+Configuration (environment):
+    LOG_LEVEL               root level, default INFO
+    LOG_LEVELS              per-logger overrides by module name, e.g.
+                            "backend.api.leads=DEBUG,backend.routers=INFO,services=WARNING"
+    LOG_DEBUG_SAMPLE_RATE   fraction of DEBUG records kept, default 1.0
+"""
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from backend.tracing import current_span
+
+# Correlation ID for the request being handled; copied into worker threads by run_in_threadpool
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is emitted as a field
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id", "trace_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each record with the current request ID and trace ID."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        span = current_span()
+        record.trace_id = span.trace_id if span is not None else None
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep only a fraction of records below INFO so hot-path debug lines stay cheap."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.INFO or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with timestamp, level, logger, message, request ID and extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps extra fields for the listener to render.
+
+    The stock handler formats the message into a plain string before queueing;
+    here only the parts that cannot cross threads (args, exc_info) are resolved.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """Parse "module=LEVEL,other=LEVEL" into logger levels, ignoring malformed entries."""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.partition("=")
+        if not sep or not name.strip():
+            continue
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+    return levels
+
+
+def configure_logging(level: Optional[str] = None, stream=None):
+    """Install the JSON queue handler on the root logger; safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(DebugSamplingFilter(float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))))
+    queue_handler.addFilter(RequestIdFilter())
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel((level or os.getenv("LOG_LEVEL", "INFO")).upper())
+    for name, module_level in parse_levels(os.getenv("LOG_LEVELS", "")).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def _pause_listener():
+    # Write out everything queued and park the listener thread, so a fork never
+    # copies queued records or an output lock held mid-write into the child
+    if _listener is not None:
+        _listener.stop()
+
+
+def _resume_listener():
+    if _listener is not None:
+        _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_pause_listener, after_in_parent=_resume_listener,
+                        after_in_child=_resume_listener)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -3,8 +3,10 @@ from dotenv import load_dotenv
 # Load environment variables FIRST, before any other imports
 load_dotenv()
 
-from fastapi import FastAPI
+import logging
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 import sys
 from pathlib import Path
 
@@ -14,12 +16,23 @@ if str(root_dir) not in sys.path:
     sys.path.insert(0, str(root_dir))
 
 # Import from backend.api (your existing structure)
-from backend.api import auth, leads
+from backend.api import auth, leads, ai
 
 # Import new routers from backend.routers
-from backend.routers import appointments, goals, notifications, worksheets, training, leaderboard
+from backend.routers import appointments, goals, notifications, worksheets, training, leaderboard, search, profiles
+from backend.middleware.metrics import MetricsMiddleware, track_in_flight
+from backend.middleware.request_id import RequestIdMiddleware
+from backend.middleware.profiling import ProfilingMiddleware
+from backend.middleware.ratelimit import RateLimitMiddleware
+from backend.middleware.resilience import ResilienceMiddleware
+from backend.middleware.tracing import TracingMiddleware
+from backend.log import configure_logging
+from backend.metrics import registry, PROMETHEUS_CONTENT_TYPE
 
-app = FastAPI(title="Phoenix CRM API", version="1.0.0")
+configure_logging()
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Phoenix CRM API", version="1.0.0", dependencies=[Depends(track_in_flight)])
 
 # CORS middleware
 app.add_middleware(
@@ -30,6 +43,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Stale-data header and 503 for open circuit breakers
+app.add_middleware(ResilienceMiddleware)
+
+# Sampling profiler for requests with X-Debug-Profile or matching PROFILE_SAMPLE_RATE
+app.add_middleware(ProfilingMiddleware)
+
+# Per-caller token buckets and per-upstream caps; inside metrics so 429s are counted
+app.add_middleware(RateLimitMiddleware)
+
+# Request count, latency and status per route template
+app.add_middleware(MetricsMiddleware)
+
+# Server span per request, continuing the caller's traceparent
+app.add_middleware(TracingMiddleware)
+
+# Outermost, so every log line for a request carries its ID
+app.add_middleware(RequestIdMiddleware)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(leads.router)  # Remove the prefix here since it's in the router now
@@ -39,6 +70,10 @@ app.include_router(notifications.router)
 app.include_router(worksheets.router)
 app.include_router(training.router)
 app.include_router(leaderboard.router)
+app.include_router(search.router)
+app.include_router(profiles.router)
+# The AI routes expose the local model and its prompt/latency data, so they need a signed-in user too
+app.include_router(ai.router, prefix="/api/ai", tags=["ai"], dependencies=[Depends(auth.get_current_user)])
 
 @app.get("/")
 async def root():
@@ -54,7 +89,9 @@ async def root():
             "notifications": "/api/notifications",
             "worksheets": "/api/worksheets",
             "training": "/api/training",
-            "leaderboard": "/api/leaderboard"
+            "leaderboard": "/api/leaderboard",
+            "search": "/api/search",
+            "ai": "/api/ai"
         }
     }
 
@@ -62,18 +99,12 @@ async def root():
 async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """All request, upstream and AI metrics in Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 if __name__ == "__main__":
-    import uvicorn
-    print("=" * 50)
-    print("🔥 Phoenix CRM API Server")
-    print("=" * 50)
-    print("Server starting on: http://0.0.0.0:8000")
-    print("API Documentation: http://0.0.0.0:8000/docs")
-    print("=" * 50)
-    uvicorn.run(
-        "backend.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+    # Production by default; pass --reload for the development file watcher
+    from backend.server import main
+    main()
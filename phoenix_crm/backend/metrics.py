@@ -0,0 +1,382 @@
+"""
+In-process metrics registry rendered in Prometheus text format
+
+Under a multi-process server every worker has its own registry. When the
+server shares a directory with the workers (METRICS_MULTIPROC_DIR, set up by
+server.py), each worker writes a snapshot of its registry there every
+METRICS_SYNC_INTERVAL seconds and /metrics renders the sum over all workers,
+whichever worker serves the scrape. Counters and histograms of workers that
+have exited are folded into an archive file, so totals never go backwards
+when a worker is recycled; gauges only count live workers.
+
+Configuration (environment):
+    METRICS_MULTIPROC_DIR    shared snapshot directory, read by server.py
+    METRICS_SYNC_INTERVAL    seconds between snapshots, default 5
+"""
+import os
+import copy
+import glob
+import json
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no fork, so there is only one worker
+    fcntl = None
+
+METRICS_SYNC_INTERVAL = float(os.getenv("METRICS_SYNC_INTERVAL", "5"))
+
+# A snapshot not rewritten for this many sync intervals belongs to a worker that is gone
+_STALE_INTERVALS = 10
+
+# Latency buckets in seconds, from cache hits up to slow model generations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def _blank(self) -> "_Metric":
+        """Same metric without values, to merge worker snapshots into."""
+        blank = copy.copy(self)
+        blank._lock = threading.Lock()
+        blank._values = {}
+        return blank
+
+    def _dump(self) -> List[Any]:
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+    def _merge(self, entries: List[Any], live: bool):
+        """Add another worker's dumped values; `live` is False for workers that have exited."""
+        for key, value in entries:
+            key = tuple(key)
+            self._values[key] = self._values.get(key, 0.0) + value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down.
+
+    Across workers the values of live workers are summed, or with
+    multiprocess_mode="max" the largest is reported.
+    """
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), multiprocess_mode: str = "sum"):
+        super().__init__(name, help_text, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+    def _merge(self, entries: List[Any], live: bool):
+        if not live:
+            return
+        if self.multiprocess_mode != "max":
+            super()._merge(entries, live)
+            return
+        for key, value in entries:
+            key = tuple(key)
+            self._values[key] = max(self._values.get(key, value), value)
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution with sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def _dump(self) -> List[Any]:
+        with self._lock:
+            return [[list(key), list(counts), total[0]] for key, (counts, total) in self._values.items()]
+
+    def _merge(self, entries: List[Any], live: bool):
+        for key, counts, total in entries:
+            merged, merged_total = self._values.setdefault(tuple(key), ([0] * (len(self.buckets) + 1), [0.0]))
+            for index, count in enumerate(counts):
+                merged[index] += count
+            merged_total[0] += total
+
+
+class Registry:
+    """Named collection of metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._shared: Optional["SharedMetrics"] = None
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # Modules can be imported under two package roots; reuse the first metric
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = (), multiprocess_mode: str = "sum") -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames, multiprocess_mode))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self, prefix: str = "") -> str:
+        """Prometheus text exposition of every metric whose name starts with `prefix`.
+
+        Once share() was called this covers every worker sharing the directory.
+        """
+        if self._shared is not None:
+            return self._shared.render(prefix)
+        return self._render(prefix)
+
+    def _render(self, prefix: str) -> str:
+        with self._lock:
+            metrics = [m for name, m in sorted(self._metrics.items()) if name.startswith(prefix)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, List[Any]]:
+        """Every metric's values in a JSON-serialisable form."""
+        with self._lock:
+            metrics = list(self._metrics.items())
+        return {name: metric._dump() for name, metric in metrics}
+
+    def merged(self, snapshots: List[Tuple[Dict[str, List[Any]], bool]]) -> "Registry":
+        """A registry holding the sum of (snapshot, live) pairs, for metrics this registry defines."""
+        merged = Registry()
+        with self._lock:
+            merged._metrics = {name: metric._blank() for name, metric in self._metrics.items()}
+        for snapshot, live in snapshots:
+            for name, entries in snapshot.items():
+                metric = merged._metrics.get(name)
+                if metric is not None:
+                    metric._merge(entries, live)
+        return merged
+
+    def share(self, path: str, interval: float = METRICS_SYNC_INTERVAL):
+        """Publish this worker's metrics to `path` and render the totals of every worker there."""
+        if self._shared is None:
+            self._shared = SharedMetrics(self, path, interval)
+            self._shared.start()
+
+    def flush(self):
+        """Write this worker's final snapshot; call before a worker exits."""
+        if self._shared is not None:
+            self._shared.write()
+
+
+class SharedMetrics:
+    """Per-worker registry snapshots in a directory shared by the workers of one server."""
+
+    ARCHIVE = "archive.json"
+
+    def __init__(self, registry: Registry, path: str, interval: float = METRICS_SYNC_INTERVAL):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        # Start time in the name: a recycled worker that reuses a pid must not overwrite its predecessor's totals
+        self.file = os.path.join(path, f"worker-{os.getpid()}-{time.time_ns()}.json")
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def reset(path: str):
+        """Create `path` and remove snapshots left by an earlier server run."""
+        os.makedirs(path, exist_ok=True)
+        for name in glob.glob(os.path.join(path, "*.json")):
+            os.unlink(name)
+
+    def start(self):
+        self.write()
+        threading.Thread(target=self._run, name="metrics-sync", daemon=True).start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.write()
+            except OSError:
+                pass
+
+    def write(self):
+        data = json.dumps(self.registry.snapshot())
+        with self._write_lock:
+            temp = f"{self.file}.tmp"
+            with open(temp, "w") as handle:
+                handle.write(data)
+            os.replace(temp, self.file)
+
+    def render(self, prefix: str = "") -> str:
+        self.write()
+        with self._locked():
+            snapshots = [(self._read(os.path.join(self.path, self.ARCHIVE)), False)]
+            for name in glob.glob(os.path.join(self.path, "worker-*.json")):
+                snapshot = self._read(name)
+                if name != self.file and self._exited(name):
+                    self._archive(snapshots[0][0], snapshot)
+                    os.unlink(name)
+                    continue
+                snapshots.append((snapshot, True))
+        return self.registry.merged(snapshots)._render(prefix)
+
+    def _exited(self, name: str) -> bool:
+        pid = int(os.path.basename(name).split("-")[1])
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        try:
+            return time.time() - os.path.getmtime(name) > self.interval * _STALE_INTERVALS
+        except OSError:
+            return True
+
+    def _archive(self, archive: Dict[str, List[Any]], snapshot: Dict[str, List[Any]]):
+        """Fold an exited worker's counters and histograms into the archive file."""
+        merged = self.registry.merged([(archive, False), (snapshot, False)]).snapshot()
+        archive.clear()
+        archive.update({name: entries for name, entries in merged.items() if entries})
+        temp = os.path.join(self.path, f"{self.ARCHIVE}.tmp")
+        with open(temp, "w") as handle:
+            json.dump(archive, handle)
+        os.replace(temp, os.path.join(self.path, self.ARCHIVE))
+
+    @staticmethod
+    def _read(name: str) -> Dict[str, List[Any]]:
+        try:
+            with open(name) as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive across workers, so one at a time archives exited workers' snapshots."""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.path, ".lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+registry = Registry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
@@ -0,0 +1,66 @@
+"""
+Request metrics middleware - counts, latency histograms and in-flight gauges per route
+"""
+import time
+from fastapi import Request
+from backend.metrics import registry
+
+http_requests = registry.counter(
+    "phoenix_http_requests_total", "HTTP requests by route template and status", ["method", "route", "status"])
+http_duration = registry.histogram(
+    "phoenix_http_request_duration_seconds", "HTTP request latency by route template", ["method", "route"])
+http_in_flight = registry.gauge(
+    "phoenix_http_requests_in_flight", "HTTP requests currently being handled by route template", ["method", "route"])
+
+# Label for requests that matched no route, so 404 scans cannot explode label cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope) -> str:
+    """The matched route's path template, e.g. /api/leads/{lead_id}."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Record request count and latency for every HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router fills in scope["route"] while handling, so read it afterwards
+            route = route_template(scope)
+            method = scope["method"]
+            http_requests.inc(method=method, route=route, status=str(status["code"]))
+            http_duration.observe(time.perf_counter() - start, method=method, route=route)
+
+
+async def track_in_flight(request: Request):
+    """App-wide dependency bracketing each endpoint call with the in-flight gauge.
+
+    A dependency runs after routing, so unlike the middleware it already
+    knows the route template when the request starts.
+    """
+    method = request.method
+    route = route_template(request.scope)
+    http_in_flight.inc(method=method, route=route)
+    try:
+        yield
+    finally:
+        http_in_flight.dec(method=method, route=route)
@@ -0,0 +1,75 @@
+"""
+Profiling middleware - captures a speedscope profile for selected requests
+
+A request is profiled when it carries X-Debug-Profile with the value of
+PROFILE_TOKEN, or when it falls under the sampling rule: a PROFILE_SAMPLE_RATE
+fraction of requests whose path starts with one of PROFILE_ROUTES (all paths
+if unset). The profile ID is returned in the X-Profile-Id response header.
+"""
+import os
+import hmac
+import random
+import threading
+from datetime import datetime, timezone
+from starlette.concurrency import run_in_threadpool
+from backend.log import request_id_var
+from backend.middleware.metrics import route_template
+from backend.profiling import StackSampler, save_profile
+
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_ROUTES = tuple(p.strip() for p in os.getenv("PROFILE_ROUTES", "").split(",") if p.strip())
+
+DEBUG_HEADER = b"x-debug-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+def debug_token_valid(value: str) -> bool:
+    """True if `value` matches PROFILE_TOKEN; always False when no token is configured."""
+    return bool(PROFILE_TOKEN) and hmac.compare_digest(value.encode(), PROFILE_TOKEN.encode())
+
+
+def _sampled(path: str) -> bool:
+    if PROFILE_SAMPLE_RATE <= 0:
+        return False
+    if PROFILE_ROUTES and not path.startswith(PROFILE_ROUTES):
+        return False
+    return random.random() < PROFILE_SAMPLE_RATE
+
+
+class ProfilingMiddleware:
+    """Run the stack sampler around requests selected by the debug header or sampling rule."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = dict(scope["headers"]).get(DEBUG_HEADER, b"").decode("latin-1")
+        if not (debug_token_valid(header) if header else _sampled(scope["path"])):
+            await self.app(scope, receive, send)
+            return
+
+        started = datetime.now(timezone.utc)
+        profile_id = f"{started:%Y%m%dT%H%M%S}-{scope['method']}-{request_id_var.get() or os.urandom(6).hex()}"
+        status = {"code": 500}
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(PROFILE_ID_HEADER, profile_id.encode())]
+            await send(message)
+
+        # Async endpoints run on the event loop thread, so that is the one to sample
+        sampler = StackSampler(threading.get_ident())
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            name = (f"{scope['method']} {route_template(scope)} {status['code']} "
+                    f"{sampler.duration * 1000:.1f}ms at {started.isoformat(timespec='seconds')}")
+            await run_in_threadpool(save_profile, profile_id, sampler.speedscope(name))
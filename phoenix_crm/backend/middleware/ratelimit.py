@@ -0,0 +1,102 @@
+"""
+Rate limiting middleware - per-caller token buckets and per-upstream admission control
+
+Requests under /api/ are classed as ai (anything under /api/ai), write (POST,
+PUT, PATCH, DELETE) or read, and charged to the caller's bucket for that
+class. The caller is the user behind a bearer token that get_current_user has
+already verified (looked up locally, so no upstream call is needed to
+decide); any other request, including one with an unverified token, is
+charged to its client address. Rejected requests get 429 with Retry-After.
+"""
+import os
+import json
+import math
+from backend.metrics import registry
+from backend.ratelimit import (
+    ConcurrencyCaps, RATE_LIMIT_ENABLED, DEFAULT_RATE_LIMITS, DEFAULT_UPSTREAM_CONCURRENCY,
+    create_buckets, parse_caps, parse_limits, token_hash, verified_tokens, worker_count,
+)
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Upstream each route class mostly waits on
+UPSTREAMS = {"read": "supabase", "write": "supabase", "ai": "gpt4all"}
+
+# Suggested back-off when an upstream is at its concurrency cap
+SHED_RETRY_AFTER = 1
+
+rejected_requests = registry.counter(
+    "phoenix_http_requests_rejected_total", "Requests refused with 429 by route class and reason",
+    ["route_class", "reason"])
+upstream_in_use = registry.gauge(
+    "phoenix_upstream_admitted_requests", "Requests currently admitted to each upstream", ["upstream"])
+
+
+def route_class(method: str, path: str) -> str:
+    if path.startswith("/api/ai"):
+        return "ai"
+    return "write" if method in WRITE_METHODS else "read"
+
+
+def caller_key(scope) -> str:
+    authorization = dict(scope["headers"]).get(b"authorization", b"")
+    if authorization.lower().startswith(b"bearer "):
+        user_id = verified_tokens.user_for(token_hash(authorization[7:]))
+        if user_id is not None:
+            return f"user:{user_id}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+async def _reject(send, retry_after: float, detail: str):
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """Charge each /api/ request to its caller's bucket and admit it to its upstream, or answer 429."""
+
+    def __init__(self, app):
+        self.app = app
+        self.enabled = RATE_LIMIT_ENABLED
+        self.limits = parse_limits(os.getenv("RATE_LIMITS", DEFAULT_RATE_LIMITS))
+        # Built in each worker after the fork; every worker enforces its share of the configured limits
+        workers = worker_count()
+        self.caps = ConcurrencyCaps(parse_caps(os.getenv("UPSTREAM_CONCURRENCY", DEFAULT_UPSTREAM_CONCURRENCY)), workers)
+        self.buckets = create_buckets(workers=workers)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        kind = route_class(scope["method"], scope["path"])
+        limit = self.limits.get(kind)
+        if limit is not None:
+            wait = await self.buckets.take(f"{kind}:{caller_key(scope)}", limit)
+            if wait > 0:
+                rejected_requests.inc(route_class=kind, reason="rate_limit")
+                await _reject(send, wait, "Rate limit exceeded")
+                return
+
+        upstream = UPSTREAMS[kind]
+        if not self.caps.try_acquire(upstream):
+            rejected_requests.inc(route_class=kind, reason="upstream_busy")
+            await _reject(send, SHED_RETRY_AFTER, "Server busy, retry shortly")
+            return
+
+        upstream_in_use.inc(upstream=upstream)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            upstream_in_use.dec(upstream=upstream)
+            self.caps.release(upstream)
@@ -0,0 +1,46 @@
+"""
+Resilience middleware - reports stale data and open circuits to the caller
+
+Responses built from cached data carry X-Data-Stale with the age of the
+oldest cached read in seconds (plus the standard Warning: 110). A request
+that failed because an upstream's circuit breaker was open is answered with
+503 and Retry-After instead of the router's generic 500, so clients back off
+rather than retrying straight into the outage.
+"""
+import math
+from backend.resilience import request_outcome
+
+STALE_HEADER = b"x-data-stale"
+
+
+class ResilienceMiddleware:
+    """Collect per-request resilience outcomes and surface them in the response headers."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        outcome = {}
+
+        async def send_with_outcome(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if outcome.get("stale_ages"):
+                    age = math.ceil(max(outcome["stale_ages"]))
+                    headers += [(STALE_HEADER, str(age).encode()), (b"warning", b'110 - "Response is Stale"')]
+                if outcome.get("open_circuits") and message["status"] in (500, 503):
+                    retry_after = max(1, math.ceil(max(e.retry_after for e in outcome["open_circuits"])))
+                    message["status"] = 503
+                    headers.append((b"retry-after", str(retry_after).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        token = request_outcome.set(outcome)
+        try:
+            await self.app(scope, receive, send_with_outcome)
+        finally:
+            request_outcome.reset(token)
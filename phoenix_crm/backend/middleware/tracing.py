@@ -0,0 +1,39 @@
+"""
+Tracing middleware - one server span per request, continuing the caller's trace
+"""
+from backend.middleware.metrics import route_template
+from backend.tracing import start_span, parse_traceparent
+
+TRACEPARENT_HEADER = b"traceparent"
+TRACE_ID_HEADER = b"x-trace-id"
+
+
+class TracingMiddleware:
+    """Open a server span per HTTP request, parented to an incoming traceparent header."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = parse_traceparent(dict(scope["headers"]).get(TRACEPARENT_HEADER, b"").decode("latin-1"))
+        method = scope["method"]
+        with start_span(f"{method} {scope['path']}", kind="server", parent=parent,
+                        **{"http.request.method": method, "url.path": scope["path"]}) as span:
+
+            async def send_with_trace(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    message["headers"] = list(message.get("headers", [])) + [(TRACE_ID_HEADER, span.trace_id.encode())]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                # Name the span after the route template so traces group by endpoint
+                route = route_template(scope)
+                span.set_attribute("http.route", route)
+                span.name = f"{method} {route}"
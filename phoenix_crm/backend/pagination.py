@@ -0,0 +1,63 @@
+"""
+Paging and ordering for list endpoints
+
+List endpoints take `limit`, `offset` and `order` query parameters, so a
+client downloads only what it displays. `order` is a column name with a
+leading "-" for descending (order=-created_at). Each endpoint whitelists its
+sortable columns. Its defaults match what it returned before these
+parameters existed, so a request without them gets the same response.
+
+    page: Page = Depends(pagination("-created_at", ("created_at", "title")))
+    query = page.apply(supabase.table("goals").select("*").eq(...))
+"""
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+from fastapi import HTTPException, Query
+
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Page:
+    """A validated window onto an ordered list."""
+
+    limit: Optional[int]
+    offset: int
+    column: Optional[str]
+    desc: bool
+
+    def apply(self, query):
+        """Push the ordering and window down into a table query."""
+        if self.column:
+            query = query.order(self.column, desc=self.desc)
+        if self.limit is not None:
+            query = query.range(self.offset, self.offset + self.limit - 1)
+        elif self.offset:
+            query = query.offset(self.offset)
+        return query
+
+    def slice(self, rows: List) -> List:
+        """Window a list that had to be ordered in Python (e.g. by a computed score)."""
+        end = None if self.limit is None else self.offset + self.limit
+        return rows[self.offset:end]
+
+
+def pagination(default_order: Optional[str], columns: Sequence[str], default_limit: Optional[int] = None,
+               max_limit: int = MAX_PAGE_SIZE) -> Callable[..., Page]:
+    """FastAPI dependency parsing limit/offset/order for an endpoint sortable by `columns`."""
+
+    def dependency(
+        limit: Optional[int] = Query(default=default_limit, ge=1, le=max_limit,
+                                     description="Maximum number of items to return"),
+        offset: int = Query(default=0, ge=0, description="Number of items to skip"),
+        order: Optional[str] = Query(default=default_order,
+                                     description=f"Sort column, prefix with - for descending: {', '.join(columns)}"),
+    ) -> Page:
+        if not order:
+            return Page(limit, offset, None, False)
+        column = order.lstrip("-")
+        if column not in columns:
+            raise HTTPException(status_code=422, detail=f"order must be one of: {', '.join(columns)}")
+        return Page(limit, offset, column, order.startswith("-"))
+
+    return dependency
@@ -0,0 +1,144 @@
+"""
+Sampling profiler that writes speedscope files
+
+A background thread snapshots the target thread's Python stack at a fixed
+interval (sys._current_frames), so the profiled request runs at full speed
+apart from the brief GIL hand-offs. Profiles are stored as speedscope JSON
+(https://www.speedscope.app) and can be opened there as a flamegraph.
+
+Configuration (environment):
+    PROFILE_DIR          where profiles are written, default backend/data/profiles
+    PROFILE_KEEP         newest profiles kept on disk, default 200
+    PROFILE_INTERVAL_MS  sampling interval, default 1
+"""
+import os
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_DIR = Path(os.getenv(
+    "PROFILE_DIR", str(Path(__file__).resolve().parent / "data" / "profiles")))
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "200"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", "1")) / 1000
+
+PROFILE_SUFFIX = ".speedscope.json"
+
+# Stacks deeper than this are truncated at the root end
+MAX_DEPTH = 128
+
+FrameKey = Tuple[str, str, int]
+
+
+class StackSampler:
+    """Samples one thread's stack on a background thread until stopped."""
+
+    def __init__(self, thread_id: int, interval: float = PROFILE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.frames: List[FrameKey] = []
+        self._frame_index: Dict[FrameKey, int] = {}
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self._record(frame, now - last)
+            last = now
+
+    def _record(self, frame, weight: float):
+        stack = []
+        while frame is not None and len(stack) < MAX_DEPTH:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, frame.f_lineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self.frames)
+                self.frames.append(key)
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        self.samples.append(stack)
+        self.weights.append(weight)
+
+    def speedscope(self, name: str) -> Dict:
+        """The samples as a speedscope "sampled" profile document."""
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "phoenix-crm",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": n, "file": f, "line": line} for n, f, line in self.frames]},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": self.samples,
+                "weights": self.weights,
+            }],
+        }
+
+
+def save_profile(name: str, document: Dict) -> Path:
+    """Write a profile and prune the oldest beyond PROFILE_KEEP."""
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROFILE_DIR / f"{name}{PROFILE_SUFFIX}"
+    path.write_text(json.dumps(document, separators=(",", ":")), encoding="utf-8")
+    profiles = sorted(PROFILE_DIR.glob(f"*{PROFILE_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    for old in profiles[:-PROFILE_KEEP] if PROFILE_KEEP > 0 else []:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def list_profiles() -> List[Dict]:
+    """Stored profiles, newest first."""
+    if not PROFILE_DIR.exists():
+        return []
+    entries = []
+    for path in PROFILE_DIR.glob(f"*{PROFILE_SUFFIX}"):
+        try:
+            stat = path.stat()
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            # Pruned or still being written by another request
+            continue
+        entries.append({
+            "id": path.name[:-len(PROFILE_SUFFIX)],
+            "request": document.get("name"),
+            "samples": len(document["profiles"][0]["samples"]) if document.get("profiles") else 0,
+            "size_bytes": stat.st_size,
+            "created_at": stat.st_mtime,
+        })
+    return sorted(entries, key=lambda e: e["created_at"], reverse=True)
+
+
+def profile_path(profile_id: str) -> Optional[Path]:
+    """Path of a stored profile, or None if the ID is unknown or not a plain file name."""
+    if "/" in profile_id or "\\" in profile_id or profile_id.startswith("."):
+        return None
+    path = PROFILE_DIR / f"{profile_id}{PROFILE_SUFFIX}"
+    return path if path.is_file() else None
@@ -0,0 +1,255 @@
+"""
+Token-bucket rate limiting and upstream concurrency caps
+
+Each caller gets one bucket per route class (cheap reads, writes, AI). A bucket
+holds up to `burst` tokens and refills at `rate` tokens per second; a request
+spends one token or is rejected with the time until the next token. Buckets
+live in process memory by default. With RATE_LIMIT_REDIS_URL they are kept in
+Redis instead, so all workers of a multi-process deployment share them.
+Without Redis each of the WEB_CONCURRENCY workers enforces its share of the
+limits (rate and burst divided by the worker count), so a caller spread over
+every worker still gets the configured limit in total.
+
+A bearer token is charged to its user's buckets only after get_current_user
+has verified it; until then (and for requests without a token) the client
+address pays. A client sending a fresh made-up token with every request
+therefore still drains one bucket per address instead of getting a new one
+each time.
+
+Concurrency caps bound how many requests may be inside each upstream (the
+Supabase client, the GPT4All model) at once; requests beyond the cap are shed
+immediately rather than queued behind a saturated backend. Caps are counted
+per process, so each worker admits its share of the configured total.
+
+Configuration (environment):
+    RATE_LIMIT_ENABLED      default true
+    RATE_LIMITS             "class=rate:burst,...", default "read=10:40,write=2:20,ai=0.2:3"
+    UPSTREAM_CONCURRENCY    "upstream=limit,...", default "supabase=64,gpt4all=4" (across all workers)
+    RATE_LIMIT_REDIS_URL    e.g. redis://localhost:6379/0; unset keeps buckets in process
+    WEB_CONCURRENCY         worker processes sharing the limits, default 1 (set by server.py)
+"""
+import os
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "")
+
+DEFAULT_RATE_LIMITS = "read=10:40,write=2:20,ai=0.2:3"
+DEFAULT_UPSTREAM_CONCURRENCY = "supabase=64,gpt4all=4"
+
+# Idle buckets are dropped once the table grows past this many keys
+MAX_BUCKETS = 100_000
+
+# How long a verified token keeps being charged to its user, and how many are remembered
+VERIFIED_TOKEN_TTL = 300.0
+MAX_VERIFIED_TOKENS = 100_000
+
+
+@dataclass(frozen=True)
+class Limit:
+    rate: float
+    burst: float
+
+
+def parse_limits(spec: str) -> Dict[str, Limit]:
+    """Parse "read=10:40,ai=0.2:3" into per-class limits, ignoring malformed entries."""
+    limits = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        rate, _, burst = value.partition(":")
+        try:
+            limit = Limit(float(rate), float(burst or rate))
+        except ValueError:
+            continue
+        if sep and name.strip() and limit.rate > 0 and limit.burst >= 1:
+            limits[name.strip()] = limit
+    return limits
+
+
+def worker_count() -> int:
+    """Worker processes serving the API, from WEB_CONCURRENCY."""
+    try:
+        return max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
+def per_worker(limit: Limit, workers: int) -> Limit:
+    """One worker's share of `limit` when `workers` processes each keep their own buckets."""
+    return Limit(limit.rate / workers, max(1.0, limit.burst / workers))
+
+
+def parse_caps(spec: str) -> Dict[str, int]:
+    """Parse "supabase=64,gpt4all=4" into per-upstream caps, ignoring malformed entries."""
+    caps = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip() and value.strip().isdigit():
+            caps[name.strip()] = int(value)
+    return caps
+
+
+class MemoryBuckets:
+    """Token buckets in process memory; only touched from the event loop, so no locking.
+
+    With `workers` > 1 every limit is scaled down to this process's share.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        # key -> (tokens, last update, seconds to refill completely)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._shares: Dict[Limit, Limit] = {}
+
+    async def take(self, key: str, limit: Limit) -> float:
+        """Spend a token; returns 0 if allowed, else seconds until one is available."""
+        if self.workers > 1:
+            share = self._shares.get(limit)
+            if share is None:
+                share = self._shares[limit] = per_worker(limit, self.workers)
+            limit = share
+        now = time.monotonic()
+        tokens, updated, _ = self._buckets.get(key, (limit.burst, now, 0.0))
+        tokens = min(limit.burst, tokens + (now - updated) * limit.rate)
+        refill = (limit.burst - tokens + 1) / limit.rate
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now, refill)
+            if len(self._buckets) > MAX_BUCKETS:
+                self._prune(now)
+            return 0.0
+        self._buckets[key] = (tokens, now, refill)
+        return (1 - tokens) / limit.rate
+
+    def _prune(self, now: float):
+        # A bucket idle long enough to have refilled completely is the same as no bucket
+        self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < v[2]}
+
+
+# Atomic refill-and-take; returns the wait in milliseconds (0 when allowed)
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return wait
+"""
+
+
+class RedisBuckets:
+    """Token buckets shared across workers through Redis.
+
+    If Redis cannot be reached the request is judged by a local fallback
+    bucket instead, so a Redis outage degrades to per-worker limiting
+    rather than taking the API down.
+    """
+
+    def __init__(self, url: str, workers: int = 1):
+        import redis.asyncio as redis
+        self._redis = redis.from_url(url)
+        self._script = self._redis.register_script(_TAKE_SCRIPT)
+        self._fallback = MemoryBuckets(workers)
+        self._warned = False
+
+    async def take(self, key: str, limit: Limit) -> float:
+        try:
+            wait_ms = await self._script(keys=[f"phoenix:ratelimit:{key}"], args=[limit.rate, limit.burst])
+            self._warned = False
+            return int(wait_ms) / 1000
+        except Exception as e:
+            if not self._warned:
+                logger.warning("Redis rate limiter unavailable, limiting per worker: %s", e)
+                self._warned = True
+            return await self._fallback.take(key, limit)
+
+
+class ConcurrencyCaps:
+    """Non-blocking per-upstream slot counters holding this worker's share of each cap."""
+
+    def __init__(self, caps: Dict[str, int], workers: int = 1):
+        self.caps = {name: max(1, cap // workers) for name, cap in caps.items()}
+        self.in_use: Dict[str, int] = {name: 0 for name in caps}
+
+    def try_acquire(self, upstream: str) -> bool:
+        cap = self.caps.get(upstream)
+        if cap is None:
+            return True
+        if self.in_use[upstream] >= cap:
+            return False
+        self.in_use[upstream] += 1
+        return True
+
+    def release(self, upstream: str):
+        if upstream in self.in_use:
+            self.in_use[upstream] -= 1
+
+
+def token_hash(token) -> str:
+    """Stable key for a bearer token that does not keep the token itself in memory."""
+    if isinstance(token, str):
+        token = token.encode()
+    return hashlib.sha256(token.strip()).hexdigest()[:32]
+
+
+class VerifiedTokens:
+    """Bearer tokens get_current_user accepted recently, mapped to their user ID.
+
+    Only touched from the event loop, so no locking. Per worker: a token first
+    seen by another worker is charged to the client address once more.
+    """
+
+    def __init__(self, ttl: float = VERIFIED_TOKEN_TTL, max_size: int = MAX_VERIFIED_TOKENS):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._tokens: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def add(self, token: str, user_id: str):
+        key = token_hash(token)
+        self._tokens[key] = (user_id, time.monotonic() + self.ttl)
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self.max_size:
+            self._tokens.popitem(last=False)
+
+    def user_for(self, key: str) -> Optional[str]:
+        """User ID of a verified token hash, or None if unknown or expired."""
+        entry = self._tokens.get(key)
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            del self._tokens[key]
+            return None
+        return entry[0]
+
+
+verified_tokens = VerifiedTokens()
+
+
+def create_buckets(redis_url: Optional[str] = None, workers: int = 1):
+    """Redis-backed buckets when a URL is configured and the client is installed, else in-process."""
+    url = RATE_LIMIT_REDIS_URL if redis_url is None else redis_url
+    if url:
+        try:
+            return RedisBuckets(url, workers)
+        except ImportError:
+            logger.warning("RATE_LIMIT_REDIS_URL is set but the redis package is not installed; limiting per worker")
+    if workers > 1:
+        logger.warning("Rate limits are split between %d workers; set RATE_LIMIT_REDIS_URL to share buckets", workers)
+    return MemoryBuckets(workers)
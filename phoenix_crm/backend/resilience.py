@@ -0,0 +1,285 @@
+"""
+Circuit breakers, bounded retries and stale-response fallback for data client calls
+
+Every table (and auth, and each RPC) gets its own breaker. Transient failures
+(connection errors, timeouts, Postgres connection/resource errors, PostgREST
+connection errors, gateway 502/503/504 responses and retryable auth errors)
+count against it; after BREAKER_FAILURE_THRESHOLD of them in a row it opens and
+calls fail fast for BREAKER_RESET_SECONDS, then a single probe call decides
+whether it closes again. Errors that mean the upstream answered, such as a
+bad filter or no rows for single(), leave the breaker alone.
+
+Idempotent reads are retried on transient failures with full-jitter
+exponential backoff. The total backoff per call is capped. Async handlers
+call the data client inline, so on the event loop thread the cap is a few
+milliseconds: a backoff sleep there holds up every other request in the
+worker. When the budget is spent the call stops retrying and falls back to
+the stale cache. Successful selects are remembered per query; when a
+select still fails, or its breaker is open, the last good response is served
+instead and the request is marked stale so the API can say so in a header.
+
+Configuration (environment):
+    BREAKER_FAILURE_THRESHOLD   consecutive transient failures that open a breaker, default 5
+    BREAKER_RESET_SECONDS       how long a breaker stays open before probing, default 10
+    READ_RETRIES                extra attempts for idempotent reads, default 2
+    RETRY_BASE_DELAY_MS         first backoff ceiling, doubled per attempt, default 50
+    RETRY_MAX_DELAY_MS          backoff ceiling, default 500
+    RETRY_BUDGET_MS             total backoff per call in a worker thread, default 1000
+    RETRY_LOOP_BUDGET_MS        total backoff per call on the event loop thread, default 25
+    STALE_CACHE_SIZE            remembered select responses, default 2048
+    STALE_CACHE_MAX_AGE         oldest response still worth serving in seconds, default 3600
+    STALE_CACHE_MAX_ROWS        larger responses are not remembered, default 5000
+"""
+import os
+import copy
+import time
+import random
+import asyncio
+import threading
+import contextvars
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import httpx
+from postgrest.exceptions import APIError
+try:
+    from supabase_auth.errors import AuthRetryableError
+except ImportError:  # supabase releases before the auth client was renamed
+    from gotrue.errors import AuthRetryableError
+from backend.metrics import registry
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "10"))
+READ_RETRIES = int(os.getenv("READ_RETRIES", "2"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY_MS", "50")) / 1000
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY_MS", "500")) / 1000
+RETRY_BUDGET = float(os.getenv("RETRY_BUDGET_MS", "1000")) / 1000
+RETRY_LOOP_BUDGET = float(os.getenv("RETRY_LOOP_BUDGET_MS", "25")) / 1000
+STALE_CACHE_SIZE = int(os.getenv("STALE_CACHE_SIZE", "2048"))
+STALE_CACHE_MAX_AGE = float(os.getenv("STALE_CACHE_MAX_AGE", "3600"))
+STALE_CACHE_MAX_ROWS = int(os.getenv("STALE_CACHE_MAX_ROWS", "5000"))
+
+# Postgres error classes that mean the database, not the query, is in trouble:
+# connection exceptions, insufficient resources, operator intervention (incl. statement timeout)
+_TRANSIENT_SQLSTATE_CLASSES = ("08", "53", "57")
+
+# PostgREST's own codes for "could not reach / lost / pooled out of the database"
+_TRANSIENT_POSTGREST_CODES = {"PGRST000", "PGRST001", "PGRST002", "PGRST003"}
+
+# HTTP statuses a proxy returns when the upstream is down; postgrest reports these as
+# the error code (an int) when the body is not a PostgREST error
+_TRANSIENT_HTTP_STATUSES = {502, 503, 504}
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+breaker_state = registry.gauge(
+    "phoenix_circuit_breaker_state", "Breaker state per upstream target (0 closed, 1 half-open, 2 open)",
+    ["client", "target"], multiprocess_mode="max")
+retries_total = registry.counter(
+    "phoenix_upstream_retries_total", "Retried data client calls by target", ["client", "target"])
+stale_served = registry.counter(
+    "phoenix_stale_responses_total", "Cached responses served because the upstream failed", ["client", "target"])
+
+# Per-request record of stale reads and open breakers, installed by ResilienceMiddleware.
+# It holds a mutable dict so updates made in threadpool workers are visible to the middleware.
+request_outcome: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "request_outcome", default=None)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, target: str, retry_after: float):
+        super().__init__(f"{target} is unavailable (circuit open), retry in {retry_after:.0f}s")
+        self.target = target
+        self.retry_after = retry_after
+
+
+def is_transient(error: BaseException) -> bool:
+    """True for failures worth retrying and counting against a breaker."""
+    if isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError, AuthRetryableError)):
+        return True
+    if isinstance(error, APIError):
+        return _is_transient_code(error.code)
+    return False
+
+
+def _is_transient_code(code: Any) -> bool:
+    if isinstance(code, int):
+        return code in _TRANSIENT_HTTP_STATUSES
+    code = str(code or "")
+    if code.isdigit() and len(code) == 3:
+        # An HTTP status as text; compared as a number so e.g. 530 is not read as SQLSTATE class 53
+        return int(code) in _TRANSIENT_HTTP_STATUSES
+    if code.startswith("PGRST"):
+        return code in _TRANSIENT_POSTGREST_CODES
+    return len(code) == 5 and code.startswith(_TRANSIENT_SQLSTATE_CLASSES)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe."""
+
+    def __init__(self, client: str, target: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_SECONDS):
+        self.client = client
+        self.target = target
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; moves an expired open breaker to half-open for one probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.retry_after() <= 0:
+                self._set(HALF_OPEN)
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            if self.state != CLOSED:
+                self._set(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._set(OPEN)
+
+    def _set(self, state: str):
+        self.state = state
+        breaker_state.set(_STATE_VALUES[state], client=self.client, target=self.target)
+
+
+class StaleCache:
+    """Bounded LRU of the last good response per query.
+
+    Responses are deep-copied on the way in and out: handlers mutate the rows
+    they return, which must not leak into the copy served during an outage.
+    """
+
+    def __init__(self, size: int = STALE_CACHE_SIZE, max_age: float = STALE_CACHE_MAX_AGE,
+                 max_rows: int = STALE_CACHE_MAX_ROWS):
+        self.size = size
+        self.max_age = max_age
+        self.max_rows = max_rows
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Optional[Tuple[float, Any]]:
+        """(age in seconds, response) or None if missing or older than `max_age`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            age = time.monotonic() - entry[0]
+            if age > self.max_age:
+                del self._entries[key]
+                return None
+            if max_age is not None and age > max_age:
+                return None
+            response = entry[1]
+        return age, copy.deepcopy(response)
+
+    def put(self, key: Hashable, response: Any):
+        data = getattr(response, "data", None)
+        if self.size <= 0 or (isinstance(data, list) and len(data) > self.max_rows):
+            return
+        response = copy.deepcopy(response)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+stale_cache = StaleCache()
+
+
+def breaker_for(client: str, target: str) -> CircuitBreaker:
+    breaker = _breakers.get((client, target))
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault((client, target), CircuitBreaker(client, target))
+    return breaker
+
+
+def _note(key: str, value: Any):
+    outcome = request_outcome.get()
+    if outcome is not None:
+        outcome.setdefault(key, []).append(value)
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+def _retry_budget() -> float:
+    """Seconds of backoff a call may sleep in total; time.sleep on the event loop stalls the whole worker."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return RETRY_BUDGET
+    return RETRY_LOOP_BUDGET
+
+
+def resilient_call(client: str, target: str, call: Callable[[], Any], idempotent: bool = False,
+                   cache_key: Optional[Hashable] = None, max_stale: Optional[float] = None) -> Any:
+    """Run `call` behind the target's breaker, retrying idempotent calls and falling back to cache.
+
+    `cache_key` enables the stale fallback: successful results are stored
+    under it and served (with the request marked stale) if the call fails,
+    provided they are no older than `max_stale` (default STALE_CACHE_MAX_AGE).
+    """
+    breaker = breaker_for(client, target)
+    attempts = 1 + max(0, READ_RETRIES) if idempotent else 1
+    budget = _retry_budget() if attempts > 1 else 0.0
+    error: Optional[BaseException] = None
+
+    for attempt in range(attempts):
+        if not breaker.allow():
+            error = CircuitOpenError(target, breaker.retry_after())
+            break
+        try:
+            result = call()
+        except Exception as e:
+            if not is_transient(e):
+                # The upstream answered; the request itself was bad
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            error = e
+            if attempt + 1 < attempts:
+                delay = _backoff(attempt)
+                if delay > budget:
+                    break
+                budget -= delay
+                retries_total.inc(client=client, target=target)
+                time.sleep(delay)
+            continue
+        breaker.record_success()
+        if cache_key is not None:
+            stale_cache.put(cache_key, result)
+        return result
+
+    cached = stale_cache.get(cache_key, max_stale) if cache_key is not None else None
+    if cached is not None:
+        age, result = cached
+        stale_served.inc(client=client, target=target)
+        _note("stale_ages", age)
+        return result
+    if isinstance(error, CircuitOpenError):
+        _note("open_circuits", error)
+    raise error
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 # Import from your existing backend.api structure
 from backend.api.auth import get_current_user
 from backend.database import get_supabase_client
+from backend.pagination import Page, pagination
 
 router = APIRouter(prefix="/api/appointments", tags=["appointments"])
 
@@ -26,16 +27,18 @@ class AppointmentResponse(BaseModel):
 
 
 @router.get("/", response_model=List[AppointmentResponse])
-async def get_appointments(current_user: dict = Depends(get_current_user)):
-    """Get all appointments for the current user."""
+async def get_appointments(
+    page: Page = Depends(pagination("appointment_time", ("appointment_time", "created_at", "status"))),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get the current user's appointments, soonest first unless `order` says otherwise."""
     supabase = get_supabase_client()
     
     try:
-        response = supabase.table("appointments") \
+        query = supabase.table("appointments") \
             .select("*") \
-            .eq("user_id", current_user["id"]) \
-            .order("appointment_time", desc=False) \
-            .execute()
+            .eq("user_id", current_user["id"])
+        response = page.apply(query).execute()
         
         return response.data
     except Exception as e:
@@ -7,6 +7,7 @@ from datetime import date, datetime
 from pydantic import BaseModel
 from backend.api.auth import get_current_user
 from backend.database import get_supabase_client
+from backend.pagination import Page, pagination
 
 router = APIRouter(prefix="/api/goals", tags=["goals"])
 
@@ -26,16 +27,18 @@ class GoalResponse(BaseModel):
 
 
 @router.get("/", response_model=List[GoalResponse])
-async def get_goals(current_user: dict = Depends(get_current_user)):
-    """Get all goals for the current user."""
+async def get_goals(
+    page: Page = Depends(pagination("-created_at", ("created_at", "deadline", "progress", "title"))),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get the current user's goals, newest first unless `order` says otherwise."""
     supabase = get_supabase_client()
     
     try:
-        response = supabase.table("goals") \
+        query = supabase.table("goals") \
             .select("*") \
-            .eq("user_id", current_user["id"]) \
-            .order("created_at", desc=True) \
-            .execute()
+            .eq("user_id", current_user["id"])
+        response = page.apply(query).execute()
         
         return response.data
     except Exception as e:
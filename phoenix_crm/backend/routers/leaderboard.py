@@ -1,6 +1,7 @@
 """
 Leaderboard API Router - Track top performing sales people
 """
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from datetime import datetime
@@ -9,6 +10,7 @@ from backend.api.auth import get_current_user
 from backend.database import get_supabase_client
 
 router = APIRouter(prefix="/api/leaderboard", tags=["leaderboard"])
+logger = logging.getLogger(__name__)
 
 
 class LeaderboardEntry(BaseModel):
@@ -31,6 +33,7 @@ class LeaderboardEntry(BaseModel):
 async def get_leaderboard(
     period: str = Query(default="all", regex="^(all|monthly|weekly)$"),
     limit: int = Query(default=10, ge=1, le=50),
+    offset: int = Query(default=0, ge=0),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -38,6 +41,7 @@ async def get_leaderboard(
     
     - **period**: Filter by time period (all, monthly, weekly)
     - **limit**: Number of top performers to return (1-50)
+    - **offset**: Number of higher-ranked performers to skip
     """
     supabase = get_supabase_client()
     
@@ -56,19 +60,19 @@ async def get_leaderboard(
         else:
             query = query.order("total_revenue", desc=True)
         
-        query = query.limit(limit)
+        query = query.range(offset, offset + limit - 1)
         
         response = query.execute()
         
         # Add rank to each entry
         leaderboard = response.data
-        for idx, entry in enumerate(leaderboard, start=1):
+        for idx, entry in enumerate(leaderboard, start=offset + 1):
             entry['rank'] = idx
         
         return leaderboard
         
     except Exception as e:
-        print(f"Error fetching leaderboard: {e}")
+        logger.exception("Error fetching leaderboard")
         raise HTTPException(status_code=500, detail=f"Failed to fetch leaderboard: {str(e)}")
 
 
@@ -110,5 +114,5 @@ async def get_my_stats(current_user: dict = Depends(get_current_user)):
         return stats
         
     except Exception as e:
-        print(f"Error fetching user stats: {e}")
+        logger.exception("Error fetching user stats")
         raise HTTPException(status_code=500, detail=str(e))
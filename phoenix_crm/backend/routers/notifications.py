@@ -7,6 +7,7 @@ from datetime import datetime
 from pydantic import BaseModel
 from backend.api.auth import get_current_user
 from backend.database import get_supabase_client
+from backend.pagination import Page, pagination
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
@@ -22,17 +23,18 @@ class NotificationResponse(BaseModel):
 
 
 @router.get("/", response_model=List[NotificationResponse])
-async def get_notifications(current_user: dict = Depends(get_current_user)):
-    """Get all notifications for the current user."""
+async def get_notifications(
+    page: Page = Depends(pagination("-created_at", ("created_at",), default_limit=50, max_limit=200)),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get the current user's notifications, newest first (50 unless `limit` says otherwise)."""
     supabase = get_supabase_client()
     
     try:
-        response = supabase.table("notifications") \
+        query = supabase.table("notifications") \
             .select("*") \
-            .eq("user_id", current_user["id"]) \
-            .order("created_at", desc=True) \
-            .limit(50) \
-            .execute()
+            .eq("user_id", current_user["id"])
+        response = page.apply(query).execute()
         
         return response.data
     except Exception as e:
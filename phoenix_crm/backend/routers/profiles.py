@@ -0,0 +1,40 @@
+"""
+Profiles Admin API Router - list and download captured request profiles
+"""
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+from typing import List, Optional
+from pydantic import BaseModel
+from backend.middleware.profiling import debug_token_valid
+from backend.profiling import list_profiles, profile_path
+
+router = APIRouter(prefix="/api/admin/profiles", tags=["admin"])
+
+
+class ProfileEntry(BaseModel):
+    id: str
+    request: Optional[str]
+    samples: int
+    size_bytes: int
+    created_at: float
+
+
+async def require_debug_token(x_debug_profile: str = Header(default="")):
+    """Admin access uses the same token as the X-Debug-Profile request header."""
+    if not debug_token_valid(x_debug_profile):
+        raise HTTPException(status_code=403, detail="Valid X-Debug-Profile token required")
+
+
+@router.get("/", response_model=List[ProfileEntry], dependencies=[Depends(require_debug_token)])
+async def get_profiles():
+    """Captured profiles, newest first."""
+    return list_profiles()
+
+
+@router.get("/{profile_id}", dependencies=[Depends(require_debug_token)])
+async def get_profile(profile_id: str):
+    """Download one profile as speedscope JSON (open it at https://www.speedscope.app)."""
+    path = profile_path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=path.name)
@@ -0,0 +1,112 @@
+"""
+Semantic Search API Router
+
+The index is built in the background, at startup or on the first search that
+finds it missing; until then searches get 503 with Retry-After. Queries and
+builds run in the threadpool so embedding never blocks the event loop.
+"""
+import logging
+import threading
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
+from pydantic import BaseModel
+from backend.api.auth import get_current_user, require_admin
+from backend.database import get_supabase_client
+from services.semantic_search import get_semantic_index, lead_document, training_document
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+logger = logging.getLogger(__name__)
+
+# Suggested wait while the index is being built
+WARMING_RETRY_AFTER = 5
+
+_warming_lock = threading.Lock()
+_warming_thread: Optional[threading.Thread] = None
+
+
+class SearchResult(BaseModel):
+    id: str
+    kind: str
+    score: float
+
+
+def _build_index(index, supabase):
+    """Populate the index from every lead and published training item."""
+    leads = supabase.table("leads") \
+        .select("id, first_name, last_name, company, title, notes, assigned_to") \
+        .execute()
+    training = supabase.table("training_center") \
+        .select("id, title, category, description") \
+        .eq("published", True) \
+        .execute()
+
+    docs = [lead_document(lead) for lead in leads.data or []]
+    docs += [training_document(item) for item in training.data or []]
+    index.rebuild(docs)
+    logger.info("Semantic index built", extra={"documents": len(docs)})
+
+
+def _warm():
+    try:
+        index = get_semantic_index()
+        # Another worker sharing the index directory may have built it meanwhile
+        if not index.built:
+            _build_index(index, get_supabase_client())
+    except Exception:
+        logger.exception("Semantic index build failed")
+
+
+def start_warming() -> bool:
+    """Build the index on a background thread unless it is built or already building; True while not ready."""
+    global _warming_thread
+    if get_semantic_index().built:
+        return False
+    with _warming_lock:
+        if _warming_thread is None or not _warming_thread.is_alive():
+            _warming_thread = threading.Thread(target=_warm, name="semantic-index-build", daemon=True)
+            _warming_thread.start()
+    return True
+
+
+@router.on_event("startup")
+async def warm_semantic_index():
+    try:
+        start_warming()
+    except Exception:
+        logger.exception("Could not start semantic index build")
+
+
+@router.get("/semantic", response_model=List[SearchResult])
+async def semantic_search(
+    q: str = Query(..., min_length=2),
+    k: int = Query(default=10, ge=1, le=100),
+    kind: Optional[str] = Query(default=None, regex="^(leads|training)$"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Search lead notes and training materials by meaning.
+
+    - **q**: Free-text query, e.g. "asked about financing"
+    - **k**: Number of results to return (1-100)
+    - **kind**: Restrict results to `leads` or `training`
+    """
+    if start_warming():
+        raise HTTPException(status_code=503, detail="Semantic index warming up",
+                            headers={"Retry-After": str(WARMING_RETRY_AFTER)})
+    try:
+        index = get_semantic_index()
+        return await run_in_threadpool(index.search, q, k=k, owner=current_user["id"], kind=kind)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Semantic search failed: {str(e)}")
+
+
+@router.post("/semantic/rebuild", dependencies=[Depends(require_admin)])
+async def rebuild_semantic_index():
+    """Rebuild the semantic index from scratch (operators only: send X-Admin-Token)."""
+    try:
+        index = get_semantic_index()
+        await run_in_threadpool(_build_index, index, get_supabase_client())
+        return {"documents": len(index)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to rebuild semantic index: {str(e)}")
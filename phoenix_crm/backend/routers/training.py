@@ -7,6 +7,7 @@ from datetime import datetime
 from pydantic import BaseModel
 from backend.api.auth import get_current_user
 from backend.database import get_supabase_client
+from backend.pagination import Page, pagination
 
 router = APIRouter(prefix="/api/training", tags=["training"])
 
@@ -24,16 +25,18 @@ class TrainingResponse(BaseModel):
 
 
 @router.get("/", response_model=List[TrainingResponse])
-async def get_training_materials(current_user: dict = Depends(get_current_user)):
-    """Get all published training materials."""
+async def get_training_materials(
+    page: Page = Depends(pagination("-created_at", ("created_at", "updated_at", "title", "category"))),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get published training materials, newest first unless `order` says otherwise."""
     supabase = get_supabase_client()
     
     try:
-        response = supabase.table("training_center") \
+        query = supabase.table("training_center") \
             .select("*") \
-            .eq("published", True) \
-            .order("created_at", desc=True) \
-            .execute()
+            .eq("published", True)
+        response = page.apply(query).execute()
         
         return response.data
     except Exception as e:
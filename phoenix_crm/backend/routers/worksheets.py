@@ -1,14 +1,17 @@
 """
 Worksheets API Router
 """
+import logging
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel
 from backend.api.auth import get_current_user
 from backend.database import get_supabase_client
+from backend.pagination import Page, pagination
 
 router = APIRouter(prefix="/api/worksheets", tags=["worksheets"])
+logger = logging.getLogger(__name__)
 
 
 class WorksheetResponse(BaseModel):
@@ -23,16 +26,18 @@ class WorksheetResponse(BaseModel):
 
 
 @router.get("/", response_model=List[WorksheetResponse])
-async def get_worksheets(current_user: dict = Depends(get_current_user)):
-    """Get all worksheets for the current user."""
+async def get_worksheets(
+    page: Page = Depends(pagination("-last_modified", ("last_modified", "created_at", "title"))),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get the current user's worksheets, most recently modified first unless `order` says otherwise."""
     supabase = get_supabase_client()
     
     try:
-        response = supabase.table("worksheets") \
+        query = supabase.table("worksheets") \
             .select("*") \
-            .eq("user_id", current_user["id"]) \
-            .order("last_modified", desc=True) \
-            .execute()
+            .eq("user_id", current_user["id"])
+        response = page.apply(query).execute()
         
         # Handle case where table doesn't exist or has no data
         if not response.data:
@@ -40,6 +45,6 @@ async def get_worksheets(current_user: dict = Depends(get_current_user)):
         
         return response.data
     except Exception as e:
-        print(f"Error fetching worksheets: {e}")
-        # Return empty array instead of failing
-        return []
+        # An empty list here would tell the GUI the user has no worksheets
+        logger.exception("Error fetching worksheets")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch worksheets: {str(e)}")
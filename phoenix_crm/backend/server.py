@@ -0,0 +1,287 @@
+"""
+Production server for the Phoenix CRM API
+
+A pre-fork supervisor around uvicorn. The parent imports the app (and
+optionally loads the GPT4All model) once, binds the listening socket, then
+forks the workers, so they share the loaded code and model pages
+copy-on-write instead of each paying the import and load cost. Workers that
+exit, whether recycled after MAX_REQUESTS or crashed, are replaced. SIGTERM
+or SIGINT stops accepting connections and lets each worker drain its
+in-flight requests for up to GRACEFUL_TIMEOUT seconds.
+
+Usage:
+    python server.py                 # production, from backend/
+    python server.py --reload        # development, single process with file watcher
+
+Configuration (environment, overridden by the matching flags):
+    HOST                  default 0.0.0.0
+    PORT                  default 8000
+    WEB_CONCURRENCY       worker processes, default one per available core
+    MAX_REQUESTS          requests before a worker is recycled, default 10000 (0 disables)
+    MAX_REQUESTS_JITTER   random extra per worker so they do not recycle together, default 1000
+    KEEPALIVE_TIMEOUT     idle keep-alive seconds, default 5
+    BACKLOG               listen backlog, default 2048
+    GRACEFUL_TIMEOUT      drain time on shutdown in seconds, default 30
+    PRELOAD_MODEL         load the GPT4All model before forking, default true when
+                          GPT4ALL_MODEL_PATH points at an existing file
+    METRICS_MULTIPROC_DIR where workers publish metric snapshots, default a fresh
+                          temporary directory when there is more than one worker
+
+Workers each keep their own metrics and rate limit state. They publish
+metric snapshots to METRICS_MULTIPROC_DIR, so /metrics reports the totals of
+all workers whichever one serves the scrape (see metrics.py). WEB_CONCURRENCY
+is exported to the workers, and without a shared Redis each enforces its
+share of the rate limits and upstream concurrency caps (see ratelimit.py).
+State on disk that workers share, such as the semantic index, must be locked
+across processes and re-read on change: see services/semantic_search.py.
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import signal
+import socket
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+# Routers import `backend.*`, services import `services.*`: both roots must be importable
+backend_dir = Path(__file__).resolve().parent
+root_dir = backend_dir.parent
+for path in (backend_dir, root_dir):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+logger = logging.getLogger(__name__)
+
+APP = "backend.main:app"
+
+# A worker exiting this soon after it started is treated as a crash loop and respawned with a delay
+MIN_WORKER_UPTIME = 5.0
+RESPAWN_DELAY = 1.0
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return default if value is None else value.lower() in ("1", "true", "yes")
+
+
+def default_workers() -> int:
+    """One worker per core this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def preload_model():
+    """Load the GPT4All model in the parent so forked workers share it."""
+    from services.gpt4all_client import get_gpt4all_client
+    started = time.perf_counter()
+    try:
+        get_gpt4all_client()
+        logger.info("Preloaded GPT4All model", extra={"seconds": round(time.perf_counter() - started, 2)})
+    except Exception as e:
+        logger.warning("Model preload failed, workers will load it on first AI request: %s", e)
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class Supervisor:
+    """Forks uvicorn workers sharing one listening socket and keeps WEB_CONCURRENCY of them alive."""
+
+    def __init__(self, app, sock: socket.socket, workers: int, max_requests: int, max_requests_jitter: int,
+                 keepalive_timeout: int, graceful_timeout: int, backlog: int, metrics_dir: Optional[str] = None):
+        self.app = app
+        self.metrics_dir = metrics_dir
+        self.sock = sock
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.keepalive_timeout = keepalive_timeout
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        logger.info("Starting %d workers on %s", self.workers, self.sock.getsockname()[:2])
+
+        for _ in range(self.workers):
+            self._spawn()
+
+        while not self.stopping:
+            self._reap()
+            if not self.stopping:
+                for _ in range(self.workers - len(self.children)):
+                    self._spawn()
+            time.sleep(0.2)
+
+        self._drain()
+
+    def _handle_stop(self, signum, frame):
+        self.stopping = True
+
+    def _spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self._serve()
+            except BaseException:
+                logger.exception("Worker %d failed", os.getpid())
+                code = 1
+            finally:
+                # os._exit skips atexit, so flush the metrics, log and span queues by hand
+                from backend.log import shutdown_logging
+                from backend.metrics import registry
+                from backend.tracing import shutdown_tracing
+                registry.flush()
+                shutdown_tracing()
+                shutdown_logging()
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+
+    def _serve(self):
+        if self.metrics_dir:
+            from backend.metrics import registry
+            registry.share(self.metrics_dir)
+        limit = None
+        if self.max_requests > 0:
+            limit = self.max_requests + random.randint(0, max(0, self.max_requests_jitter))
+        config = uvicorn.Config(
+            self.app,
+            backlog=self.backlog,
+            timeout_keep_alive=self.keepalive_timeout,
+            timeout_graceful_shutdown=self.graceful_timeout,
+            limit_max_requests=limit,
+            log_config=None,
+            access_log=False,
+        )
+        # uvicorn installs its own SIGTERM handler: stop accepting, finish in-flight requests, run shutdown
+        uvicorn.Server(config).run(sockets=[self.sock])
+
+    def _reap(self):
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            started = self.children.pop(pid, None)
+            code = os.waitstatus_to_exitcode(status)
+            if self.stopping:
+                continue
+            if code == 0:
+                logger.info("Worker %d exited after reaching its request limit, replacing it", pid)
+            else:
+                logger.warning("Worker %d exited with status %d, replacing it", pid, code)
+                if started is not None and time.monotonic() - started < MIN_WORKER_UPTIME:
+                    time.sleep(RESPAWN_DELAY)
+
+    def _drain(self):
+        logger.info("Shutting down, draining %d workers for up to %ds", len(self.children), self.graceful_timeout)
+        self.sock.close()
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.children.pop(pid, None)
+
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.children):
+            logger.warning("Worker %d did not drain in time, killing it", pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self.children.clear()
+
+
+def serve(app: str = APP, host: Optional[str] = None, port: Optional[int] = None, workers: Optional[int] = None):
+    """Run `app` (an import string) with the production settings from the environment."""
+    host = host or os.getenv("HOST", "0.0.0.0")
+    port = port or int(os.getenv("PORT", "8000"))
+    workers = workers or int(os.getenv("WEB_CONCURRENCY", "0")) or default_workers()
+    backlog = int(os.getenv("BACKLOG", "2048"))
+    settings = dict(
+        max_requests=int(os.getenv("MAX_REQUESTS", "10000")),
+        max_requests_jitter=int(os.getenv("MAX_REQUESTS_JITTER", "1000")),
+        keepalive_timeout=int(os.getenv("KEEPALIVE_TIMEOUT", "5")),
+        graceful_timeout=int(os.getenv("GRACEFUL_TIMEOUT", "30")),
+        backlog=backlog,
+    )
+
+    # Preload: import the app, its routers and services once, before any fork
+    application = import_from_string(app)
+    model_path = os.getenv("GPT4ALL_MODEL_PATH", "")
+    if _env_flag("PRELOAD_MODEL", bool(model_path) and os.path.isfile(model_path)):
+        preload_model()
+
+    if not hasattr(os, "fork"):
+        logger.warning("os.fork is unavailable on this platform, serving with a single process")
+        os.environ["WEB_CONCURRENCY"] = "1"
+        uvicorn.run(application, host=host, port=port, log_config=None, access_log=False,
+                    backlog=backlog, timeout_keep_alive=settings["keepalive_timeout"],
+                    timeout_graceful_shutdown=settings["graceful_timeout"])
+        return
+
+    # Workers read these after the fork: rate limits are split between them and metrics are summed across them
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    metrics_dir, temporary = None, False
+    if workers > 1:
+        from backend.metrics import SharedMetrics
+        metrics_dir = os.getenv("METRICS_MULTIPROC_DIR")
+        if not metrics_dir:
+            metrics_dir, temporary = tempfile.mkdtemp(prefix="phoenix-metrics-"), True
+        SharedMetrics.reset(metrics_dir)
+
+    sock = bind_socket(host, port, backlog)
+    try:
+        Supervisor(application, sock, workers, metrics_dir=metrics_dir, **settings).run()
+    finally:
+        if temporary:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def main(argv=None, app: str = APP):
+    parser = argparse.ArgumentParser(description="Run the Phoenix CRM API")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--workers", type=int, help="worker processes (default WEB_CONCURRENCY or one per core)")
+    parser.add_argument("--reload", action="store_true", help="development mode: one process, restart on code changes")
+    args = parser.parse_args(argv)
+
+    if args.reload:
+        os.environ["WEB_CONCURRENCY"] = "1"
+        uvicorn.run(app, host=args.host or os.getenv("HOST", "0.0.0.0"), port=args.port or int(os.getenv("PORT", "8000")),
+                    reload=True, reload_dirs=[str(root_dir)], log_config=None)
+        return
+    serve(app, args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
-from gpt4all import GPT4All
 import os
+import logging
 from functools import lru_cache
 
+logger = logging.getLogger(__name__)
+
 @lru_cache()
 def get_gpt4all_client():
+    # Imported lazily so the API starts without gpt4all installed; only AI calls need it
+    from gpt4all import GPT4All
+    
     model_path = os.getenv("GPT4ALL_MODEL_PATH", "/models/gpt4all-model.bin")
     
     try:
@@ -11,6 +16,6 @@ def get_gpt4all_client():
         return model
     except Exception as e:
         # Fallback to downloading a model if path doesn't exist
-        print(f"Could not load model from {model_path}, downloading default model...")
+        logger.warning("Could not load model from %s, downloading default model", model_path)
         model = GPT4All("orca-mini-3b-gguf2-q4_0.gguf")
         return model
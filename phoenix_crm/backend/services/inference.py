@@ -0,0 +1,181 @@
+"""
+Instrumented access to the local GPT4All model.
+
+All generations go through one lock because the model is not safe to call
+from several threads at once; the time spent waiting for it is recorded as
+queue wait. Tokens are streamed through a callback so time-to-first-token and
+generated token counts are measured rather than guessed.
+"""
+import os
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Tuple
+from backend.metrics import registry
+from backend.tracing import traced
+from services.gpt4all_client import get_gpt4all_client
+from services.prompt_builder import estimate_tokens
+
+# Identical prompts within this many seconds are answered from the cache
+CACHE_TTL_SECONDS = float(os.getenv("AI_CACHE_TTL_SECONDS", "600"))
+CACHE_SIZE = int(os.getenv("AI_CACHE_SIZE", "256"))
+
+TOKEN_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+RATE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+ai_requests = registry.counter(
+    "phoenix_ai_requests_total", "AI inference requests", ["endpoint", "cache"])
+ai_prompt_tokens = registry.histogram(
+    "phoenix_ai_prompt_tokens", "Prompt tokens per request", ["endpoint"], TOKEN_BUCKETS)
+ai_generated_tokens = registry.histogram(
+    "phoenix_ai_generated_tokens", "Generated tokens per request", ["endpoint"], TOKEN_BUCKETS)
+ai_tokens_per_second = registry.histogram(
+    "phoenix_ai_tokens_per_second", "Generation throughput per request", ["endpoint"], RATE_BUCKETS)
+ai_time_to_first_token = registry.histogram(
+    "phoenix_ai_time_to_first_token_seconds", "Time from model start to first token", ["endpoint"])
+ai_queue_wait = registry.histogram(
+    "phoenix_ai_queue_wait_seconds", "Time spent waiting for the model lock", ["endpoint"])
+ai_duration = registry.histogram(
+    "phoenix_ai_request_duration_seconds", "End-to-end inference time including queue wait", ["endpoint"])
+
+
+@dataclass
+class InferenceResult:
+    """Generated text plus the telemetry recorded while producing it."""
+    text: str
+    prompt_tokens: int
+    generated_tokens: int
+    tokens_per_second: float
+    time_to_first_token: Optional[float]
+    queue_wait: float
+    duration: float
+    cache_hit: bool
+    truncated: bool
+
+    @property
+    def confidence(self) -> float:
+        """Heuristic confidence from how the generation ended.
+
+        An empty answer carries no confidence and an answer cut off at
+        max_tokens is likely incomplete; a naturally finished answer scores
+        highest.
+        """
+        if not self.text.strip():
+            return 0.0
+        return 0.5 if self.truncated else 0.9
+
+    def telemetry(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("text")
+        return data
+
+
+class _ResponseCache:
+    """Small LRU cache of recent generations with a time-to-live."""
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, InferenceResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int]) -> Optional[InferenceResult]:
+        if self.size <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Tuple[str, int], result: InferenceResult):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+_model_lock = threading.Lock()
+_cache = _ResponseCache(CACHE_SIZE, CACHE_TTL_SECONDS)
+
+
+@traced("inference.generate")
+def generate(prompt: str, max_tokens: int, endpoint: str = "default") -> InferenceResult:
+    """Generate a completion for `prompt` and record its telemetry.
+
+    Blocking; call it from a worker thread rather than the event loop.
+    """
+    start = time.perf_counter()
+    prompt_tokens = estimate_tokens(prompt)
+
+    cached = _cache.get((prompt, max_tokens))
+    if cached is not None:
+        result = InferenceResult(
+            text=cached.text,
+            prompt_tokens=prompt_tokens,
+            generated_tokens=cached.generated_tokens,
+            tokens_per_second=0.0,
+            time_to_first_token=None,
+            queue_wait=0.0,
+            duration=time.perf_counter() - start,
+            cache_hit=True,
+            truncated=cached.truncated,
+        )
+        _record(endpoint, result)
+        return result
+
+    model = get_gpt4all_client()
+    first_token_at = None
+    generated = 0
+
+    def on_token(token_id, piece):
+        nonlocal first_token_at, generated
+        if first_token_at is None:
+            first_token_at = time.perf_counter()
+        generated += 1
+        return True
+
+    with _model_lock:
+        model_start = time.perf_counter()
+        queue_wait = model_start - start
+        text = model.generate(prompt, max_tokens=max_tokens, callback=on_token)
+    finished = time.perf_counter()
+
+    decode_time = finished - first_token_at if first_token_at is not None else 0.0
+    result = InferenceResult(
+        text=text,
+        prompt_tokens=prompt_tokens,
+        generated_tokens=generated,
+        tokens_per_second=round(generated / decode_time, 2) if decode_time > 0 else 0.0,
+        time_to_first_token=first_token_at - model_start if first_token_at is not None else None,
+        queue_wait=queue_wait,
+        duration=finished - start,
+        cache_hit=False,
+        truncated=generated >= max_tokens,
+    )
+    _cache.put((prompt, max_tokens), result)
+    _record(endpoint, result)
+    return result
+
+
+def _record(endpoint: str, result: InferenceResult):
+    ai_requests.inc(endpoint=endpoint, cache="hit" if result.cache_hit else "miss")
+    ai_prompt_tokens.observe(result.prompt_tokens, endpoint=endpoint)
+    ai_duration.observe(result.duration, endpoint=endpoint)
+    if result.cache_hit:
+        return
+    ai_generated_tokens.observe(result.generated_tokens, endpoint=endpoint)
+    ai_queue_wait.observe(result.queue_wait, endpoint=endpoint)
+    if result.tokens_per_second:
+        ai_tokens_per_second.observe(result.tokens_per_second, endpoint=endpoint)
+    if result.time_to_first_token is not None:
+        ai_time_to_first_token.observe(result.time_to_first_token, endpoint=endpoint)
@@ -1,7 +1,13 @@
+import logging
 from typing import List, Optional, Dict, Any
 from services.supabase_client import get_supabase_client
+from services.semantic_search import get_semantic_index, lead_document
+from backend.tracing import traced_methods
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+@traced_methods
 class LeadService:
     """Service layer for lead operations."""
     
@@ -15,14 +21,17 @@ class LeadService:
             self._supabase = get_supabase_client()
         return self._supabase
     
-    def get_all_leads(self, user_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all leads for a user, optionally filtered by status."""
+    def get_all_leads(self, user_id: str, status: Optional[str] = None, page=None) -> List[Dict[str, Any]]:
+        """Get all leads for a user, optionally filtered by status and windowed by a pagination.Page."""
         # IMPORTANT: Filter by assigned_to to ensure users only see their own leads
         query = self.supabase.table("leads").select("*").eq("assigned_to", user_id)
         
         if status:
             query = query.eq("status", status)
         
+        if page is not None:
+            query = page.apply(query)
+        
         response = query.execute()
         return response.data
     
@@ -40,6 +49,7 @@ class LeadService:
         lead_data["updated_at"] = datetime.utcnow().isoformat()
         
         response = self.supabase.table("leads").insert(lead_data).execute()
+        self._index_lead(response.data[0])
         return response.data[0]
     
     def update_lead(self, lead_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -47,11 +57,15 @@ class LeadService:
         update_data["updated_at"] = datetime.utcnow().isoformat()
         
         response = self.supabase.table("leads").update(update_data).eq("id", lead_id).execute()
+        if response.data:
+            self._index_lead(response.data[0])
         return response.data[0] if response.data else None
     
     def delete_lead(self, lead_id: str) -> bool:
         """Delete a lead."""
         response = self.supabase.table("leads").delete().eq("id", lead_id).execute()
+        if response.data:
+            self._unindex_lead(lead_id)
         return bool(response.data)
     
     def get_leads_by_status(self, status: str) -> List[Dict[str, Any]]:
@@ -62,3 +76,22 @@ class LeadService:
     def assign_lead(self, lead_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Assign a lead to a user."""
         return self.update_lead(lead_id, {"assigned_to": user_id})
+    
+    def _index_lead(self, lead: Dict[str, Any]):
+        """Keep the semantic search index in step with a written lead."""
+        try:
+            index = get_semantic_index()
+            if index.built:
+                index.upsert(*lead_document(lead))
+        except Exception as e:
+            # Search freshness must never fail the write itself
+            logger.warning("Semantic index update failed for lead %s: %s", lead.get("id"), e)
+    
+    def _unindex_lead(self, lead_id: str):
+        """Drop a deleted lead from the semantic search index."""
+        try:
+            index = get_semantic_index()
+            if index.built:
+                index.delete(f"leads:{lead_id}")
+        except Exception as e:
+            logger.warning("Semantic index delete failed for lead %s: %s", lead_id, e)
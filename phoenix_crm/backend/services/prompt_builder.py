@@ -0,0 +1,269 @@
+"""
+Compact prompt construction with token budgeting for the AI endpoints.
+
+Record data is serialized as short `key: value` lines containing only the
+relevant, non-empty fields instead of Python dict reprs, and every prompt is
+fitted to a token budget by truncating its lowest-priority sections first.
+System instructions live in module constants so the prompt prefix is
+byte-identical across requests and can be reused by backends that cache it.
+"""
+import os
+import math
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+
+# Model context window shared by the prompt and the generated tokens
+CONTEXT_TOKENS = int(os.getenv("AI_CONTEXT_TOKENS", "2048"))
+
+# Generation limit per AI endpoint
+MAX_TOKENS = {"chat": 500, "suggestions": 300, "analyze-lead": 400}
+
+CHAT_SYSTEM_PROMPT = (
+    "You are Phoenix AI, an assistant for car dealership sales reps. "
+    "Answer briefly and practically."
+)
+
+SUGGESTIONS_SYSTEM_PROMPT = (
+    "You are Phoenix AI, an assistant for car dealership sales reps. "
+    "Given a lead and a worksheet, list 3-5 actionable next steps, one per line."
+)
+
+ANALYSIS_SYSTEM_PROMPT = (
+    "You are Phoenix AI, an assistant for car dealership sales reps. "
+    "Analyze the lead and give: 1. Lead quality score (1-10) "
+    "2. Potential challenges 3. Recommended approach."
+)
+
+LEAD_FIELDS = (
+    "first_name", "last_name", "company", "title", "source",
+    "status", "priority", "value", "notes",
+)
+
+WORKSHEET_FIELDS = ("title", "type", "status", "data")
+
+# Fields that never help the model: identifiers and bookkeeping timestamps
+IGNORED_FIELDS = {"id", "user_id", "lead_id", "assigned_to", "created_by", "created_at", "updated_at"}
+
+TRUNCATION_MARKER = "…"
+
+
+def prompt_budget(max_tokens: int) -> int:
+    """Tokens left for the prompt once `max_tokens` are reserved for generation."""
+    return max(64, CONTEXT_TOKENS - max_tokens)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text (about four characters per token)."""
+    if not text:
+        return 0
+    return max(1, math.ceil(len(text) / 4))
+
+
+def compact_fields(data: Optional[Dict[str, Any]], fields: Optional[Iterable[str]] = None) -> str:
+    """Serialize the relevant non-empty fields of a record as `key: value` lines."""
+    if not data:
+        return ""
+    keys = fields if fields is not None else [k for k in data if k not in IGNORED_FIELDS]
+    lines = []
+    for key in keys:
+        value = _compact_value(data.get(key))
+        if value:
+            lines.append(f"{key}: {value}")
+    return "\n".join(lines)
+
+
+def _compact_value(value: Any) -> str:
+    if value is None or value == "" or value == [] or value == {}:
+        return ""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, float):
+        return f"{value:.0f}" if value.is_integer() else f"{value:.2f}"
+    if isinstance(value, dict):
+        parts = []
+        for key, inner in value.items():
+            if key in IGNORED_FIELDS:
+                continue
+            compact = _compact_value(inner)
+            if compact:
+                parts.append(f"{key}={compact}")
+        return ", ".join(parts)
+    if isinstance(value, (list, tuple)):
+        return ", ".join(filter(None, (_compact_value(item) for item in value)))
+    return " ".join(str(value).split())
+
+
+@dataclass
+class PromptSection:
+    """One block of prompt text; lower priority is truncated first."""
+    text: str
+    priority: int = 0
+    label: Optional[str] = None
+
+    def render(self, text: Optional[str] = None) -> str:
+        body = self.text if text is None else text
+        return f"{self.label}:\n{body}" if self.label else body
+
+
+class PromptBuilder:
+    """Assemble a prompt from a static system prefix and prioritized sections."""
+
+    def __init__(self, system_prompt: str, budget: int):
+        self.system_prompt = system_prompt
+        self.budget = budget
+        self.sections: List[PromptSection] = []
+
+    def add(self, text: str, priority: int = 0, label: Optional[str] = None) -> "PromptBuilder":
+        if text and text.strip():
+            self.sections.append(PromptSection(text.strip(), priority, label))
+        return self
+
+    def build(self, suffix: str = "Assistant:") -> str:
+        """Render the prompt, trimming low-priority sections to fit the budget."""
+        fixed = estimate_tokens(self.system_prompt) + estimate_tokens(suffix)
+        # One token per blank-line separator between the rendered parts
+        remaining = self.budget - fixed - (len(self.sections) + 1)
+        rendered: Dict[int, str] = {}
+
+        # Spend the budget on the highest-priority sections first
+        order = sorted(range(len(self.sections)), key=lambda i: -self.sections[i].priority)
+        for i in order:
+            section = self.sections[i]
+            full = section.render()
+            cost = estimate_tokens(full)
+            if cost <= remaining:
+                rendered[i] = full
+                remaining -= cost
+                continue
+            overhead = estimate_tokens(section.render(""))
+            if remaining - overhead > 8:
+                keep_chars = (remaining - overhead) * 4 - len(TRUNCATION_MARKER)
+                rendered[i] = section.render(section.text[:keep_chars].rstrip() + TRUNCATION_MARKER)
+                remaining = 0
+            # Otherwise the section is dropped entirely
+
+        body = "\n\n".join(rendered[i] for i in range(len(self.sections)) if i in rendered)
+        return "\n\n".join(part for part in (self.system_prompt, body, suffix) if part)
+
+
+def build_chat_prompt(message: str, context: str, max_tokens: int) -> str:
+    """Chat prompt; the user's message outranks the free-text context."""
+    return PromptBuilder(CHAT_SYSTEM_PROMPT, prompt_budget(max_tokens)) \
+        .add(context, priority=0, label="Context") \
+        .add(f"User: {message}", priority=1) \
+        .build()
+
+
+def build_suggestions_prompt(lead_data: Dict[str, Any], worksheet_data: Dict[str, Any], max_tokens: int) -> str:
+    """Next-step suggestions prompt; the lead outranks the worksheet."""
+    return PromptBuilder(SUGGESTIONS_SYSTEM_PROMPT, prompt_budget(max_tokens)) \
+        .add(compact_fields(lead_data, LEAD_FIELDS), priority=2, label="Lead") \
+        .add(compact_fields(worksheet_data, WORKSHEET_FIELDS), priority=1, label="Worksheet") \
+        .build(suffix="Suggestions:")
+
+
+def build_analysis_prompt(lead_data: Dict[str, Any], max_tokens: int) -> str:
+    """Lead analysis prompt."""
+    return PromptBuilder(ANALYSIS_SYSTEM_PROMPT, prompt_budget(max_tokens)) \
+        .add(compact_fields(lead_data, LEAD_FIELDS), priority=1, label="Lead") \
+        .build(suffix="Analysis:")
+
+
+# The verbose dict-repr prompts the endpoints sent before the compact builders.
+# They are never sent to the model; PromptStats compares against them to report savings.
+
+def naive_chat_prompt(message: str, context: str) -> str:
+    return f"Context: {context}\n\nUser: {message}\n\nAssistant:"
+
+
+def naive_suggestions_prompt(lead_data: Dict[str, Any], worksheet_data: Dict[str, Any]) -> str:
+    return (
+        "Based on the following lead and worksheet data, provide suggestions for next steps:\n\n"
+        f"Lead Data: {lead_data}\n"
+        f"Worksheet Data: {worksheet_data}\n\n"
+        "Provide 3-5 actionable suggestions:"
+    )
+
+
+def naive_analysis_prompt(lead_data: Dict[str, Any]) -> str:
+    return (
+        "Analyze this lead and provide insights:\n"
+        f"{lead_data}\n\n"
+        "Provide analysis on:\n"
+        "1. Lead quality score (1-10)\n"
+        "2. Potential challenges\n"
+        "3. Recommended approach"
+    )
+
+
+# Endpoint -> (compact builder, baseline builder)
+_PROMPTS = {
+    "chat": (build_chat_prompt, naive_chat_prompt),
+    "suggestions": (build_suggestions_prompt, naive_suggestions_prompt),
+    "analyze-lead": (build_analysis_prompt, naive_analysis_prompt),
+}
+
+
+def build_prompts(endpoint: str, *inputs: Any) -> Tuple[str, str]:
+    """(prompt, naive_prompt) for an AI endpoint, the prompt fitted to its MAX_TOKENS budget."""
+    build, naive = _PROMPTS[endpoint]
+    return build(*inputs, MAX_TOKENS[endpoint]), naive(*inputs)
+
+
+class PromptStats:
+    """Running totals of prompt tokens saved and the latency they are worth.
+
+    Latency savings are estimated from an online least-squares fit of request
+    latency against prompt tokens: the slope is the observed cost of one
+    prompt token, multiplied by the tokens the compact format removed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.naive_tokens = 0
+        self.prompt_tokens = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+        self._timed = 0
+
+    def record(self, naive_prompt: str, prompt: str, latency: Optional[float] = None):
+        naive = estimate_tokens(naive_prompt)
+        actual = estimate_tokens(prompt)
+        with self._lock:
+            self.requests += 1
+            self.naive_tokens += naive
+            self.prompt_tokens += actual
+            if latency is not None:
+                self._timed += 1
+                self._sum_x += actual
+                self._sum_y += latency
+                self._sum_xx += actual * actual
+                self._sum_xy += actual * latency
+
+    def seconds_per_prompt_token(self) -> Optional[float]:
+        n = self._timed
+        denominator = n * self._sum_xx - self._sum_x ** 2
+        if n < 2 or denominator <= 0:
+            return None
+        return max(0.0, (n * self._sum_xy - self._sum_x * self._sum_y) / denominator)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            saved = self.naive_tokens - self.prompt_tokens
+            per_token = self.seconds_per_prompt_token()
+            return {
+                "requests": self.requests,
+                "naive_prompt_tokens": self.naive_tokens,
+                "prompt_tokens": self.prompt_tokens,
+                "prompt_tokens_saved": saved,
+                "saved_ratio": round(saved / self.naive_tokens, 3) if self.naive_tokens else 0.0,
+                "seconds_per_prompt_token": per_token,
+                "estimated_latency_saved_seconds": round(saved * per_token, 3) if per_token is not None else None,
+            }
+
+
+prompt_stats = PromptStats()
@@ -0,0 +1,427 @@
+"""
+Local semantic search over lead notes and training materials.
+
+Documents are embedded on the CPU (no network calls) and stored as rows of a
+memory-mapped float32 matrix, so the index survives restarts and only the
+pages touched by a query are read. Writes are incremental: each upsert or
+delete overwrites one row and appends one line to a metadata journal.
+
+Several server workers may share one index directory. Every operation holds
+an flock on the directory's lock file (shared for searches, exclusive for
+writes) and first replays the journal lines other processes appended since
+it last looked, so all workers allocate rows from the same view and see each
+other's documents. A rebuild writes a new generation token, which makes the
+other workers reload from scratch.
+"""
+import os
+import re
+import logging
+import json
+import zlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no fork, so a single process owns the index
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIM = 256
+INITIAL_CAPACITY = 1024
+# Part of the file names; bumped when the meaning of stored entries changes, forcing a rebuild
+INDEX_FORMAT = 2
+
+# Owner for documents every user may see (published training material)
+PUBLIC = "*"
+# Owner code of PUBLIC documents
+PUBLIC_OWNER = 0
+# Owner code marking an empty row
+NO_OWNER = -1
+# Owner code of documents nobody may see, e.g. unassigned leads
+UNOWNED = -2
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedder:
+    """Feature-hashing embedder over words, word bigrams and character trigrams.
+
+    Character trigrams let "financing" match "finance" without a vocabulary,
+    and hashing keeps the embedder stateless so documents can be added one at
+    a time without refitting anything.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        words = _TOKEN_RE.findall((text or "").lower())
+        if not words:
+            return vector
+
+        for word in words:
+            index, sign = self._slot("w:" + word)
+            vector[index] += 2.0 * sign
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                index, sign = self._slot("c:" + padded[i:i + 3])
+                vector[index] += sign
+        for first, second in zip(words, words[1:]):
+            index, sign = self._slot(f"b:{first} {second}")
+            vector[index] += sign
+
+        # Sublinear term frequency, then unit length for cosine similarity
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embed_many(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed(text) for text in texts])
+
+    @lru_cache(maxsize=200_000)
+    def _slot(self, feature: str) -> Tuple[int, float]:
+        digest = zlib.crc32(feature.encode("utf-8"))
+        return digest % self.dim, (1.0 if digest & 0x80000000 else -1.0)
+
+
+class SentenceTransformerEmbedder:
+    """Embedder backed by a sentence-transformers model loaded from local disk."""
+
+    def __init__(self, model_path: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_path, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return self.model.encode(texts, normalize_embeddings=True).astype(np.float32)
+
+
+class SemanticIndex:
+    """Memory-mapped embedding index with top-k cosine retrieval."""
+
+    def __init__(self, index_dir: str, embedder=None):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.embedder = embedder or HashingEmbedder()
+        self.dim = self.embedder.dim
+
+        self._lock = threading.RLock()
+        # The format and dimension are part of the file names so switching embedders never misreads rows
+        self._vectors_path = self.index_dir / f"vectors-v{INDEX_FORMAT}-{self.dim}.f32"
+        self._journal_path = self.index_dir / f"journal-v{INDEX_FORMAT}-{self.dim}.jsonl"
+        self._built_marker = self.index_dir / f"built-v{INDEX_FORMAT}-{self.dim}"
+        self._lock_path = self.index_dir / f"lock-v{INDEX_FORMAT}-{self.dim}"
+        self._generation_path = self.index_dir / f"generation-v{INDEX_FORMAT}-{self.dim}"
+
+        self._doc_rows: Dict[str, int] = {}
+        self._row_docs: List[Optional[str]] = []
+        self._owner_codes: Dict[str, int] = {}
+        self._kind_codes: Dict[str, int] = {}
+        self._owners = np.zeros(0, dtype=np.int32)
+        self._kinds = np.zeros(0, dtype=np.int16)
+        self._free_rows: List[int] = []
+        self._vectors: Optional[np.memmap] = None
+        # How far this process has read the journal, and which build it belongs to
+        self._journal_pos = 0
+        self._generation: Optional[str] = None
+
+        with self._locked(exclusive=False, sync=False):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._doc_rows)
+
+    @property
+    def built(self) -> bool:
+        """True once a full build has populated the index."""
+        return self._built_marker.exists()
+
+    def upsert(self, doc_id: str, text: str, owner: Optional[str] = None):
+        """Add or replace one document."""
+        self.upsert_many([(doc_id, text, owner)])
+
+    def upsert_many(self, docs: List[Tuple[str, str, Optional[str]]]):
+        """Add or replace documents given as (doc_id, text, owner) tuples.
+
+        An owner of PUBLIC makes the document visible to everyone; None makes
+        it visible to no one.
+        """
+        if not docs:
+            return
+        vectors = self.embedder.embed_many([text or "" for _, text, _ in docs])
+
+        with self._locked(exclusive=True):
+            self._write(docs, vectors)
+
+    def _write(self, docs: List[Tuple[str, str, Optional[str]]], vectors: np.ndarray):
+        entries = []
+        for (doc_id, _, owner), vector in zip(docs, vectors):
+            row = self._doc_rows.get(doc_id)
+            if row is None:
+                row = self._allocate_row()
+            self._vectors[row] = vector
+            self._assign(row, doc_id, owner)
+            entries.append({"row": row, "doc": doc_id, "owner": owner})
+        self._vectors.flush()
+        self._append_journal(entries)
+
+    def delete(self, doc_id: str):
+        """Remove a document from the index."""
+        with self._locked(exclusive=True):
+            row = self._doc_rows.pop(doc_id, None)
+            if row is None:
+                return
+            self._vectors[row] = 0.0
+            self._clear_row(row)
+            self._free_rows.append(row)
+            self._vectors.flush()
+            self._append_journal([{"row": row, "doc": doc_id, "deleted": True}])
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        owner: Optional[str] = None,
+        kind: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the top-k documents by cosine similarity.
+
+        Only public documents and documents belonging to `owner` are
+        considered. `kind` restricts results to one document kind,
+        e.g. "leads" or "training".
+        """
+        query_vector = self.embedder.embed(query)
+        if not np.any(query_vector):
+            return []
+
+        with self._locked(exclusive=False):
+            count = len(self._row_docs)
+            if count == 0:
+                return []
+            scores = np.asarray(self._vectors[:count] @ query_vector)
+
+            allowed = self._owners[:count] == PUBLIC_OWNER
+            owner_code = self._owner_codes.get(owner) if owner else None
+            if owner_code is not None:
+                allowed |= self._owners[:count] == owner_code
+            if kind:
+                allowed &= self._kinds[:count] == self._kind_codes.get(kind, -1)
+            scores = np.where(allowed, scores, -np.inf)
+
+            k = min(k, count)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            results = []
+            for row in top:
+                score = float(scores[row])
+                doc_id = self._row_docs[row]
+                if score <= 0 or doc_id is None:
+                    continue
+                doc_kind, _, source_id = doc_id.partition(":")
+                results.append({"id": source_id, "kind": doc_kind, "score": round(score, 4)})
+            return results
+
+    def rebuild(self, docs: List[Tuple[str, str, Optional[str]]]):
+        """Replace the whole index and compact the journal."""
+        vectors = self.embedder.embed_many([text or "" for _, text, _ in docs])
+        with self._locked(exclusive=True, sync=False):
+            self._vectors = None
+            for path in (self._vectors_path, self._journal_path, self._built_marker):
+                if path.exists():
+                    path.unlink()
+            self._reset_state()
+            self._journal_pos = 0
+            self._open_vectors(max(INITIAL_CAPACITY, len(docs)))
+            if docs:
+                self._write(docs, vectors)
+            self._generation = os.urandom(8).hex()
+            self._generation_path.write_text(self._generation)
+            self._built_marker.touch()
+
+    @contextmanager
+    def _locked(self, exclusive: bool, sync: bool = True):
+        """Hold the thread lock and the cross-process file lock, caught up with other processes' writes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            # Opened per call: a descriptor inherited across fork would share its lock with the parent
+            with open(self._lock_path, "a") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    if sync:
+                        self._sync()
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _sync(self):
+        """Catch up with writes made by other processes since this one last looked."""
+        if self._read_generation() != self._generation:
+            self._load()
+            return
+        self._replay_journal()
+        if self._vectors_path.exists():
+            rows_on_disk = self._vectors_path.stat().st_size // (4 * self.dim)
+            if rows_on_disk > self._vectors.shape[0]:
+                self._open_vectors(rows_on_disk)
+
+    def _read_generation(self) -> Optional[str]:
+        try:
+            return self._generation_path.read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _load(self):
+        self._reset_state()
+        self._generation = self._read_generation()
+        self._journal_pos = 0
+        capacity = INITIAL_CAPACITY
+        if self._vectors_path.exists():
+            capacity = max(capacity, self._vectors_path.stat().st_size // (4 * self.dim))
+        self._open_vectors(capacity)
+        self._replay_journal()
+
+    def _replay_journal(self):
+        """Apply the complete journal lines past self._journal_pos."""
+        if not self._journal_path.exists():
+            return
+        with open(self._journal_path, "rb") as journal:
+            journal.seek(self._journal_pos)
+            data = journal.read()
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            row = entry["row"]
+            while len(self._row_docs) <= row:
+                self._row_docs.append(None)
+            self._grow_row_arrays(len(self._row_docs))
+            if entry.get("deleted"):
+                if self._doc_rows.get(entry["doc"]) == row:
+                    del self._doc_rows[entry["doc"]]
+                self._clear_row(row)
+            else:
+                self._assign(row, entry["doc"], entry.get("owner"))
+        self._journal_pos += end
+        self._free_rows = [row for row, doc in enumerate(self._row_docs) if doc is None]
+
+    def _reset_state(self):
+        self._doc_rows = {}
+        self._row_docs = []
+        self._owner_codes = {}
+        self._kind_codes = {}
+        self._owners = np.zeros(0, dtype=np.int32)
+        self._kinds = np.zeros(0, dtype=np.int16)
+        self._free_rows = []
+
+    def _open_vectors(self, capacity: int):
+        mode = "r+" if self._vectors_path.exists() else "w+"
+        if mode == "r+" and self._vectors_path.stat().st_size < capacity * self.dim * 4:
+            # np.memmap cannot grow an existing file in r+ mode, so extend it first
+            with open(self._vectors_path, "r+b") as handle:
+                handle.truncate(capacity * self.dim * 4)
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode=mode, shape=(capacity, self.dim))
+
+    def _allocate_row(self) -> int:
+        if self._free_rows:
+            return self._free_rows.pop()
+        row = len(self._row_docs)
+        if row >= self._vectors.shape[0]:
+            self._vectors.flush()
+            self._open_vectors(self._vectors.shape[0] * 2)
+        self._row_docs.append(None)
+        self._grow_row_arrays(len(self._row_docs))
+        return row
+
+    def _grow_row_arrays(self, size: int):
+        if size > len(self._owners):
+            capacity = max(size, 2 * len(self._owners), INITIAL_CAPACITY)
+            owners = np.full(capacity, NO_OWNER, dtype=np.int32)
+            owners[:len(self._owners)] = self._owners
+            kinds = np.full(capacity, -1, dtype=np.int16)
+            kinds[:len(self._kinds)] = self._kinds
+            self._owners, self._kinds = owners, kinds
+
+    def _assign(self, row: int, doc_id: str, owner: Optional[str]):
+        previous = self._doc_rows.get(doc_id)
+        if previous is not None and previous != row:
+            self._clear_row(previous)
+        self._doc_rows[doc_id] = row
+        self._row_docs[row] = doc_id
+        if owner == PUBLIC:
+            self._owners[row] = PUBLIC_OWNER
+        elif owner is None:
+            self._owners[row] = UNOWNED
+        else:
+            self._owners[row] = self._owner_codes.setdefault(owner, len(self._owner_codes) + 1)
+        kind = doc_id.partition(":")[0]
+        self._kinds[row] = self._kind_codes.setdefault(kind, len(self._kind_codes))
+
+    def _clear_row(self, row: int):
+        self._row_docs[row] = None
+        self._owners[row] = NO_OWNER
+        self._kinds[row] = -1
+
+    def _append_journal(self, entries: List[Dict[str, Any]]):
+        with open(self._journal_path, "ab") as journal:
+            journal.write("".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries).encode("utf-8"))
+            # Everything up to here is already in memory; _sync only replays other processes' lines
+            self._journal_pos = journal.tell()
+
+
+def lead_document(lead: Dict[str, Any]) -> Tuple[str, str, Optional[str]]:
+    """Index entry for a lead: its notes plus enough context to match on.
+
+    Only the assigned user finds the lead; an unassigned lead is hidden from everyone.
+    """
+    text = " ".join(
+        str(lead.get(field) or "")
+        for field in ("first_name", "last_name", "company", "title", "notes")
+    )
+    return f"leads:{lead['id']}", text, lead.get("assigned_to")
+
+
+def training_document(item: Dict[str, Any]) -> Tuple[str, str, Optional[str]]:
+    """Index entry for a training item, visible to every user."""
+    text = " ".join(str(item.get(field) or "") for field in ("title", "category", "description"))
+    return f"training:{item['id']}", text, PUBLIC
+
+
+def _create_embedder():
+    """Use a local sentence-transformers model if configured, else feature hashing."""
+    model_path = os.getenv("SEMANTIC_MODEL_PATH")
+    if model_path:
+        try:
+            return SentenceTransformerEmbedder(model_path)
+        except ImportError:
+            logger.warning("sentence-transformers not installed, falling back to hashing embedder")
+    return HashingEmbedder(int(os.getenv("SEMANTIC_INDEX_DIM", DEFAULT_DIM)))
+
+
+@lru_cache()
+def get_semantic_index() -> SemanticIndex:
+    index_dir = os.getenv(
+        "SEMANTIC_INDEX_DIR",
+        str(Path(__file__).resolve().parent.parent / "data" / "semantic_index"),
+    )
+    return SemanticIndex(index_dir, embedder=_create_embedder())
@@ -1,14 +1,7 @@
-from supabase import create_client, Client
-import os
-from functools import lru_cache
+from supabase import Client
+from backend.database import get_supabase_client as _get_shared_client
 
-@lru_cache()
 def get_supabase_client() -> Client:
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
-    
-    if not url or not key:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
-    
-    supabase = create_client(url, key)
-    return supabase
+    # One shared client for routers and services, so a fake installed with
+    # backend.database.set_supabase_client is seen everywhere
+    return _get_shared_client()
@@ -1,7 +1,9 @@
 from typing import List, Optional, Dict, Any
 from services.supabase_client import get_supabase_client
+from backend.tracing import traced_methods
 from datetime import datetime
 
+@traced_methods
 class UserService:
     """Service layer for user operations."""
     
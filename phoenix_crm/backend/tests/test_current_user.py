@@ -0,0 +1,38 @@
+"""
+Token verification tests: an auth outage is a 503, only a rejected token is a 401
+"""
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir.parent) not in sys.path:
+    sys.path.insert(0, str(backend_dir.parent))
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from supabase_auth.errors import AuthApiError, AuthRetryableError
+
+from backend.api import auth
+
+
+def _status_when_get_user_raises(monkeypatch, error):
+    def get_user(token):
+        raise error
+
+    client = SimpleNamespace(auth=SimpleNamespace(get_user=get_user))
+    monkeypatch.setattr(auth, "get_supabase_client", lambda: client)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(auth.get_current_user(credentials))
+    return raised.value.status_code
+
+
+def test_auth_outage_is_service_unavailable(monkeypatch):
+    assert _status_when_get_user_raises(monkeypatch, AuthRetryableError("auth unreachable", 0)) == 503
+
+
+def test_rejected_token_is_unauthorized(monkeypatch):
+    assert _status_when_get_user_raises(monkeypatch, AuthApiError("invalid JWT", 401, "bad_jwt")) == 401
@@ -0,0 +1,69 @@
+"""
+Lead scoring tests: ranking order, stable ties and timezone handling
+"""
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+for path in (backend_dir, backend_dir.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import pytest
+
+from services.lead_scoring import LeadScorer
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _lead(lead_id, **fields):
+    return {"id": lead_id, "updated_at": NOW.isoformat(), **fields}
+
+
+def test_rank_puts_the_most_promising_lead_first():
+    leads = [
+        _lead("cold", value=1_000, priority="low", status="new", source="cold_call"),
+        _lead("hot", value=90_000, priority="high", status="negotiation", source="referral"),
+        _lead("warm", value=20_000, priority="medium", status="qualified", source="website"),
+    ]
+    ranked = LeadScorer().rank(leads, now=NOW)
+    assert [lead["id"] for lead in ranked] == ["hot", "warm", "cold"]
+    assert ranked[0]["score"] > ranked[1]["score"] > ranked[2]["score"]
+    assert all(1.0 <= lead["score"] <= 10.0 for lead in ranked)
+
+
+def test_closed_leads_rank_below_open_ones():
+    leads = [_lead("won", status="won", priority="high"), _lead("open", status="proposal", priority="high")]
+    assert [lead["id"] for lead in LeadScorer().rank(leads, now=NOW)] == ["open", "won"]
+
+
+def test_ties_keep_their_original_order():
+    leads = [_lead(str(i), status="new") for i in range(5)]
+    assert [lead["id"] for lead in LeadScorer().rank(leads, now=NOW)] == ["0", "1", "2", "3", "4"]
+
+
+def test_rank_does_not_modify_the_input():
+    leads = [_lead("1", status="new")]
+    LeadScorer().rank(leads, now=NOW)
+    assert "score" not in leads[0]
+
+
+def test_recent_activity_outranks_stale_leads():
+    stale = _lead("stale", status="contacted")
+    stale["updated_at"] = (NOW - timedelta(days=90)).isoformat()
+    fresh = _lead("fresh", status="contacted")
+    assert [lead["id"] for lead in LeadScorer().rank([stale, fresh], now=NOW)] == ["fresh", "stale"]
+
+
+def test_aware_and_naive_timestamps_score_the_same():
+    naive = _lead("naive", status="new")
+    aware = _lead("aware", status="new", updated_at="2026-03-01T14:00:00+02:00")
+    zulu = _lead("zulu", status="new", updated_at="2026-03-01T12:00:00Z")
+    scores = LeadScorer().score([naive, aware, zulu], now=NOW.replace(tzinfo=timezone.utc))
+    assert scores[0] == scores[1] == scores[2]
+
+
+def test_unknown_weights_are_rejected():
+    with pytest.raises(ValueError):
+        LeadScorer(weights={"shoe_size": 1.0})
@@ -0,0 +1,63 @@
+"""
+Metrics tests: workers sharing a snapshot directory render the same totals
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir.parent) not in sys.path:
+    sys.path.insert(0, str(backend_dir.parent))
+
+from backend.metrics import Registry, SharedMetrics
+
+
+def _worker(path):
+    # Each Registry stands in for one forked worker's registry
+    registry = Registry()
+    metrics = (
+        registry.counter("requests_total", "Requests", ["route"]),
+        registry.gauge("in_flight", "In flight"),
+        registry.gauge("breaker", "Breaker", multiprocess_mode="max"),
+        registry.histogram("duration_seconds", "Duration", buckets=(0.1, 1.0)),
+    )
+    registry._shared = SharedMetrics(registry, str(path))
+    return registry, metrics
+
+
+def test_workers_render_the_sum_of_all_workers(tmp_path):
+    first, (requests, in_flight, breaker, duration) = _worker(tmp_path)
+    second, (requests_2, in_flight_2, breaker_2, duration_2) = _worker(tmp_path)
+    requests.inc(route="/a")
+    requests_2.inc(2, route="/a")
+    in_flight.set(1)
+    in_flight_2.set(3)
+    breaker_2.set(2)
+    duration.observe(0.05)
+    duration_2.observe(0.5)
+    second._shared.write()
+
+    rendered = first.render()
+    assert rendered == second.render()
+    assert 'requests_total{route="/a"} 3' in rendered
+    assert "in_flight 4" in rendered
+    assert "breaker 2" in rendered
+    assert 'duration_seconds_bucket{le="0.1"} 1' in rendered
+    assert "duration_seconds_count 2" in rendered
+
+
+def test_exited_workers_keep_their_counts_but_not_their_gauges(tmp_path):
+    first, (requests, in_flight, _, _) = _worker(tmp_path)
+    second, (requests_2, in_flight_2, _, _) = _worker(tmp_path)
+    requests.inc(route="/a")
+    requests_2.inc(route="/a")
+    in_flight.set(1)
+    in_flight_2.set(5)
+    # A pid that cannot belong to a running process
+    second._shared.file = str(tmp_path / "worker-999999999-1.json")
+    second._shared.write()
+
+    rendered = first.render()
+    assert 'requests_total{route="/a"} 2' in rendered
+    assert "in_flight 1" in rendered
+    assert not Path(second._shared.file).exists()
+    assert 'requests_total{route="/a"} 2' in first.render()
@@ -0,0 +1,82 @@
+"""
+Pagination tests: Page windows and ordering, and the leads endpoint's order/sort rules
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+for path in (backend_dir, backend_dir.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from backend.api import leads
+from backend.api.auth import get_current_user
+from backend.pagination import Page, pagination
+
+
+class _Query:
+    """Records the calls Page.apply makes on a table query."""
+
+    def __init__(self):
+        self.calls = []
+
+    def order(self, column, desc=False):
+        self.calls.append(("order", column, desc))
+        return self
+
+    def range(self, start, end):
+        self.calls.append(("range", start, end))
+        return self
+
+    def offset(self, offset):
+        self.calls.append(("offset", offset))
+        return self
+
+
+def test_apply_orders_then_windows():
+    query = Page(limit=10, offset=20, column="created_at", desc=True).apply(_Query())
+    assert query.calls == [("order", "created_at", True), ("range", 20, 29)]
+
+
+def test_apply_without_limit_only_skips():
+    assert Page(limit=None, offset=5, column=None, desc=False).apply(_Query()).calls == [("offset", 5)]
+    assert Page(limit=None, offset=0, column=None, desc=False).apply(_Query()).calls == []
+
+
+def test_slice_matches_apply():
+    rows = list(range(10))
+    assert Page(limit=3, offset=2, column=None, desc=False).slice(rows) == [2, 3, 4]
+    assert Page(limit=None, offset=8, column=None, desc=False).slice(rows) == [8, 9]
+    assert Page(limit=5, offset=20, column=None, desc=False).slice(rows) == []
+
+
+def test_dependency_parses_direction_and_rejects_unknown_columns():
+    dependency = pagination("-created_at", ("created_at", "title"))
+    assert dependency(limit=None, offset=0, order="-created_at") == Page(None, 0, "created_at", True)
+    assert dependency(limit=5, offset=0, order="title") == Page(5, 0, "title", False)
+    assert dependency(limit=None, offset=0, order=None) == Page(None, 0, None, False)
+    with pytest.raises(HTTPException) as raised:
+        dependency(limit=None, offset=0, order="password")
+    assert raised.value.status_code == 422
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(leads.router)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1", "email": "u1@example.com"}
+    return TestClient(app)
+
+
+def test_order_cannot_be_combined_with_score_sort(client):
+    response = client.get("/api/leads/", params={"sort": "score", "order": "-created_at"})
+    assert response.status_code == 422
+    assert "sort=score" in response.json()["detail"]
+
+
+def test_unknown_sort_is_rejected(client):
+    assert client.get("/api/leads/", params={"sort": "value"}).status_code == 422
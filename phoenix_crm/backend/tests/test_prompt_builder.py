@@ -0,0 +1,59 @@
+"""
+Prompt builder tests: compact serialisation and the token budget
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+for path in (backend_dir, backend_dir.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from services.prompt_builder import (
+    CHAT_SYSTEM_PROMPT, MAX_TOKENS, TRUNCATION_MARKER, PromptBuilder, build_prompts, compact_fields,
+    estimate_tokens, prompt_budget,
+)
+
+
+def test_compact_fields_skips_empty_and_bookkeeping_fields():
+    lead = {"id": "1", "first_name": "Dana", "company": "", "value": 25000.0, "created_at": "2026-01-01",
+            "notes": "  wants   a\nquote "}
+    assert compact_fields(lead) == "first_name: Dana\nvalue: 25000\nnotes: wants a quote"
+
+
+def test_sections_fitting_the_budget_are_kept_whole():
+    prompt = PromptBuilder("System.", budget=100).add("short context", label="Context").add("User: hi", 1).build()
+    assert prompt == "System.\n\nContext:\nshort context\n\nUser: hi\n\nAssistant:"
+
+
+def test_low_priority_sections_are_truncated_first():
+    prompt = PromptBuilder("System.", budget=60) \
+        .add("x" * 1000, priority=0, label="Context") \
+        .add("User: keep me", priority=1) \
+        .build()
+    assert estimate_tokens(prompt) <= 60
+    assert "User: keep me" in prompt
+    assert TRUNCATION_MARKER in prompt
+
+
+def test_sections_without_room_are_dropped():
+    prompt = PromptBuilder("System.", budget=12).add("y" * 400, label="Context").add("User: hi", 1).build()
+    assert "Context" not in prompt
+    assert "User: hi" in prompt
+
+
+def test_endpoint_prompts_stay_within_budget_and_keep_the_system_prefix():
+    prompt, naive_prompt = build_prompts("chat", "What next?", "history " * 5000)
+    assert estimate_tokens(prompt) <= prompt_budget(MAX_TOKENS["chat"])
+    assert prompt.startswith(CHAT_SYSTEM_PROMPT)
+    assert "User: What next?" in prompt
+    assert estimate_tokens(naive_prompt) > estimate_tokens(prompt)
+
+
+def test_lead_prompts_leave_out_identifiers_and_timestamps():
+    lead = {"id": "1", "first_name": "Dana", "company": "Acme", "status": "new",
+            "created_at": "2026-01-01T00:00:00", "updated_at": "2026-01-02T00:00:00", "assigned_to": "u1"}
+    prompt, naive_prompt = build_prompts("analyze-lead", lead)
+    assert "first_name: Dana" in prompt
+    assert "assigned_to" not in prompt and "2026" not in prompt
+    assert "assigned_to" in naive_prompt
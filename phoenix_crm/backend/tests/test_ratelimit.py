@@ -0,0 +1,57 @@
+"""
+Rate limiting tests: token buckets, concurrency caps and their split between workers
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir.parent) not in sys.path:
+    sys.path.insert(0, str(backend_dir.parent))
+
+from backend.ratelimit import ConcurrencyCaps, Limit, MemoryBuckets
+
+
+def _allowed(buckets, limit, attempts):
+    async def take_all():
+        return [await buckets.take("read:ip:1", limit) for _ in range(attempts)]
+    return sum(1 for wait in asyncio.run(take_all()) if wait == 0)
+
+
+def test_workers_each_enforce_their_share_of_the_limit():
+    assert _allowed(MemoryBuckets(workers=4), Limit(rate=0.01, burst=8), 10) == 2
+
+
+def test_caps_are_split_between_workers_but_never_below_one():
+    caps = ConcurrencyCaps({"supabase": 64, "gpt4all": 2}, workers=4)
+    assert caps.caps == {"supabase": 16, "gpt4all": 1}
+
+
+def test_bucket_allows_its_burst_then_reports_the_wait():
+    buckets = MemoryBuckets()
+    limit = Limit(rate=2, burst=3)
+    assert _allowed(buckets, limit, 3) == 3
+
+    async def take():
+        return await buckets.take("read:ip:1", limit)
+    assert 0 < asyncio.run(take()) <= 0.5
+
+
+def test_buckets_are_per_key():
+    buckets = MemoryBuckets()
+    limit = Limit(rate=0.01, burst=1)
+
+    async def take(key):
+        return await buckets.take(key, limit)
+    assert asyncio.run(take("read:ip:1")) == 0
+    assert asyncio.run(take("read:ip:1")) > 0
+    assert asyncio.run(take("read:ip:2")) == 0
+
+
+def test_caps_shed_beyond_the_limit_until_a_slot_is_released():
+    caps = ConcurrencyCaps({"gpt4all": 2})
+    assert caps.try_acquire("gpt4all") and caps.try_acquire("gpt4all")
+    assert not caps.try_acquire("gpt4all")
+    caps.release("gpt4all")
+    assert caps.try_acquire("gpt4all")
+    assert caps.try_acquire("uncapped")
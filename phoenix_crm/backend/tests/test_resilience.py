@@ -0,0 +1,175 @@
+"""
+Resilience tests: error classification, circuit breakers, retries and the stale cache
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir.parent) not in sys.path:
+    sys.path.insert(0, str(backend_dir.parent))
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+from supabase_auth.errors import AuthApiError, AuthRetryableError
+
+from backend import resilience
+from backend.resilience import (
+    CircuitBreaker, CircuitOpenError, StaleCache, breaker_for, is_transient, request_outcome, resilient_call,
+)
+
+
+def _api_error(code):
+    return APIError({"message": "failed", "code": code})
+
+
+@pytest.mark.parametrize("error", [
+    httpx.ConnectError("refused"),
+    TimeoutError(),
+    AuthRetryableError("auth unreachable", 0),
+    _api_error("08006"),
+    _api_error("53300"),
+    _api_error("57014"),
+    _api_error("PGRST000"),
+    _api_error("PGRST001"),
+    _api_error("PGRST002"),
+    _api_error("PGRST003"),
+    _api_error(502),
+    _api_error(503),
+    _api_error(504),
+    _api_error("503"),
+])
+def test_transient_errors(error):
+    assert is_transient(error)
+
+
+@pytest.mark.parametrize("error", [
+    AuthApiError("invalid JWT", 401, "bad_jwt"),
+    ValueError("bad input"),
+    _api_error("42703"),
+    _api_error("PGRST116"),
+    _api_error("PGRST301"),
+    _api_error(400),
+    _api_error(500),
+    _api_error(530),
+    _api_error("530"),
+    _api_error(None),
+])
+def test_permanent_errors(error):
+    assert not is_transient(error)
+
+
+def test_stale_cache_is_not_affected_by_mutating_responses():
+    cache = StaleCache()
+    response = SimpleNamespace(data=[{"id": 1, "status": "new"}])
+    cache.put("leads", response)
+    response.data[0]["status"] = "mutated"
+
+    _, served = cache.get("leads")
+    assert served.data == [{"id": 1, "status": "new"}]
+    served.data.append({"id": 2})
+    assert cache.get("leads")[1].data == [{"id": 1, "status": "new"}]
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(resilience, "_backoff", lambda attempt: 0.0)
+
+
+def _failing(error, calls):
+    def call():
+        calls.append(1)
+        raise error
+    return call
+
+
+def test_breaker_opens_after_threshold_and_closes_after_a_good_probe(monkeypatch):
+    breaker = CircuitBreaker("test", "breaker", failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    # Once the reset timeout has passed a single probe is let through
+    monkeypatch.setattr(breaker, "opened_at", breaker.opened_at - 11)
+    assert breaker.allow() and breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_failed_probe_reopens_the_breaker(monkeypatch):
+    breaker = CircuitBreaker("test", "probe", failure_threshold=5, reset_timeout=10)
+    for _ in range(5):
+        breaker.record_failure()
+    monkeypatch.setattr(breaker, "opened_at", breaker.opened_at - 11)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_idempotent_calls_are_retried_on_transient_errors(no_backoff):
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise httpx.ConnectError("refused")
+        return "ok"
+
+    assert resilient_call("test", "retry", flaky, idempotent=True) == "ok"
+    assert len(attempts) == 2
+
+
+def test_permanent_errors_are_not_retried_and_leave_the_breaker_closed(no_backoff):
+    calls = []
+    with pytest.raises(APIError):
+        resilient_call("test", "permanent", _failing(_api_error("42703"), calls), idempotent=True)
+    assert len(calls) == 1
+    assert breaker_for("test", "permanent").state == "closed"
+
+
+def test_writes_are_not_retried(no_backoff):
+    calls = []
+    with pytest.raises(httpx.ConnectError):
+        resilient_call("test", "write", _failing(httpx.ConnectError("refused"), calls))
+    assert len(calls) == 1
+
+
+def test_failed_reads_fall_back_to_the_last_good_response(no_backoff):
+    token = request_outcome.set({})
+    try:
+        good = SimpleNamespace(data=[{"id": 1}])
+        assert resilient_call("test", "stale", lambda: good, idempotent=True, cache_key="stale-key") is good
+        served = resilient_call("test", "stale", _failing(httpx.ConnectError("refused"), []), idempotent=True,
+                                cache_key="stale-key")
+        assert served.data == [{"id": 1}]
+        assert len(request_outcome.get()["stale_ages"]) == 1
+    finally:
+        request_outcome.reset(token)
+
+
+def test_open_breaker_fails_fast_without_a_cached_response(no_backoff):
+    breaker = breaker_for("test", "open")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        resilient_call("test", "open", _failing(httpx.ConnectError("refused"), calls), idempotent=True)
+    assert calls == []
+
+
+def test_stale_cache_expires_and_skips_oversized_responses(monkeypatch):
+    cache = StaleCache(size=2, max_age=60, max_rows=2)
+    cache.put("big", SimpleNamespace(data=[1, 2, 3]))
+    assert cache.get("big") is None
+
+    cache.put("a", SimpleNamespace(data=[1]))
+    cache.put("b", SimpleNamespace(data=[2]))
+    cache.put("c", SimpleNamespace(data=[3]))
+    assert cache.get("a") is None and cache.get("c") is not None
+
+    now = resilience.time.monotonic()
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now + 61)
+    assert cache.get("c") is None
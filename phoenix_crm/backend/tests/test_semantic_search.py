@@ -0,0 +1,62 @@
+"""
+Visibility tests for the semantic index: users only find their own leads and public training
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from services.semantic_search import SemanticIndex, lead_document, training_document
+
+
+def _lead(lead_id, assigned_to):
+    return {"id": lead_id, "first_name": "Dana", "company": "Acme", "notes": "asked about financing",
+            "assigned_to": assigned_to}
+
+
+def _index(tmp_path):
+    index = SemanticIndex(str(tmp_path))
+    index.rebuild([
+        lead_document(_lead("1", "u1")),
+        lead_document(_lead("2", None)),
+        training_document({"id": "t1", "title": "Financing basics", "category": "sales"}),
+    ])
+    return index
+
+
+def _found(index, owner):
+    return {(hit["kind"], hit["id"]) for hit in index.search("financing", k=10, owner=owner)}
+
+
+def test_owner_sees_own_lead_and_public_training(tmp_path):
+    assert _found(_index(tmp_path), "u1") == {("leads", "1"), ("training", "t1")}
+
+
+def test_other_user_sees_neither_foreign_nor_unassigned_leads(tmp_path):
+    assert _found(_index(tmp_path), "u2") == {("training", "t1")}
+
+
+def test_visibility_survives_reload(tmp_path):
+    _index(tmp_path)
+    reloaded = SemanticIndex(str(tmp_path))
+    assert _found(reloaded, "u2") == {("training", "t1")}
+    assert _found(reloaded, "u1") == {("leads", "1"), ("training", "t1")}
+
+
+def test_workers_sharing_a_directory_see_each_others_writes(tmp_path):
+    # Two instances on one directory stand in for two forked server workers
+    first = _index(tmp_path)
+    second = SemanticIndex(str(tmp_path))
+    first.upsert(*lead_document(_lead("3", "u2")))
+    second.upsert(*lead_document(_lead("4", "u2")))
+
+    # Rows were allocated from one shared view, so neither write overwrote the other
+    assert _found(first, "u2") == _found(second, "u2") == {("leads", "3"), ("leads", "4"), ("training", "t1")}
+
+    second.delete("leads:3")
+    assert _found(first, "u2") == {("leads", "4"), ("training", "t1")}
+
+    first.rebuild([lead_document(_lead("5", "u2"))])
+    assert _found(second, "u2") == {("leads", "5")}
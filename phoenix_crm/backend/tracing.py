@@ -0,0 +1,270 @@
+"""
+Lightweight distributed tracing with W3C trace-context propagation
+
+Spans are kept in a context variable, so they nest across awaits and follow
+work into run_in_threadpool. Finished spans are batched on a background
+thread and exported as OTLP/HTTP JSON to OTEL_EXPORTER_OTLP_ENDPOINT. If
+TRACE_FILE is set, batches the collector did not take (or every batch, when
+there is no collector) are appended to it, one OTLP export request per line,
+for offline analysis. The file is rotated to TRACE_FILE.1 once it passes
+TRACE_FILE_MAX_BYTES. With neither a collector nor a file, spans are not
+recorded at all; trace IDs are still propagated.
+
+Configuration (environment):
+    TRACING_ENABLED               default true
+    TRACE_SAMPLE_RATE             fraction of new traces recorded, default 1.0
+    OTEL_EXPORTER_OTLP_ENDPOINT   collector base URL, e.g. http://localhost:4318
+    OTEL_SERVICE_NAME             default phoenix-crm-api
+    TRACE_FILE                    opt-in local span file, e.g. backend/data/traces.jsonl
+    TRACE_FILE_MAX_BYTES          rotation size of TRACE_FILE, default 50 MB
+"""
+import os
+import re
+import json
+import time
+import queue
+import random
+import atexit
+import inspect
+import logging
+import functools
+import threading
+import contextvars
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() in ("1", "true", "yes")
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "").rstrip("/")
+SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "phoenix-crm-api")
+TRACE_FILE = Path(os.environ["TRACE_FILE"]) if os.getenv("TRACE_FILE") else None
+TRACE_FILE_MAX_BYTES = int(os.getenv("TRACE_FILE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# Spans are only recorded when there is somewhere to send them
+RECORDING = TRACING_ENABLED and bool(OTLP_ENDPOINT or TRACE_FILE)
+
+EXPORT_INTERVAL = 2.0
+EXPORT_BATCH_SIZE = 512
+
+# OTLP SpanKind values
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str] = None
+    kind: str = "internal"
+    sampled: bool = True
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def parse_traceparent(header: str) -> Optional[Tuple[str, str, bool]]:
+    """(trace_id, parent_span_id, sampled) from a W3C traceparent header, or None if malformed."""
+    match = _TRACEPARENT.match(header.strip().lower()) if header else None
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+@contextmanager
+def start_span(name: str, kind: str = "internal", parent: Optional[Tuple[str, str, bool]] = None,
+               **attributes) -> Iterator[Span]:
+    """Open a child of the current span (or of a remote `parent` from parse_traceparent)."""
+    if parent is None and _current_span.get() is not None:
+        local = _current_span.get()
+        parent = (local.trace_id, local.span_id, local.sampled)
+    if parent is None:
+        trace_id, parent_id, sampled = f"{random.getrandbits(128):032x}", None, random.random() < TRACE_SAMPLE_RATE
+    else:
+        trace_id, parent_id, sampled = parent
+    span = Span(name, trace_id, f"{random.getrandbits(64):016x}", parent_id, kind,
+                sampled and RECORDING, time.time_ns(), attributes=attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except Exception as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.end_ns = time.time_ns()
+        _current_span.reset(token)
+        if span.sampled:
+            _exporter().submit(span)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator running a function (sync or async) inside a span."""
+    def decorate(fn):
+        span_name = name or fn.__qualname__
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with start_span(span_name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with start_span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def traced_methods(cls):
+    """Class decorator giving every public method defined on `cls` its own span."""
+    for attr, value in list(vars(cls).items()):
+        if not attr.startswith("_") and callable(value) and not isinstance(value, (staticmethod, classmethod, type)):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    """OTLP/HTTP JSON ExportTraceServiceRequest for `spans`."""
+    encoded = []
+    for span in spans:
+        item = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": SPAN_KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [_attribute(k, v) for k, v in span.attributes.items() if v is not None],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+        }
+        if span.parent_span_id:
+            item["parentSpanId"] = span.parent_span_id
+        encoded.append(item)
+    return {"resourceSpans": [{
+        "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+        "scopeSpans": [{"scope": {"name": "phoenix_crm"}, "spans": encoded}],
+    }]}
+
+
+class _BatchExporter:
+    """Collects finished spans and ships them from a daemon thread."""
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def submit(self, span: Span):
+        self._queue.put(span)
+
+    def shutdown(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        batch: List[Span] = []
+        deadline = time.monotonic() + EXPORT_INTERVAL
+        stopping = False
+        while not stopping:
+            try:
+                span = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if span is None:
+                    stopping = True
+                else:
+                    batch.append(span)
+            except queue.Empty:
+                pass
+            if stopping or len(batch) >= EXPORT_BATCH_SIZE or time.monotonic() >= deadline:
+                if batch:
+                    self._export(batch)
+                    batch = []
+                deadline = time.monotonic() + EXPORT_INTERVAL
+
+    def _export(self, spans: List[Span]):
+        payload = json.dumps(otlp_payload(spans), separators=(",", ":"))
+        if OTLP_ENDPOINT:
+            request = urllib.request.Request(
+                f"{OTLP_ENDPOINT}/v1/traces", data=payload.encode(),
+                headers={"Content-Type": "application/json"}, method="POST",
+            )
+            try:
+                urllib.request.urlopen(request, timeout=5).close()
+                return
+            except Exception as e:
+                logger.warning("OTLP export failed, %s %d spans: %s",
+                               f"writing to {TRACE_FILE}" if TRACE_FILE else "dropping", len(spans), e)
+        if TRACE_FILE is None:
+            return
+        try:
+            TRACE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            if TRACE_FILE.exists() and TRACE_FILE.stat().st_size >= TRACE_FILE_MAX_BYTES:
+                TRACE_FILE.replace(TRACE_FILE.with_name(TRACE_FILE.name + ".1"))
+            with open(TRACE_FILE, "a", encoding="utf-8") as out:
+                out.write(payload + "\n")
+        except OSError as e:
+            logger.warning("Could not write spans to %s: %s", TRACE_FILE, e)
+
+
+_exporter_instance: Optional[_BatchExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def _exporter() -> _BatchExporter:
+    global _exporter_instance
+    if _exporter_instance is None:
+        with _exporter_lock:
+            if _exporter_instance is None:
+                _exporter_instance = _BatchExporter()
+    return _exporter_instance
+
+
+def shutdown_tracing():
+    """Export any buffered spans now; for processes that exit without running atexit."""
+    if _exporter_instance is not None:
+        _exporter_instance.shutdown()
+
+
+def _reset_exporter_in_child():
+    # The parent's exporter thread does not survive fork; the child starts its own on first use
+    global _exporter_instance
+    _exporter_instance = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_exporter_in_child)
@@ -0,0 +1,119 @@
+"""
+Shared HTTP client for the PhoenixCRM backend
+
+One pooled requests.Session for the whole GUI, so calls reuse keep-alive
+connections instead of opening a new TCP (and TLS) connection each time.
+The client adds the signed-in user's bearer token and a W3C traceparent to
+every request, applies default timeouts, and keeps recent latencies per
+endpoint for get_api_client().latency_stats().
+"""
+import os
+import re
+import time
+import threading
+from collections import defaultdict, deque
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .tracing import start_span
+except ImportError:
+    from gui.tracing import start_span
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+
+# (connect, read) seconds; callers may pass their own timeout per request
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Enough for the dashboard's parallel panel fetches plus the banner and leads screen
+POOL_SIZE = int(os.getenv("PHOENIX_HTTP_POOL_SIZE", "10"))
+
+# Latency samples kept per endpoint
+LATENCY_WINDOW = 200
+
+# IDs in paths are folded so /api/leads/<uuid> is one endpoint in the stats
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F-]{16,}(?=/|$)|/\d+(?=/|$)")
+
+
+def endpoint_name(method, path):
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path.split('?')[0])}"
+
+
+class ApiClient:
+    """Backend client owning the connection pool, auth header and latency record."""
+
+    def __init__(self, base_url=BACKEND_URL, timeout=DEFAULT_TIMEOUT, pool_size=POOL_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.token = None
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+        self._lock = threading.Lock()
+
+    def request(self, method, path, headers=None, timeout=None, auth=True, **kwargs):
+        """Send `method` to `path` (relative to base_url) inside a client span."""
+        endpoint = endpoint_name(method, path)
+        headers = dict(headers or {})
+        if auth and self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        with start_span(endpoint, kind=3, **{"http.request.method": method, "url.path": path}) as span:
+            headers["traceparent"] = f"00-{span['traceId']}-{span['spanId']}-01"
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, f"{self.base_url}{path}", headers=headers,
+                    timeout=timeout or self.timeout, **kwargs
+                )
+            finally:
+                self._record(endpoint, time.perf_counter() - start)
+            span["attributes"]["http.response.status_code"] = response.status_code
+            return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def _record(self, endpoint, seconds):
+        with self._lock:
+            self._latencies[endpoint].append(seconds)
+
+    def latency_stats(self):
+        """Per-endpoint call count, median, p95 and last latency in milliseconds over the recent window."""
+        with self._lock:
+            snapshot = {endpoint: list(samples) for endpoint, samples in self._latencies.items()}
+        stats = {}
+        for endpoint, samples in snapshot.items():
+            ordered = sorted(samples)
+            stats[endpoint] = {
+                "count": len(samples),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+                "last_ms": round(samples[-1] * 1000, 1),
+            }
+        return stats
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_api_client():
+    """The GUI-wide ApiClient."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ApiClient()
+    return _client
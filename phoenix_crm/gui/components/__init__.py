@@ -4,5 +4,6 @@ GUI Components for Phoenix CRM
 from .lead_drawer import LeadDrawer
 from .navigation_bar import NavigationBar
 from .dashboard_card import DashboardCard
+from .hover import HoverBehavior
 
-__all__ = ['LeadDrawer', 'NavigationBar', 'DashboardCard']
+__all__ = ['LeadDrawer', 'NavigationBar', 'DashboardCard', 'HoverBehavior']
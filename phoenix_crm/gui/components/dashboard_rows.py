@@ -0,0 +1,322 @@
+"""
+Row widgets for the dashboard panels
+
+Each row builds its widget tree once and takes its content through
+update(**fields), so KeyedList can keep, update or reuse it across refreshes.
+"""
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.graphics import Color, RoundedRectangle
+from kivy.metrics import dp
+
+from gui.components.hover import HoverBehavior
+
+APPOINTMENT_STATUS_COLORS = {
+    'confirmed': (0.2, 0.8, 0.3, 1),
+    'pending': (1, 0.6, 0, 1),
+    'canceled': (0.9, 0.2, 0.2, 1)
+}
+
+
+def _wrapping_label(**kwargs):
+    """Left-aligned label that wraps to its width."""
+    label = Label(halign='left', **kwargs)
+    label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
+    return label
+
+
+def _round_bg(widget, rgba, radius):
+    """Give `widget` a rounded background; returns the Color instruction."""
+    with widget.canvas.before:
+        color = Color(*rgba)
+        widget._bg = RoundedRectangle(pos=widget.pos, size=widget.size, radius=[radius])
+    widget.bind(
+        pos=lambda i, v: setattr(i._bg, 'pos', v),
+        size=lambda i, v: setattr(i._bg, 'size', v)
+    )
+    return color
+
+
+class AppointmentRow(HoverBehavior, BoxLayout):
+    """Status bar, avatar, client name and time."""
+
+    def __init__(self, **kwargs):
+        super().__init__(size_hint_y=None, height=dp(52), spacing=dp(10), padding=(dp(12), dp(8)), **kwargs)
+        with self.canvas.before:
+            # Border
+            Color(0.92, 0.92, 0.92, 1)
+            self._border = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(8)])
+            # Background with Color instruction
+            self._bg_color = Color(1, 1, 1, 0)
+            self._bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(8)])
+        self.bind(pos=self._update_graphics, size=self._update_graphics)
+
+        # Modern status indicator
+        status_container = BoxLayout(
+            orientation='vertical',
+            size_hint_x=None,
+            width=dp(8),
+            padding=(0, dp(10), 0, dp(10))
+        )
+        status_bar = BoxLayout(size_hint_y=1)
+        self._status_color = _round_bg(status_bar, (0.5, 0.5, 0.5, 1), dp(4))
+        status_container.add_widget(status_bar)
+
+        avatar = Label(text="👤", font_size='22sp', size_hint_x=None, width=dp(35))
+
+        info = BoxLayout(orientation='vertical', spacing=dp(2))
+        self.name_label = _wrapping_label(font_size='15sp', bold=True, color=(0.15, 0.15, 0.15, 1),
+                                          size_hint_y=None, height=dp(20))
+        self.time_label = _wrapping_label(font_size='13sp', color=(0.5, 0.5, 0.5, 1),
+                                          size_hint_y=None, height=dp(18))
+        info.add_widget(self.name_label)
+        info.add_widget(self.time_label)
+
+        self.add_widget(status_container)
+        self.add_widget(avatar)
+        self.add_widget(info)
+
+    def _update_graphics(self, *args):
+        self._border.pos = self.pos
+        self._border.size = self.size
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+    def update(self, client_name, time, status):
+        self.name_label.text = client_name
+        self.time_label.text = time
+        self._status_color.rgba = APPOINTMENT_STATUS_COLORS.get(status, (0.5, 0.5, 0.5, 1))
+
+    def on_hover(self, hovering):
+        # Hover: light background; normal: transparent
+        self._bg_color.rgba = (0.98, 0.98, 0.98, 1) if hovering else (1, 1, 1, 0)
+
+
+class LeadRow(HoverBehavior, BoxLayout):
+    """Avatar, lead name and company, with a shadow that lifts on hover."""
+
+    def __init__(self, **kwargs):
+        super().__init__(size_hint_y=None, height=dp(56), spacing=dp(10), padding=(dp(16), dp(10)), **kwargs)
+        with self.canvas.before:
+            # Shadow with Color instruction
+            self._shadow_color = Color(0, 0, 0, 0.05)
+            self._shadow = RoundedRectangle(pos=(self.x, self.y - dp(2)), size=self.size, radius=[dp(8)])
+            # Border
+            Color(0.9, 0.9, 0.9, 1)
+            self._border = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(8)])
+            # Background
+            Color(1, 1, 1, 1)
+            self._bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(8)])
+        self.bind(pos=self._update_graphics, size=self._update_graphics)
+
+        avatar = Label(text="👤", font_size='24sp', size_hint_x=None, width=dp(40))
+
+        info = BoxLayout(orientation='vertical', spacing=dp(3))
+        self.name_label = _wrapping_label(font_size='15sp', bold=True, color=(0.15, 0.15, 0.15, 1),
+                                          size_hint_y=None, height=dp(20))
+        self.company_label = _wrapping_label(font_size='13sp', color=(0.5, 0.5, 0.5, 1),
+                                             size_hint_y=None, height=dp(18))
+        info.add_widget(self.name_label)
+        info.add_widget(self.company_label)
+
+        self.add_widget(avatar)
+        self.add_widget(info)
+
+    def _update_graphics(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+        self._border.pos = self.pos
+        self._border.size = self.size
+        self._shadow.pos = (self.x, self.y - dp(4 if self.is_hovering else 2))
+        self._shadow.size = self.size
+
+    def update(self, name, company):
+        self.name_label.text = name
+        self.company_label.text = company
+
+    def on_hover(self, hovering):
+        # Hover: elevate shadow
+        self._shadow.pos = (self.x, self.y - dp(4 if hovering else 2))
+        self._shadow_color.rgba = (0, 0, 0, 0.12 if hovering else 0.05)
+
+
+class GoalRow(BoxLayout):
+    """Goal title, percentage and progress bar."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', size_hint_y=None, height=dp(80), spacing=dp(12), **kwargs)
+        self.progress = 0
+
+        # Title row with icon
+        title_row = BoxLayout(size_hint_y=None, height=dp(32), spacing=dp(8))
+        target_icon = Label(text="🎯", font_size='18sp', size_hint_x=None, width=dp(28))
+        self.title_label = _wrapping_label(font_size='14sp', bold=True, color=(0.25, 0.25, 0.25, 1), valign='middle')
+        self.progress_text = Label(font_size='14sp', bold=True, color=(1, 0.4, 0, 1),
+                                   size_hint_x=None, width=dp(50), halign='right')
+        title_row.add_widget(target_icon)
+        title_row.add_widget(self.title_label)
+        title_row.add_widget(self.progress_text)
+
+        # Progress bar with custom styling
+        self._bar = BoxLayout(size_hint_y=None, height=dp(14))
+        with self._bar.canvas.before:
+            # Background track
+            Color(0.9, 0.9, 0.9, 1)
+            self._track = RoundedRectangle(pos=self._bar.pos, size=self._bar.size, radius=[dp(7)])
+            # Progress fill
+            Color(1, 0.4, 0, 1)
+            self._fill = RoundedRectangle(pos=self._bar.pos, size=(0, self._bar.height), radius=[dp(7)])
+        self._bar.bind(pos=self._update_bar, size=self._update_bar)
+
+        self.add_widget(title_row)
+        self.add_widget(self._bar)
+
+    def _update_bar(self, *args):
+        self._track.pos = self._bar.pos
+        self._track.size = self._bar.size
+        self._fill.pos = self._bar.pos
+        self._fill.size = (self._bar.width * (self.progress / 100), self._bar.height)
+
+    def update(self, title, progress):
+        self.title_label.text = title
+        self.progress = progress
+        self.progress_text.text = f"{int(progress)}%"
+        self._update_bar()
+
+
+class ListRow(HoverBehavior, BoxLayout):
+    """Icon, one line of text and a chevron; the accent bar shows on hover."""
+
+    def __init__(self, **kwargs):
+        super().__init__(size_hint_y=None, height=dp(42), padding=(dp(12), dp(6)), spacing=dp(10), **kwargs)
+        with self.canvas.before:
+            self._bg_color = Color(0.98, 0.98, 0.98, 0)
+            self._bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(8)])
+            # Add subtle left border accent
+            self._accent_color = Color(1, 0.4, 0, 0)
+            self._accent = RoundedRectangle(pos=self.pos, size=(dp(3), self.height), radius=[dp(2), 0, 0, dp(2)])
+        self.bind(pos=self._update_bg, size=self._update_bg)
+
+        # Icon with background circle
+        self.icon_container = BoxLayout(size_hint_x=None, width=dp(32), padding=(dp(4), dp(4)))
+        _round_bg(self.icon_container, (0.95, 0.95, 0.95, 1), dp(16))
+        self.icon_label = Label(font_size='18sp', halign='center', valign='middle')
+        self.icon_container.add_widget(self.icon_label)
+
+        # Text content
+        text_container = BoxLayout(orientation='vertical', spacing=dp(2))
+        self.main_label = _wrapping_label(font_size='13sp', bold=True, color=(0.2, 0.2, 0.2, 1), valign='middle',
+                                          size_hint_y=None, height=dp(18))
+        text_container.add_widget(self.main_label)
+
+        # Chevron indicator
+        chevron = Label(text="›", font_size='20sp', color=(0.6, 0.6, 0.6, 1), size_hint_x=None, width=dp(20))
+
+        self.add_widget(self.icon_container)
+        self.add_widget(text_container)
+        self.add_widget(chevron)
+
+    def _update_bg(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+        self._accent.pos = self.pos
+        self._accent.size = (dp(3), self.height)
+
+    def update(self, text, icon=""):
+        self.main_label.text = text
+        self.icon_label.text = icon
+        self.icon_container.width = dp(32) if icon else 0
+        self.icon_container.opacity = 1 if icon else 0
+
+    def on_hover(self, hovering):
+        self._bg_color.rgba = (0.96, 0.96, 0.96, 1) if hovering else (0.98, 0.98, 0.98, 0)
+        self._accent_color.rgba = (1, 0.4, 0, 1 if hovering else 0)
+
+
+class NotificationRow(HoverBehavior, BoxLayout):
+    """Type icon, title, message preview and an unread dot."""
+
+    def __init__(self, **kwargs):
+        super().__init__(size_hint_y=None, height=dp(65), padding=(dp(12), dp(8)), spacing=dp(10), **kwargs)
+        self._bg_color = _round_bg(self, (0.98, 0.98, 0.98, 0), dp(8))
+
+        # Icon with colored background
+        icon_container = BoxLayout(size_hint_x=None, width=dp(40), padding=(dp(4), dp(4)))
+        self._icon_bg = _round_bg(icon_container, (0.95, 0.95, 0.95, 1), dp(20))
+        self.icon_label = Label(font_size='22sp', halign='center', valign='middle')
+        icon_container.add_widget(self.icon_label)
+
+        # Text content
+        text_container = BoxLayout(orientation='vertical', spacing=dp(3))
+        self.title_label = _wrapping_label(font_size='14sp', valign='top', size_hint_y=None, height=dp(20))
+        self.message_label = _wrapping_label(font_size='12sp', color=(0.5, 0.5, 0.5, 1), valign='top',
+                                             size_hint_y=None, height=dp(30))
+        text_container.add_widget(self.title_label)
+        text_container.add_widget(self.message_label)
+
+        # Unread indicator
+        self.unread_dot = Label(text="●", font_size='12sp', color=(1, 0.4, 0, 1), size_hint_x=None, width=dp(20))
+
+        self.add_widget(icon_container)
+        self.add_widget(text_container)
+        self.add_widget(self.unread_dot)
+
+    def update(self, title, message, icon, is_read):
+        self.icon_label.text = icon
+        self._icon_bg.rgba = (0.95, 0.95, 0.95, 1) if is_read else (1, 0.95, 0.9, 1)
+        self.title_label.text = title
+        self.title_label.bold = not is_read
+        self.title_label.color = (0.5, 0.5, 0.5, 1) if is_read else (0.2, 0.2, 0.2, 1)
+        self.message_label.text = message[:60] + "..." if len(message) > 60 else message
+        self.unread_dot.opacity = 0 if is_read else 1
+        self.unread_dot.width = 0 if is_read else dp(20)
+
+    def on_hover(self, hovering):
+        self._bg_color.rgba = (0.95, 0.95, 0.95, 1) if hovering else (0.98, 0.98, 0.98, 0)
+
+
+class TrainingRow(HoverBehavior, BoxLayout):
+    """Category icon, title, category and date, and a play icon."""
+
+    def __init__(self, **kwargs):
+        super().__init__(size_hint_y=None, height=dp(60), padding=(dp(12), dp(8)), spacing=dp(10), **kwargs)
+        self._bg_color = _round_bg(self, (0.98, 0.98, 0.98, 0), dp(8))
+
+        # Icon with gradient-like background
+        icon_container = BoxLayout(size_hint_x=None, width=dp(40), padding=(dp(4), dp(4)))
+        _round_bg(icon_container, (1, 0.95, 0.9, 1), dp(20))
+        self.icon_label = Label(font_size='24sp', bold=True, color=(1, 0.4, 0, 1), halign='center', valign='middle')
+        icon_container.add_widget(self.icon_label)
+
+        # Text content
+        text_container = BoxLayout(orientation='vertical', spacing=dp(2))
+        self.title_label = _wrapping_label(font_size='13sp', bold=True, color=(0.2, 0.2, 0.2, 1), valign='top',
+                                           size_hint_y=None, height=dp(20))
+
+        # Category and date row
+        meta_row = BoxLayout(size_hint_y=None, height=dp(18), spacing=dp(8))
+        self.category_label = _wrapping_label(font_size='11sp', color=(0.6, 0.6, 0.6, 1), valign='middle')
+        self.date_label = Label(font_size='11sp', color=(0.6, 0.6, 0.6, 1), size_hint_x=None, width=dp(60),
+                                halign='right')
+        meta_row.add_widget(self.category_label)
+        meta_row.add_widget(self.date_label)
+
+        text_container.add_widget(self.title_label)
+        text_container.add_widget(meta_row)
+
+        # Play icon
+        play_icon = Label(text="▶", font_size='18sp', bold=True, color=(1, 0.4, 0, 1), size_hint_x=None, width=dp(24))
+
+        self.add_widget(icon_container)
+        self.add_widget(text_container)
+        self.add_widget(play_icon)
+
+    def update(self, title, category, icon, date):
+        self.icon_label.text = icon
+        self.title_label.text = title
+        self.category_label.text = category or "Training"
+        self.date_label.text = f"• {date}" if date else ""
+        self.date_label.width = dp(60) if date else 0
+
+    def on_hover(self, hovering):
+        self._bg_color.rgba = (0.95, 0.95, 0.95, 1) if hovering else (0.98, 0.98, 0.98, 0)
@@ -0,0 +1,114 @@
+"""
+Hover support for PhoenixCRM widgets
+
+A single HoverManager listens to Window.mouse_pos and tells only the
+widgets under the cursor that they are hovered; widgets mix in HoverBehavior
+and implement on_hover(hovering) instead of binding Window.mouse_pos
+themselves.
+
+Widgets are tracked only while they have a parent, so clear_widgets() drops
+them. The manager keeps their window-space boxes in a coarse grid, rebuilt when
+a tracked widget moves or resizes and at most every REBUILD_INTERVAL seconds
+while the mouse moves, which covers scrolling and screen changes. A mouse move
+then costs one grid lookup plus an exact collide_point on the few widgets in
+that cell.
+"""
+import time
+import weakref
+from collections import defaultdict
+from kivy.core.window import Window
+from kivy.metrics import dp
+
+# Grid cell edge in pixels; roughly one list item tall
+CELL_SIZE = dp(64)
+
+REBUILD_INTERVAL = 0.25
+
+
+class HoverManager:
+    """Routes mouse movement to the hoverable widget(s) under the cursor."""
+
+    def __init__(self):
+        self._widgets = weakref.WeakSet()
+        self._grid = defaultdict(list)
+        self._hovered = weakref.WeakSet()
+        self._dirty = True
+        self._built_at = 0.0
+        Window.bind(mouse_pos=self._on_mouse_pos, on_resize=self._mark_dirty)
+
+    def track(self, widget):
+        """Register `widget` while it has a parent and re-index it when it moves."""
+        widget.fbind('parent', self._on_parent)
+        widget.fbind('pos', self._mark_dirty)
+        widget.fbind('size', self._mark_dirty)
+        if widget.parent is not None:
+            self._widgets.add(widget)
+
+    def _on_parent(self, widget, parent):
+        if parent is None:
+            self._widgets.discard(widget)
+            if widget in self._hovered:
+                # Reset the hover look, so a detached widget that gets reused does not come back highlighted
+                self._hovered.discard(widget)
+                widget.is_hovering = False
+                widget.on_hover(False)
+        else:
+            self._widgets.add(widget)
+        self._dirty = True
+
+    def _mark_dirty(self, *args):
+        self._dirty = True
+
+    def _rebuild(self):
+        self._grid.clear()
+        for widget in list(self._widgets):
+            if widget.get_root_window() is None:
+                continue
+            x1, y1 = widget.to_window(widget.x, widget.y)
+            x2, y2 = widget.to_window(widget.right, widget.top)
+            for cx in range(int(x1 // CELL_SIZE), int(x2 // CELL_SIZE) + 1):
+                for cy in range(int(y1 // CELL_SIZE), int(y2 // CELL_SIZE) + 1):
+                    self._grid[(cx, cy)].append(widget)
+        self._dirty = False
+        self._built_at = time.monotonic()
+
+    def _on_mouse_pos(self, window, pos):
+        if self._dirty or time.monotonic() - self._built_at > REBUILD_INTERVAL:
+            self._rebuild()
+        candidates = self._grid.get((int(pos[0] // CELL_SIZE), int(pos[1] // CELL_SIZE)), ())
+        under = {w for w in candidates if w.get_root_window() is not None and w.collide_point(*w.to_widget(*pos))}
+
+        for widget in list(self._hovered):
+            if widget not in under:
+                self._hovered.discard(widget)
+                widget.is_hovering = False
+                widget.on_hover(False)
+        for widget in under:
+            if widget not in self._hovered:
+                self._hovered.add(widget)
+                widget.is_hovering = True
+                widget.on_hover(True)
+
+
+_manager = None
+
+
+def get_hover_manager():
+    """The app-wide HoverManager (created on first use, on the Kivy thread)."""
+    global _manager
+    if _manager is None:
+        _manager = HoverManager()
+    return _manager
+
+
+class HoverBehavior:
+    """Mixin for widgets that react to the mouse; override on_hover(hovering)."""
+
+    is_hovering = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        get_hover_manager().track(self)
+
+    def on_hover(self, hovering):
+        pass
@@ -0,0 +1,68 @@
+"""
+Keyed reconciliation of a BoxLayout's rows against a list of records
+
+KeyedList keeps one row widget per record key (the record's id). On update
+it leaves rows whose fields are unchanged alone. Rows whose fields changed
+are updated in place through row.update(**fields), and the widget tree is
+touched only to insert, remove or reorder rows. Removed rows go to a small
+pool and are reused for the next insert instead of being rebuilt.
+
+Row classes take no constructor arguments and implement update(**fields).
+"""
+
+# Spare rows kept per list for reuse
+POOL_SIZE = 8
+
+
+class KeyedList:
+    """Reconciles `container`'s children with records rendered by `row_class`."""
+
+    def __init__(self, container, row_class, pool_size=POOL_SIZE):
+        self.container = container
+        self.row_class = row_class
+        self.pool_size = pool_size
+        self._rows = {}
+        self._fields = {}
+        self._pool = []
+
+    def update(self, items):
+        """Show `items`, a list of (key, fields) in display order."""
+        wanted = dict(items)
+
+        for key in [k for k in self._rows if k not in wanted]:
+            row = self._rows.pop(key)
+            del self._fields[key]
+            self.container.remove_widget(row)
+            if len(self._pool) < self.pool_size:
+                self._pool.append(row)
+
+        ordered = []
+        for key, fields in items:
+            row = self._rows.get(key)
+            if row is None:
+                row = self._pool.pop() if self._pool else self.row_class()
+                self._rows[key] = row
+            if self._fields.get(key) != fields:
+                row.update(**fields)
+                self._fields[key] = fields
+            ordered.append(row)
+
+        self._place(ordered)
+
+    def clear(self):
+        """Remove every row and drop the pool, so no widget still holds the old records' fields."""
+        self.update([])
+        self._pool.clear()
+
+    def _place(self, ordered):
+        # BoxLayout lists children last-added first; visual position i is index len(children) - i
+        current = list(reversed(self.container.children))
+        if current == ordered:
+            return
+        for position, row in enumerate(ordered):
+            current = list(reversed(self.container.children))
+            if position < len(current) and current[position] is row:
+                continue
+            if row.parent is not None:
+                self.container.remove_widget(row)
+            self.container.add_widget(row, index=len(self.container.children) - position)
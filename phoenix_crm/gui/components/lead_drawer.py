@@ -11,16 +11,16 @@ from kivy.animation import Animation
 from kivy.metrics import dp
 from kivy.clock import Clock
 import threading
-import requests
+from gui.api_client import get_api_client
 
 
 class LeadDrawer(FloatLayout):
     """Slide-in drawer for displaying lead details."""
     
-    def __init__(self, backend_url, token, on_close_callback, on_update_callback, **kwargs):
+    def __init__(self, on_close_callback, on_update_callback, api=None, **kwargs):
+        """on_update_callback(lead_data, changes) is called for every edit; the owner applies and saves it."""
         super().__init__(**kwargs)
-        self.backend_url = backend_url
-        self.token = token
+        self.api = api or get_api_client()
         self.on_close_callback = on_close_callback
         self.on_update_callback = on_update_callback
         self.lead_data = None
@@ -222,6 +222,7 @@ class LeadDrawer(FloatLayout):
         
         # Add Note button
         add_note_btn = self._create_action_button("Add Note", outline=True)
+        add_note_btn.bind(on_press=lambda x: self.save_notes())
         btn_container.add_widget(add_note_btn)
         
         # Set Follow-up Reminder button
@@ -230,6 +231,7 @@ class LeadDrawer(FloatLayout):
         
         # Mark as Interested button
         interested_btn = self._create_action_button("Mark as Interested", filled=True)
+        interested_btn.bind(on_press=lambda x: self.set_status("qualified"))
         btn_container.add_widget(interested_btn)
         
         content.add_widget(btn_container)
@@ -342,6 +344,21 @@ class LeadDrawer(FloatLayout):
         
         print(f"Closing drawer: target_x={target_x}")
     
+    def save_notes(self):
+        """Save the notes field if it changed."""
+        if self.lead_data and self.notes_input.text != (self.lead_data.get('notes') or ''):
+            self._update({'notes': self.notes_input.text})
+    
+    def set_status(self, status):
+        """Move the lead to `status`."""
+        if self.lead_data and self.lead_data.get('status') != status:
+            self._update({'status': status})
+    
+    def _update(self, changes):
+        # The owner applies the edit locally and queues it, so this never waits on the network
+        self.on_update_callback(self.lead_data, changes)
+        self._populate_data()
+    
     def _populate_data(self):
         """Populate drawer with lead data."""
         if not self.lead_data:
@@ -0,0 +1,152 @@
+"""
+Virtualized lead list - a RecycleView of lead cards
+
+Only enough LeadCard views to fill the viewport (plus a small margin) are
+created; on scroll they are recycled and re-bound to the lead at their new
+index, so widget count and frame time do not grow with the number of leads.
+"""
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.graphics import Color, Rectangle, Line
+from kivy.metrics import dp
+
+try:
+    from kivymd.uix.label import MDIcon
+except ImportError:
+    MDIcon = None
+
+CARD_HEIGHT = dp(130)
+
+
+def _icon(name):
+    if MDIcon is None:
+        return Label(size_hint_x=None, width=dp(20))
+    return MDIcon(icon=name, theme_text_color="Secondary", size_hint_x=None, width=dp(20))
+
+
+def _left_label(font_size, color, height=None, bold=False, valign='top'):
+    label = Label(font_size=font_size, color=color, bold=bold, halign='left', valign=valign)
+    if height is not None:
+        label.size_hint_y = None
+        label.height = height
+    label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
+    return label
+
+
+class Badge(BoxLayout):
+    """Grey pill with an upper-case label."""
+
+    def __init__(self, width=dp(100), **kwargs):
+        super().__init__(size_hint=(None, None), size=(width, dp(28)), pos_hint={'right': 1}, **kwargs)
+        with self.canvas.before:
+            Color(0.92, 0.92, 0.92, 1)
+            self._bg = Rectangle()
+        self.bind(pos=self._update_bg, size=self._update_bg)
+        self.label = Label(font_size='12sp', bold=True, color=(0.4, 0.4, 0.4, 1))
+        self.add_widget(self.label)
+
+    def _update_bg(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+    def set_text(self, text):
+        self.label.text = (text or "").upper()
+
+
+class LeadCard(RecycleDataViewBehavior, ButtonBehavior, BoxLayout):
+    """One recyclable lead card; the widget tree is built once and re-bound per lead."""
+
+    def __init__(self, **kwargs):
+        super().__init__(padding=dp(20), spacing=0, **kwargs)
+        self.lead = None
+        self.list_view = None
+
+        with self.canvas.before:
+            Color(0.8, 0.8, 0.8, 1)
+            self._border = Line(width=1.5)
+            Color(1, 1, 1, 1)
+            self._bg = Rectangle()
+        self.bind(pos=self._update_canvas, size=self._update_canvas)
+
+        # Left column - contact info
+        left_col = BoxLayout(orientation='vertical', spacing=dp(3), size_hint_x=0.65)
+        self.name_label = _left_label('20sp', (0, 0, 0, 1), height=dp(30), bold=True)
+        self.company_label = _left_label('14sp', (0.5, 0.5, 0.5, 1), height=dp(22))
+
+        email_row = BoxLayout(spacing=dp(8), size_hint_y=None, height=dp(24))
+        self.email_label = _left_label('14sp', (0.3, 0.3, 0.3, 1), valign='middle')
+        email_row.add_widget(_icon('email-outline'))
+        email_row.add_widget(self.email_label)
+
+        phone_row = BoxLayout(spacing=dp(8), size_hint_y=None, height=dp(24))
+        self.phone_label = _left_label('14sp', (0.3, 0.3, 0.3, 1), valign='middle')
+        phone_row.add_widget(_icon('phone'))
+        phone_row.add_widget(self.phone_label)
+
+        left_col.add_widget(self.name_label)
+        left_col.add_widget(self.company_label)
+        left_col.add_widget(email_row)
+        left_col.add_widget(phone_row)
+
+        # Right column - status, value, priority
+        right_col = BoxLayout(orientation='vertical', spacing=dp(8), size_hint_x=0.35, padding=(dp(10), 0, 0, 0))
+        self.status_badge = Badge()
+        self.value_label = Label(font_size='18sp', color=(0, 0, 0, 1), halign='right', valign='middle', size_hint_y=1)
+        self.value_label.bind(size=self.value_label.setter('text_size'))
+        self.priority_badge = Badge()
+
+        right_col.add_widget(self.status_badge)
+        right_col.add_widget(self.value_label)
+        right_col.add_widget(self.priority_badge)
+
+        self.add_widget(left_col)
+        self.add_widget(right_col)
+
+    def _update_canvas(self, *args):
+        self._border.rectangle = (self.x, self.y, self.width, self.height)
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Bind this view to the lead at `index`."""
+        self.list_view = rv
+        lead = data['lead']
+        self.name_label.text = f"{lead.get('first_name') or ''} {lead.get('last_name') or ''}".strip() or "Unnamed Lead"
+        self.company_label.text = lead.get('company') or 'No Company'
+        self.email_label.text = lead.get('email') or 'No email'
+        self.phone_label.text = lead.get('phone') or 'No phone'
+        self.status_badge.set_text(lead.get('status') or 'new')
+        self.value_label.text = f"${lead.get('value') or 0:,.2f}"
+        priority = lead.get('priority') or 'medium'
+        self.priority_badge.set_text('PRIVILIET' if priority == 'high' else priority)
+        return super().refresh_view_attrs(rv, index, data)
+
+    def on_press(self):
+        if self.list_view is not None and self.lead is not None:
+            self.list_view.select_callback(self.lead)
+
+
+class LeadListView(RecycleView):
+    """Scrollable, virtualized list of LeadCards; select_callback(lead) is called when a card is pressed."""
+
+    def __init__(self, select_callback, **kwargs):
+        super().__init__(do_scroll_x=False, bar_width=0, **kwargs)
+        self.select_callback = select_callback
+        self.viewclass = LeadCard
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=dp(12),
+            padding=(dp(25), dp(10), dp(25), dp(25)),
+            default_size=(None, CARD_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+    def set_leads(self, leads):
+        self.data = [{'lead': lead} for lead in leads]
@@ -9,16 +9,20 @@ from kivy.metrics import dp
 from kivy.animation import Animation
 from kivy.clock import Clock
 import threading
-import requests
+from gui.api_client import get_api_client
+from gui.local_cache import get_local_cache, describe_age
+from gui.refresh_scheduler import get_refresh_scheduler
+from gui.single_flight import SingleFlight
+from gui.tracing import start_span
 
 class LeaderboardBanner(BoxLayout):
     """Stock-ticker style banner displaying top sales performers."""
     
-    def __init__(self, backend_url, token, **kwargs):
+    def __init__(self, api=None, **kwargs):
         super().__init__(**kwargs)
-        self.backend_url = backend_url
-        self.token = token
+        self.api = api or get_api_client()
         self.leaderboard_data = []
+        self._flights = SingleFlight()
         self.current_period = "monthly"
         
         self.orientation = 'vertical'
@@ -94,18 +98,15 @@ class LeaderboardBanner(BoxLayout):
         header.add_widget(Label())  # Spacer
         
         # Live indicator (right side)
-        live_indicator = BoxLayout(size_hint=(None, None), size=(dp(85), dp(32)), spacing=dp(8))
+        live_indicator = BoxLayout(size_hint=(None, None), size=(dp(150), dp(32)), spacing=dp(8))
         
-        pulse_dot = Label(text="●", font_size='14sp', color=(0.3, 1, 0.3, 1), size_hint_x=None, width=dp(18))
-        # Animate the pulse
-        anim = Animation(color=(0.3, 1, 0.3, 0.3), duration=0.8) + Animation(color=(0.3, 1, 0.3, 1), duration=0.8)
-        anim.repeat = True
-        anim.start(pulse_dot)
+        self.pulse_dot = Label(text="●", font_size='14sp', color=(0.3, 1, 0.3, 1), size_hint_x=None, width=dp(18))
         
-        live_label = Label(text="LIVE", font_size='13sp', bold=True, color=(1, 1, 1, 0.9))
+        # "LIVE" once fresh data has arrived, the cached copy's age until then
+        self.live_label = Label(text="", font_size='13sp', bold=True, color=(1, 1, 1, 0.9))
         
-        live_indicator.add_widget(pulse_dot)
-        live_indicator.add_widget(live_label)
+        live_indicator.add_widget(self.pulse_dot)
+        live_indicator.add_widget(self.live_label)
         header.add_widget(live_indicator)
         
         self.add_widget(header)
@@ -120,7 +121,9 @@ class LeaderboardBanner(BoxLayout):
         self.add_widget(self.ticker_container)
         
         # Load initial data
+        self._show_cached()
         self.refresh_leaderboard()
+        get_refresh_scheduler().register("leaderboard", self.refresh_leaderboard, 120, max_interval=600, widget=self)
     
     def _create_tab_button(self, text, period, active=False):
         """Create a modern tab button - Inter is default."""
@@ -167,31 +170,69 @@ class LeaderboardBanner(BoxLayout):
                     size=lambda i, v: setattr(i._bg, 'size', v)
                 )
         
+        self._show_cached()
         self.refresh_leaderboard()
     
+    def _show_cached(self):
+        """Render the cached leaderboard for the current period, if any."""
+        cached = get_local_cache().get(f"leaderboard:{self.current_period}")
+        if cached:
+            self.leaderboard_data, fetched_at = cached
+            self._update_ui()
+            self._set_freshness(False, fetched_at)
+    
+    def _set_freshness(self, live, fetched_at=None):
+        """Pulsing green LIVE for fresh data, a static amber dot and the age for cached data."""
+        Animation.cancel_all(self.pulse_dot)
+        if live:
+            self.live_label.text = "LIVE"
+            self.pulse_dot.color = (0.3, 1, 0.3, 1)
+            anim = Animation(color=(0.3, 1, 0.3, 0.3), duration=0.8) + Animation(color=(0.3, 1, 0.3, 1), duration=0.8)
+            anim.repeat = True
+            anim.start(self.pulse_dot)
+        else:
+            self.live_label.text = describe_age(fetched_at).upper()
+            self.pulse_dot.color = (1, 0.7, 0.2, 1)
+    
     def refresh_leaderboard(self):
-        """Fetch and display leaderboard data."""
-        thread = threading.Thread(target=self._fetch_leaderboard, daemon=True)
+        """Fetch and display leaderboard data; a fetch for another period is superseded."""
+        flight = self._flights.start("leaderboard", self.current_period)
+        if flight is None:
+            return
+        thread = threading.Thread(target=self._fetch_leaderboard, args=(flight,), daemon=True)
         thread.start()
     
-    def _fetch_leaderboard(self):
+    def _fetch_leaderboard(self, flight):
         """Background thread for fetching leaderboard."""
-        try:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.get(
-                f"{self.backend_url}/api/leaderboard/?period={self.current_period}&limit=10",
-                headers=headers,
-                timeout=5
-            )
+        period = flight.params
+        with start_span("leaderboard.fetch", period=period):
+            try:
+                response = self.api.get(
+                    "/api/leaderboard/",
+                    params={"period": period, "limit": 10},
+                    timeout=5
+                )
             
-            if response.status_code == 200:
-                self.leaderboard_data = response.json()
-                Clock.schedule_once(lambda dt: self._update_ui())
-            else:
-                print(f"Error fetching leaderboard: {response.status_code}")
+                if response.status_code == 200:
+                    data = response.json()
+                    if flight.is_current():
+                        get_local_cache().put(f"leaderboard:{period}", data)
+                        get_refresh_scheduler().report("leaderboard", data != self.leaderboard_data)
+                    
+                    def apply(dt):
+                        if not flight.is_current():
+                            return
+                        self.leaderboard_data = data
+                        self._update_ui()
+                        self._set_freshness(True)
+                    Clock.schedule_once(apply)
+                else:
+                    print(f"Error fetching leaderboard: {response.status_code}")
                 
-        except Exception as e:
-            print(f"Leaderboard fetch error: {e}")
+            except Exception as e:
+                print(f"Leaderboard fetch error: {e}")
+            finally:
+                self._flights.finish(flight)
     
     def _update_ui(self):
         """Update the ticker display."""
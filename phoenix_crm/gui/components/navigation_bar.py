@@ -55,6 +55,19 @@ class NavigationBar(BoxLayout):
         title_container.add_widget(title_label)
         self.add_widget(title_container)
         
+        # Data freshness ("Updated 3 min ago · refreshing…"), set by the screen
+        self.status_label = Label(
+            text="",
+            font_size='12sp',
+            color=(1, 1, 1, 0.6),
+            size_hint_x=None,
+            width=dp(280),
+            halign='right',
+            valign='middle'
+        )
+        self.status_label.bind(size=self.status_label.setter('text_size'))
+        self.add_widget(self.status_label)
+        
         # User menu section
         user_menu = BoxLayout(
             size_hint=(None, 1),
@@ -98,6 +111,10 @@ class NavigationBar(BoxLayout):
         self.bg.pos = self.pos
         self.bg.size = self.size
     
+    def set_status(self, text):
+        """Show a short status line, such as data freshness, next to the user menu."""
+        self.status_label.text = text
+    
     def update_username(self, username):
         """Update the displayed username."""
         # This method can be used later if you want to show username
@@ -2,77 +2,200 @@
 Lead data model and business logic for PhoenixCRM
 """
 import threading
-import requests
 from typing import List, Dict, Callable, Optional
 from kivy.clock import Clock
 
+try:
+    from .api_client import get_api_client
+    from .local_cache import get_local_cache
+    from .outbox import get_outbox
+    from .single_flight import SingleFlight
+    from .tracing import start_span
+except ImportError:
+    from gui.api_client import get_api_client
+    from gui.local_cache import get_local_cache
+    from gui.outbox import get_outbox
+    from gui.single_flight import SingleFlight
+    from gui.tracing import start_span
+
+# Fields a search query is matched against
+SEARCH_FIELDS = ('first_name', 'last_name', 'email', 'company')
+
+# Books with at least this many leads are searched on a worker thread
+ASYNC_SEARCH_THRESHOLD = 2000
+
+
+def _search_text(lead: Dict) -> str:
+    """Lower-cased search fields, NUL-separated so a query cannot match across two fields."""
+    return "\0".join(lead.get(field) or '' for field in SEARCH_FIELDS).lower()
+
 
 class LeadsModel:
     """Model class for managing lead data and API interactions."""
     
-    def __init__(self, backend_url: str, token: str):
-        self.backend_url = backend_url
-        self.token = token
+    def __init__(self, api=None):
+        self.api = api or get_api_client()
+        self.user_key = get_local_cache().user_key
+        self.fetched_at = None
         self.leads = []
         self.filtered_leads = []
         self.search_query = ""
         self.filter_stage = "all"
         self.sort_by = "name"
+        self._flights = SingleFlight()
+        self._callbacks = []
+        # Bumped whenever self.leads changes; the search caches below are only valid for one version
+        self._version = 0
+        self._search_texts = {}
+        self._last_filter = None
         
+    def load_cached(self) -> bool:
+        """Load the last fetched leads from the local cache; True if there were any."""
+        cached = get_local_cache().get("leads")
+        if not cached:
+            return False
+        self.leads, self.fetched_at = cached
+        self._leads_changed()
+        return True
+    
     def fetch_leads(self, callback: Callable):
-        """Fetch leads from backend in a separate thread."""
-        thread = threading.Thread(target=self._fetch_leads_thread, args=(callback,), daemon=True)
+        """Fetch leads from backend in a separate thread; joins a fetch already in flight."""
+        self._callbacks.append(callback)
+        flight = self._flights.start("leads")
+        if flight is None:
+            return
+        thread = threading.Thread(target=self._fetch_leads_thread, args=(flight,), daemon=True)
         thread.start()
     
-    def _fetch_leads_thread(self, callback: Callable):
-        """Background thread for fetching leads."""
-        try:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.get(
-                f"{self.backend_url}/api/leads/",
-                headers=headers,
-                timeout=10
-            )
+    def cancel(self):
+        """Drop the fetch in flight; its result and callbacks are discarded."""
+        self._flights.cancel()
+        self._callbacks = []
+    
+    def _fetch_leads_thread(self, flight):
+        """Background thread for fetching leads; the result is applied on the Kivy thread."""
+        with start_span("leads.fetch"):
+            try:
+                response = self.api.get("/api/leads/", timeout=10)
             
-            if response.status_code == 200:
-                self.leads = response.json()
-                self.apply_filters()
-                Clock.schedule_once(lambda dt: callback(True, self.filtered_leads))
-            else:
-                Clock.schedule_once(lambda dt: callback(False, "Failed to load leads"))
-        except Exception as e:
-            Clock.schedule_once(lambda dt: callback(False, str(e)))
+                if response.status_code == 200:
+                    leads = self._with_pending_edits(response.json())
+                    if not flight.is_current():
+                        return
+                    fetched_at = get_local_cache().put("leads", leads)
+                    
+                    def apply(dt):
+                        if not flight.is_current():
+                            return
+                        self.leads = leads
+                        self.fetched_at = fetched_at
+                        self._leads_changed()
+                        self._deliver(flight, True, self.filtered_leads)
+                    Clock.schedule_once(apply)
+                else:
+                    Clock.schedule_once(lambda dt: self._deliver(flight, False, "Failed to load leads"))
+            except Exception as e:
+                message = str(e)
+                Clock.schedule_once(lambda dt: self._deliver(flight, False, message))
+            finally:
+                self._flights.finish(flight)
     
-    def apply_filters(self):
-        """Apply search, filter, and sort to leads."""
-        filtered = self.leads.copy()
+    def _deliver(self, flight, success: bool, data):
+        """Hand a fetch result to everyone waiting on it, unless a newer fetch superseded it."""
+        if not flight.is_current():
+            return
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(success, data)
+    
+    def _with_pending_edits(self, leads: List[Dict]) -> List[Dict]:
+        """Re-apply edits still waiting in the outbox so a refresh does not undo them."""
+        pending = get_outbox().pending_changes()
+        for lead in leads:
+            changes = pending.get(str(lead.get('id')))
+            if changes:
+                lead.update(changes)
+        return leads
+    
+    def _find(self, lead_id) -> Optional[Dict]:
+        return next((lead for lead in self.leads if str(lead.get('id')) == str(lead_id)), None)
+    
+    def update_lead(self, lead: Dict, changes: Dict):
+        """Apply `changes` locally at once and queue them for the backend."""
+        base_updated_at = lead.get('updated_at')
+        lead.update(changes)
+        target = self._find(lead.get('id'))
+        if target is not None and target is not lead:
+            target.update(changes)
+        self._leads_changed()
+        get_local_cache().put("leads", self.leads, self.fetched_at)
+        get_outbox().enqueue(lead.get('id'), changes, base_updated_at)
+    
+    def apply_server_lead(self, lead_id, lead: Optional[Dict]):
+        """Take the server's copy of a lead after an outbox replay; None means it was deleted."""
+        target = self._find(lead_id)
+        if target is None:
+            return
+        if lead is None:
+            self.leads.remove(target)
+        else:
+            target.clear()
+            target.update(self._with_pending_edits([lead])[0])
+        self._leads_changed()
+        get_local_cache().put("leads", self.leads, self.fetched_at)
+    
+    def _leads_changed(self):
+        """Drop the search caches after self.leads was replaced or edited, then refilter."""
+        self._version += 1
+        self._search_texts = {}
+        self._last_filter = None
+        return self.apply_filters()
+    
+    def _filter_params(self):
+        return (self._version, self.search_query.lower(), self.filter_stage, self.sort_by)
+    
+    def _filter(self, params, leads, last_filter, texts) -> List[Dict]:
+        """Search, stage-filter and sort `leads`; safe to run off the Kivy thread."""
+        version, query, stage, sort_by = params
+        
+        def matches(lead):
+            text = texts.get(id(lead))
+            if text is None:
+                text = texts[id(lead)] = _search_text(lead)
+            return query in text
+        
+        # A query that extends the last one can only match a subset of its result,
+        # which is already stage-filtered and sorted
+        if last_filter is not None:
+            (last_version, last_query, last_stage, last_sort), last_result = last_filter
+            if (last_version, last_stage, last_sort) == (version, stage, sort_by) and query.startswith(last_query):
+                return [lead for lead in last_result if matches(lead)] if query != last_query else last_result
         
         # Apply search
-        if self.search_query:
-            query = self.search_query.lower()
-            filtered = [
-                lead for lead in filtered
-                if query in lead.get('first_name', '').lower()
-                or query in lead.get('last_name', '').lower()
-                or query in lead.get('email', '').lower()
-                or query in lead.get('company', '').lower()
-            ]
+        filtered = [lead for lead in leads if matches(lead)] if query else leads.copy()
         
         # Apply stage filter
-        if self.filter_stage != "all":
-            filtered = [lead for lead in filtered if lead.get('status') == self.filter_stage]
+        if stage != "all":
+            filtered = [lead for lead in filtered if lead.get('status') == stage]
         
         # Apply sorting
-        if self.sort_by == "name":
+        if sort_by == "name":
             filtered.sort(key=lambda x: f"{x.get('first_name', '')} {x.get('last_name', '')}")
-        elif self.sort_by == "value":
+        elif sort_by == "value":
             filtered.sort(key=lambda x: x.get('value', 0), reverse=True)
-        elif self.sort_by == "priority":
+        elif sort_by == "priority":
             priority_order = {'high': 0, 'medium': 1, 'low': 2}
             filtered.sort(key=lambda x: priority_order.get(x.get('priority', 'medium'), 1))
-        elif self.sort_by == "stage":
+        elif sort_by == "stage":
             filtered.sort(key=lambda x: x.get('status', 'new'))
         
+        return filtered
+    
+    def apply_filters(self):
+        """Apply search, filter, and sort to leads."""
+        params = self._filter_params()
+        filtered = self._filter(params, self.leads, self._last_filter, self._search_texts)
+        self._last_filter = (params, filtered)
         self.filtered_leads = filtered
         return filtered
     
@@ -81,6 +204,37 @@ class LeadsModel:
         self.search_query = query
         return self.apply_filters()
     
+    def search_leads_async(self, query: str, callback: Callable):
+        """Like search_leads, but large books are filtered on a worker thread.
+        
+        callback(filtered_leads) runs on the Kivy thread, and only if no newer
+        search or change to the leads happened in the meantime.
+        """
+        self.search_query = query
+        if len(self.leads) < ASYNC_SEARCH_THRESHOLD:
+            callback(self.apply_filters())
+            return
+        params = self._filter_params()
+        flight = self._flights.start("search", params)
+        if flight is None:
+            return
+        leads, last_filter, texts = self.leads, self._last_filter, self._search_texts
+        
+        def run():
+            try:
+                filtered = self._filter(params, leads, last_filter, texts)
+                
+                def apply(dt):
+                    if not flight.is_current() or params != self._filter_params():
+                        return
+                    self._last_filter = (params, filtered)
+                    self.filtered_leads = filtered
+                    callback(filtered)
+                Clock.schedule_once(apply)
+            finally:
+                self._flights.finish(flight)
+        threading.Thread(target=run, daemon=True).start()
+    
     def filter_by_stage(self, stage: str):
         """Filter leads by stage."""
         self.filter_stage = stage
@@ -0,0 +1,105 @@
+"""
+Persistent per-user cache of backend responses for PhoenixCRM
+
+The last successful response for each dashboard panel, the leads list and the
+leaderboard is stored in a local SQLite file, keyed by the signed-in user, so
+screens can render it immediately on the next launch and revalidate in the
+background (stale-while-revalidate).
+
+The store lives at PHOENIX_CACHE_PATH (default ~/.phoenix_crm/cache.sqlite3).
+A missing or unreadable store only means a cold start; errors are printed and
+otherwise ignored.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+CACHE_PATH = Path(os.getenv("PHOENIX_CACHE_PATH", str(Path.home() / ".phoenix_crm" / "cache.sqlite3")))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    user_key TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (user_key, resource)
+)
+"""
+
+
+def describe_age(fetched_at, now=None):
+    """Human-readable age of data fetched at epoch time `fetched_at`."""
+    seconds = max(0, (now or time.time()) - fetched_at)
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} d ago"
+
+
+class LocalCache:
+    """SQLite-backed response store; safe to use from worker threads."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.user_key = None
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+        except sqlite3.Error as e:
+            print(f"Local cache unavailable ({self.path}): {e}")
+            self._conn = None
+
+    def get(self, resource):
+        """(data, fetched_at) for the current user, or None."""
+        if self._conn is None or self.user_key is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body, fetched_at FROM responses WHERE user_key = ? AND resource = ?",
+                    (self.user_key, resource),
+                ).fetchone()
+            return (json.loads(row[0]), row[1]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Local cache read failed for {resource}: {e}")
+            return None
+
+    def put(self, resource, data, fetched_at=None):
+        """Store `data` as the current user's latest copy of `resource`; returns its timestamp."""
+        fetched_at = fetched_at or time.time()
+        if self._conn is None or self.user_key is None:
+            return fetched_at
+        try:
+            body = json.dumps(data)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (user_key, resource, body, fetched_at) VALUES (?, ?, ?, ?)",
+                    (self.user_key, resource, body, fetched_at),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Local cache write failed for {resource}: {e}")
+        return fetched_at
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_local_cache():
+    """The GUI-wide LocalCache; the app sets user_key on login."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LocalCache()
+    return _cache
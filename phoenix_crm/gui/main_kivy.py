@@ -1,4 +1,3 @@
-import os
 import sys
 import threading
 import requests
@@ -41,19 +40,35 @@ except ImportError:
         sys.path.insert(0, str(parent_dir))
     from gui.leads_model import LeadsModel
 
+from gui.api_client import get_api_client
+from gui.local_cache import get_local_cache, describe_age
+from gui.outbox import get_outbox
+from gui.tracing import start_span
+
 # Import the LeadDrawer component
 from gui.components.lead_drawer import LeadDrawer
 from gui.components.navigation_bar import NavigationBar
+from gui.components.lead_list import LeadListView
 from gui.screens.new_dashboard import NewDashboardScreen
 
 # --- Kivy App Styling ---
 Window.clearcolor = (0.95, 0.96, 0.98, 1)  # Light gray background
 
+# Seconds of typing pause before the leads list is searched
+SEARCH_DEBOUNCE = 0.25
+
+# Navigation bar message for each outbox outcome other than "synced"
+SYNC_OUTCOME_STATUS = {
+    "conflict": "Edit replaced by a newer server change",
+    "rejected": "Edit rejected by the server",
+    "deleted": "Lead was deleted on the server",
+}
+
 class LoginScreen(Screen):
     def __init__(self, on_login_callback, **kwargs):
         super().__init__(**kwargs)
         self.on_login_callback = on_login_callback
-        self.backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
+        self.api = get_api_client()
 
         # Main layout
         layout = BoxLayout(orientation='vertical', padding=40, spacing=15)
@@ -123,42 +138,44 @@ class LoginScreen(Screen):
         thread.start()
 
     def auth_thread(self, email, password):
-        try:
-            print(f"Attempting login for: {email}")
-            print(f"Backend URL: {self.backend_url}")
+        with start_span("auth.login"):
+            try:
+                print(f"Attempting login for: {email}")
+                print(f"Backend URL: {self.api.base_url}")
             
-            response = requests.post(
-                f"{self.backend_url}/api/auth/login",
-                json={"email": email, "password": password},
-                timeout=10
-            )
+                response = self.api.post(
+                    "/api/auth/login",
+                    json={"email": email, "password": password},
+                    auth=False,
+                    timeout=10
+                )
             
-            print(f"Response status: {response.status_code}")
-            print(f"Response body: {response.text}")
+                print(f"Response status: {response.status_code}")
+                print(f"Response body: {response.text}")
             
-            if response.status_code == 200 and response.json().get("access_token"):
-                data = response.json()
-                token = data["access_token"]
-                user = data.get("user", {})
-                Clock.schedule_once(lambda dt: self.login_success(token, user))
-            else:
-                error_msg = "Invalid credentials"
-                if response.status_code != 200:
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("detail", error_msg)
-                    except:
-                        error_msg = f"Server error: {response.status_code}"
-                Clock.schedule_once(lambda dt: self.login_error(error_msg))
-        except requests.exceptions.ConnectionError:
-            print("Connection error - is the backend running?")
-            Clock.schedule_once(lambda dt: self.login_error("Cannot connect to server. Is it running on port 8000?"))
-        except requests.exceptions.RequestException as e:
-            print(f"Request exception: {e}")
-            Clock.schedule_once(lambda dt: self.login_error(f"Connection error: {str(e)}"))
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            Clock.schedule_once(lambda dt: self.login_error(f"An error occurred: {e}"))
+                if response.status_code == 200 and response.json().get("access_token"):
+                    data = response.json()
+                    token = data["access_token"]
+                    user = data.get("user", {})
+                    Clock.schedule_once(lambda dt: self.login_success(token, user))
+                else:
+                    error_msg = "Invalid credentials"
+                    if response.status_code != 200:
+                        try:
+                            error_data = response.json()
+                            error_msg = error_data.get("detail", error_msg)
+                        except:
+                            error_msg = f"Server error: {response.status_code}"
+                    Clock.schedule_once(lambda dt: self.login_error(error_msg))
+            except requests.exceptions.ConnectionError:
+                print("Connection error - is the backend running?")
+                Clock.schedule_once(lambda dt: self.login_error("Cannot connect to server. Is it running on port 8000?"))
+            except requests.exceptions.RequestException as e:
+                print(f"Request exception: {e}")
+                Clock.schedule_once(lambda dt: self.login_error(f"Connection error: {str(e)}"))
+            except Exception as e:
+                print(f"Unexpected error: {e}")
+                Clock.schedule_once(lambda dt: self.login_error(f"An error occurred: {e}"))
 
     def login_success(self, token, user):
         self.status_label.text = "Login successful!"
@@ -198,7 +215,6 @@ class LeadsScreen(Screen):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
         self.leads_model = None
         self.detail_dialog = None
         self.lead_drawer = None
@@ -212,13 +228,13 @@ class LeadsScreen(Screen):
             main_layout.bind(size=lambda i, v: setattr(main_layout.bg_rect, 'size', v))
         
         # Add Navigation Bar with logout
-        nav_bar = NavigationBar(
+        self.nav_bar = NavigationBar(
             title="My Leads",
             show_back=True,
             on_back=self.go_back,
             on_logout=self._logout
         )
-        main_layout.add_widget(nav_bar)
+        main_layout.add_widget(self.nav_bar)
         
         # Toolbar with search and Add Lead button
         toolbar = BoxLayout(size_hint_y=None, height=dp(80), padding=(dp(25), dp(15)), spacing=dp(15))
@@ -260,6 +276,7 @@ class LeadsScreen(Screen):
             cursor_color=(0, 0, 0, 1),
             padding=(0, dp(15), 0, 0)
         )
+        self._search_trigger = Clock.create_trigger(self._run_search, SEARCH_DEBOUNCE)
         self.search_field.bind(text=self.on_search)
         
         search_container.add_widget(search_icon)
@@ -337,9 +354,12 @@ class LeadsScreen(Screen):
         stats_container.add_widget(Label())  # Spacer
         main_layout.add_widget(stats_container)
         
-        # Scrollable leads list
-        scroll = ScrollView(size_hint=(1, 1), do_scroll_x=False, bar_width=0)
+        # Leads list (virtualized) and, in its place while there is nothing to list,
+        # the loading / empty / error message
+        self.list_area = BoxLayout()
+        self.leads_view = LeadListView(select_callback=self.show_lead_details)
         
+        self.message_scroll = ScrollView(size_hint=(1, 1), do_scroll_x=False, bar_width=0)
         self.leads_container = BoxLayout(
             orientation='vertical',
             spacing=dp(12),
@@ -347,41 +367,64 @@ class LeadsScreen(Screen):
             size_hint_y=None
         )
         self.leads_container.bind(minimum_height=self.leads_container.setter('height'))
+        self.message_scroll.add_widget(self.leads_container)
         
-        scroll.add_widget(self.leads_container)
-        main_layout.add_widget(scroll)
+        self.list_area.add_widget(self.message_scroll)
+        main_layout.add_widget(self.list_area)
         
         self.add_widget(main_layout)
         
         # Initialize lead drawer (hidden initially)
         self.lead_drawer = LeadDrawer(
-            backend_url=self.backend_url,
-            token=None,  # Will be set when opening
             on_close_callback=self._on_drawer_close,
             on_update_callback=self._on_lead_update
         )
         self.add_widget(self.lead_drawer)
+        get_outbox().subscribe(self._on_lead_synced)
     
     def _on_drawer_close(self):
         """Handle drawer close event."""
         print("Drawer closed")
     
-    def _on_lead_update(self, lead_data):
-        """Handle lead update from drawer."""
-        print(f"Lead updated: {lead_data}")
-        # Refresh leads list
+    def _on_lead_update(self, lead_data, changes):
+        """Apply an edit from the drawer locally; the outbox sends it in the background."""
+        print(f"Lead updated: {lead_data.get('id')} {changes}")
         if self.leads_model:
+            self.leads_model.update_lead(lead_data, changes)
+            self.update_stats()
+            self.display_leads(self.leads_model.filtered_leads)
+        self._show_sync_status()
+    
+    def _on_lead_synced(self, lead_id, lead, outcome):
+        """Outbox listener: adopt the server's copy once an edit is saved, overruled or refused.
+
+        A refused edit without a server copy leaves the local lead alone; the next refresh reconciles it.
+        """
+        if self.leads_model and (lead is not None or outcome == "deleted"):
+            self.leads_model.apply_server_lead(lead_id, lead)
+            self.update_stats()
             self.display_leads(self.leads_model.filtered_leads)
+        if outcome == "synced":
+            self._show_sync_status()
+        else:
+            self.nav_bar.set_status(SYNC_OUTCOME_STATUS[outcome])
+    
+    def _show_sync_status(self):
+        pending = get_outbox().pending_count()
+        self.nav_bar.set_status(f"{pending} edit{'s' if pending != 1 else ''} waiting to sync" if pending else "All changes saved")
     
     def setup_menus(self):
         """Not needed for this design."""
         pass
     
     def on_search(self, instance, value):
-        """Handle search input."""
+        """Handle search input; the search runs once typing pauses for SEARCH_DEBOUNCE seconds."""
+        self._search_trigger.cancel()
+        self._search_trigger()
+    
+    def _run_search(self, dt):
         if self.leads_model:
-            filtered = self.leads_model.search_leads(value)
-            self.display_leads(filtered)
+            self.leads_model.search_leads_async(self.search_field.text, self.display_leads)
     
     def filter_leads(self, stage):
         """Filter leads by stage."""
@@ -404,8 +447,27 @@ class LeadsScreen(Screen):
         self.load_leads()
     
     def load_leads(self):
-        """Fetch leads from the backend."""
-        self.leads_container.clear_widgets()
+        """Show cached leads at once, then fetch the current list from the backend."""
+        app = App.get_running_app()
+        if not app.user_token:
+            self.show_error("Not authenticated")
+            return
+        
+        # One model per signed-in user, so re-entering the screen joins its fetch instead of racing it
+        if self.leads_model is None or self.leads_model.user_key != get_local_cache().user_key:
+            if self.leads_model is not None:
+                self.leads_model.cancel()
+            self.leads_model = LeadsModel()
+            self.leads_model.load_cached()
+        
+        if self.leads_model.fetched_at:
+            self.update_stats()
+            self.display_leads(self.leads_model.filtered_leads)
+            self.nav_bar.set_status(f"Updated {describe_age(self.leads_model.fetched_at)} · refreshing…")
+            self.leads_model.fetch_leads(self.on_leads_loaded)
+            return
+        
+        self._show_message_area()
         
         # Show loading indicator
         loading_card = BoxLayout(
@@ -421,22 +483,20 @@ class LeadsScreen(Screen):
         )
         loading_card.add_widget(loading_label)
         self.leads_container.add_widget(loading_card)
-        
-        # Initialize model
-        app = App.get_running_app()
-        if not app.user_token:
-            self.show_error("Not authenticated")
-            return
-        
-        self.leads_model = LeadsModel(self.backend_url, app.user_token)
+        self.nav_bar.set_status("Loading…")
         self.leads_model.fetch_leads(self.on_leads_loaded)
     
     def on_leads_loaded(self, success, data):
         """Callback when leads are loaded."""
         if success:
+            self.nav_bar.set_status("Updated just now")
             self.update_stats()
             self.display_leads(data)
+        elif self.leads_model and self.leads_model.fetched_at:
+            # Keep showing the cached list rather than replacing it with an error
+            self.nav_bar.set_status(f"Offline · updated {describe_age(self.leads_model.fetched_at)}")
         else:
+            self.nav_bar.set_status("")
             self.show_error(f"Error: {data}")
     
     def update_stats(self):
@@ -447,11 +507,17 @@ class LeadsScreen(Screen):
             self.new_leads_label.text = f"New: {stats['new']}"
             self.qualified_leads_label.text = f"Qualified: {stats['qualified']}"
     
-    def display_leads(self, leads):
-        """Display the leads list with enhanced design."""
+    def _show_message_area(self):
+        """Swap the lead list out for the (cleared) message container."""
         self.leads_container.clear_widgets()
-        
+        if self.message_scroll.parent is None:
+            self.list_area.clear_widgets()
+            self.list_area.add_widget(self.message_scroll)
+    
+    def display_leads(self, leads):
+        """Display the leads list; cards are created only for the visible rows and recycled on scroll."""
         if not leads:
+            self._show_message_area()
             empty_card = BoxLayout(
                 orientation='vertical',
                 size_hint_y=None,
@@ -469,198 +535,19 @@ class LeadsScreen(Screen):
             self.leads_container.add_widget(empty_card)
             return
         
-        for lead in leads:
-            lead_card = self.create_modern_lead_card(lead)
-            self.leads_container.add_widget(lead_card)
-    
-    def create_modern_lead_card(self, lead):
-        """Create a card matching the exact reference design."""
-        from kivy.graphics import Color, RoundedRectangle, Line
-
-        class ClickableCard(ButtonBehavior, BoxLayout):
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self._border = None
-                self._bg = None
-                
-                with self.canvas.before:
-                    Color(0.8, 0.8, 0.8, 1)
-                    self._border = Line(width=1.5)
-                    Color(1, 1, 1, 1)
-                    self._bg = Rectangle()
-                
-                self.bind(pos=self._update_canvas, size=self._update_canvas)
-            
-            def _update_canvas(self, instance, value):
-                if self._border and self._bg:
-                    self._border.rectangle = (
-                        self.x, self.y,
-                        self.width, self.height
-                    )
-                    self._bg.pos = self.pos
-                    self._bg.size = self.size
-
-        card = ClickableCard(
-            size_hint_y=None,
-            height=dp(130),
-            padding=dp(20),
-            spacing=0
-        )
-        card.bind(on_press=lambda x: self.show_lead_details(lead))
-        
-        # Left column - contact info
-        left_col = BoxLayout(orientation='vertical', spacing=dp(3), size_hint_x=0.65)
-        
-        # Name
-        name = f"{lead.get('first_name', '')} {lead.get('last_name', '')}".strip() or "Unnamed Lead"
-        name_label = Label(
-            text=name,
-            font_size='20sp',
-            bold=True,
-            color=(0, 0, 0, 1),
-            halign='left',
-            valign='top',
-            size_hint_y=None,
-            height=dp(30)
-        )
-        name_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        # Company
-        company = lead.get('company', 'No Company')
-        company_label = Label(
-            text=company,
-            font_size='14sp',
-            color=(0.5, 0.5, 0.5, 1),
-            halign='left',
-            valign='top',
-            size_hint_y=None,
-            height=dp(22)
-        )
-        company_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        # Email row
-        email_row = BoxLayout(spacing=dp(8), size_hint_y=None, height=dp(24))
-        email_icon = MDIcon(
-            icon='email-outline',
-            theme_text_color="Secondary",
-            size_hint_x=None,
-            width=dp(20)
-        )
-        email = lead.get('email', 'No email')
-        email_label = Label(
-            text=email,
-            font_size='14sp',
-            color=(0.3, 0.3, 0.3, 1),
-            halign='left',
-            valign='middle'
-        )
-        email_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        email_row.add_widget(email_icon)
-        email_row.add_widget(email_label)
-        
-        # Phone row
-        phone_row = BoxLayout(spacing=dp(8), size_hint_y=None, height=dp(24))
-        phone_icon = MDIcon(
-            icon='phone',
-            theme_text_color="Secondary",
-            size_hint_x=None,
-            width=dp(20)
-        )
-        phone = lead.get('phone', 'No phone')
-        phone_label = Label(
-            text=phone,
-            font_size='14sp',
-            color=(0.3, 0.3, 0.3, 1),
-            halign='left',
-            valign='middle'
-        )
-        phone_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        phone_row.add_widget(phone_icon)
-        phone_row.add_widget(phone_label)
-        
-        left_col.add_widget(name_label)
-        left_col.add_widget(company_label)
-        left_col.add_widget(email_row)
-        left_col.add_widget(phone_row)
-        
-        # Right column - status, value, priority
-        right_col = BoxLayout(
-            orientation='vertical',
-            spacing=dp(8),
-            size_hint_x=0.35,
-            padding=(dp(10), 0, 0, 0)
-        )
-        
-        # Helper function to create badge
-        def create_badge(text, width=dp(100)):
-            container = BoxLayout(
-                size_hint=(None, None),
-                size=(width, dp(28)),
-                pos_hint={'right': 1}
-            )
-            
-            with container.canvas.before:
-                Color(0.92, 0.92, 0.92, 1)
-                container._bg = Rectangle()
-                
-                def update_bg(instance, value):
-                    instance._bg.pos = instance.pos
-                    instance._bg.size = instance.size
-                
-                container.bind(pos=update_bg, size=update_bg)
-            
-            label = Label(
-                text=text.upper(),
-                font_size='12sp',
-                bold=True,
-                color=(0.4, 0.4, 0.4, 1)
-            )
-            container.add_widget(label)
-            return container
-        
-        # Status badge
-        status = lead.get('status', 'new')
-        status_badge = create_badge(status)
-        
-        # Value label (centered in remaining space)
-        value = lead.get('value', 0)
-        value_label = Label(
-            text=f"${value:,.2f}",
-            font_size='18sp',
-            color=(0, 0, 0, 1),
-            halign='right',
-            valign='middle',
-            size_hint_y=1
-        )
-        value_label.bind(size=value_label.setter('text_size'))
-        
-        # Priority badge
-        priority = lead.get('priority', 'medium')
-        priority_text = 'PRIVILIET' if priority == 'high' else priority
-        priority_badge = create_badge(priority_text)
-        
-        right_col.add_widget(status_badge)
-        right_col.add_widget(value_label)
-        right_col.add_widget(priority_badge)
-        
-        # Add columns to card
-        card.add_widget(left_col)
-        card.add_widget(right_col)
-        
-        return card
+        if self.leads_view.parent is None:
+            self.list_area.clear_widgets()
+            self.list_area.add_widget(self.leads_view)
+        self.leads_view.set_leads(leads)
     
     def show_lead_details(self, lead):
         """Show detailed lead information in a drawer."""
-        # Update drawer token
-        app = App.get_running_app()
-        self.lead_drawer.token = app.user_token
-        
         # Open drawer with lead data
         self.lead_drawer.open(lead)
     
     def show_error(self, message):
         """Display error message."""
-        self.leads_container.clear_widgets()
+        self._show_message_area()
         error_card = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
@@ -816,12 +703,17 @@ class PhoenixCRMApp(MDApp):
     def on_login_success(self, token, user):
         print(f"Login successful! Token: {token}, User: {user}")
         self.user_token = token
+        get_api_client().token = token
+        get_local_cache().user_key = user.get("id") or user.get("email")
+        get_outbox().start()
         self.user_full_name = user.get("full_name")
         self.user_email = user.get("email")
         self.screen_manager.current = 'dashboard'
 
     def on_logout(self):
         self.user_token = None
+        get_api_client().token = None
+        get_local_cache().user_key = None
         self.user_full_name = None
         self.user_email = None
         self.screen_manager.current = 'login'
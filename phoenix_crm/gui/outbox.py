@@ -0,0 +1,238 @@
+"""
+Durable outbox for lead edits made in the GUI
+
+Edits are applied to the in-memory LeadsModel straight away and queued here,
+in the same SQLite file as the response cache, so they survive a restart.
+A background thread replays them to the backend one at a time, oldest first,
+backing off with jitter while the backend is unreachable.
+
+Conflicts are settled on updated_at: each edit remembers the lead's
+updated_at it was made against and when it was made. If the server copy has
+changed since then, and that change is newer than the edit, the server wins
+and the edit is dropped; otherwise the edit is written (last writer wins).
+
+Listeners registered with subscribe() are called on the Kivy thread as
+callback(lead_id, lead, outcome), where outcome is "synced" (lead is the
+saved copy), "conflict" (lead is the server copy), "rejected" (the server
+refused the edit and it was dropped; lead is the server copy, or None if it
+could not be fetched and the local copy should be kept) or "deleted" (the
+lead no longer exists; lead is None).
+"""
+import json
+import time
+import random
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+import requests
+from kivy.clock import Clock
+
+try:
+    from .api_client import get_api_client
+    from .local_cache import CACHE_PATH, get_local_cache
+    from .tracing import start_span
+except ImportError:
+    from gui.api_client import get_api_client
+    from gui.local_cache import CACHE_PATH, get_local_cache
+    from gui.tracing import start_span
+
+# Replay backoff: full jitter up to min(MAX_DELAY, BASE_DELAY * 2**failures) seconds
+BASE_DELAY = 1.0
+MAX_DELAY = 60.0
+
+# How often an idle worker checks for a signed-in user with queued edits
+IDLE_POLL = 5.0
+
+# The backend refused the edit itself; retrying will not help
+_REJECTED = (400, 409, 422)
+
+# The lead is gone, so is the edit
+_DELETED = 404
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_key TEXT NOT NULL,
+    lead_id TEXT NOT NULL,
+    changes TEXT NOT NULL,
+    base_updated_at TEXT,
+    edited_at REAL NOT NULL
+)
+"""
+
+
+def parse_timestamp(value):
+    """Epoch seconds for an ISO-8601 updated_at (naive values are UTC), or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class Outbox:
+    """Persistent FIFO of lead edits with a single replay thread."""
+
+    def __init__(self, api=None, cache=None, path=CACHE_PATH):
+        self.api = api or get_api_client()
+        self.cache = cache or get_local_cache()
+        self.path = Path(path)
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._failures = 0
+        self._conn = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+        except sqlite3.Error as e:
+            # Edits are still sent, just not kept across a restart
+            print(f"Outbox store unavailable ({self.path}), using memory: {e}")
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            self._conn.execute(_SCHEMA)
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def start(self):
+        """Start the replay thread if it is not running yet."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="outbox", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def enqueue(self, lead_id, changes, base_updated_at):
+        """Queue `changes` to lead `lead_id`, made against the copy last updated at `base_updated_at`."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO outbox (user_key, lead_id, changes, base_updated_at, edited_at) VALUES (?, ?, ?, ?, ?)",
+                (self.cache.user_key or "", str(lead_id), json.dumps(changes), base_updated_at, time.time()),
+            )
+        self.start()
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE user_key = ?", (self.cache.user_key or "",)
+            ).fetchone()[0]
+
+    def pending_changes(self):
+        """lead_id -> merged queued changes, for overlaying on freshly fetched leads."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT lead_id, changes FROM outbox WHERE user_key = ? ORDER BY id", (self.cache.user_key or "",)
+            ).fetchall()
+        merged = {}
+        for lead_id, changes in rows:
+            merged.setdefault(lead_id, {}).update(json.loads(changes))
+        return merged
+
+    def _next(self):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, lead_id, changes, base_updated_at, edited_at FROM outbox"
+                " WHERE user_key = ? ORDER BY id LIMIT 1",
+                (self.cache.user_key or "",),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"id": row[0], "lead_id": row[1], "changes": json.loads(row[2]),
+                "base_updated_at": row[3], "edited_at": row[4]}
+
+    def _done(self, op, lead=None):
+        with self._lock:
+            self._conn.execute("DELETE FROM outbox WHERE id = ?", (op["id"],))
+            if lead and lead.get("updated_at"):
+                # Our own write moved updated_at on; later edits to this lead build on it
+                self._conn.execute(
+                    "UPDATE outbox SET base_updated_at = ? WHERE lead_id = ? AND user_key = ?",
+                    (lead["updated_at"], op["lead_id"], self.cache.user_key or ""),
+                )
+
+    def _notify(self, lead_id, lead, outcome):
+        for callback in list(self._listeners):
+            Clock.schedule_once(lambda dt, cb=callback: cb(lead_id, lead, outcome))
+
+    def _run(self):
+        while True:
+            self._wake.clear()
+            op = self._next() if self.api.token else None
+            if op is None:
+                self._wake.wait(IDLE_POLL)
+                continue
+            if self._replay(op):
+                self._failures = 0
+            else:
+                self._failures += 1
+                time.sleep(random.uniform(0, min(MAX_DELAY, BASE_DELAY * (2 ** self._failures))))
+
+    def _replay(self, op):
+        """Send one queued edit; False if it should be retried later."""
+        lead_id = op["lead_id"]
+        path = f"/api/leads/{lead_id}"
+        with start_span("outbox.replay", **{"lead.id": lead_id}):
+            try:
+                current = self.api.get(path, timeout=10)
+                if current.status_code == _DELETED:
+                    self._done(op)
+                    self._notify(lead_id, None, "deleted")
+                    return True
+                if current.status_code in _REJECTED:
+                    print(f"❌ Lead {lead_id} could not be fetched for replay: {current.status_code}")
+                    self._done(op)
+                    self._notify(lead_id, None, "rejected")
+                    return True
+                if current.status_code != 200:
+                    return False
+                server = current.json()
+
+                server_ts = parse_timestamp(server.get("updated_at"))
+                base_ts = parse_timestamp(op["base_updated_at"])
+                if server_ts and base_ts and server_ts > base_ts and server_ts > op["edited_at"]:
+                    print(f"⚠️ Lead {lead_id} changed on the server after this edit; keeping the server copy")
+                    self._done(op)
+                    self._notify(lead_id, server, "conflict")
+                    return True
+
+                response = self.api.put(path, json=op["changes"], timeout=10)
+                if response.status_code == 200:
+                    saved = response.json()
+                    self._done(op, saved)
+                    self._notify(lead_id, saved, "synced")
+                    return True
+                if response.status_code == _DELETED:
+                    self._done(op)
+                    self._notify(lead_id, None, "deleted")
+                    return True
+                if response.status_code in _REJECTED:
+                    print(f"❌ Lead {lead_id} edit rejected: {response.status_code}")
+                    self._done(op)
+                    self._notify(lead_id, server, "rejected")
+                    return True
+                return False
+            except (requests.RequestException, ValueError) as e:
+                print(f"Outbox replay failed for lead {lead_id}: {e}")
+                return False
+
+
+_outbox = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox():
+    """The GUI-wide Outbox."""
+    global _outbox
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None:
+                _outbox = Outbox()
+    return _outbox
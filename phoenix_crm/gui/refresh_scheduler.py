@@ -0,0 +1,135 @@
+"""
+Single scheduler for every periodic refresh in the PhoenixCRM GUI
+
+Widgets register a refresh job instead of installing their own
+Clock.schedule_interval. One 1-second Clock tick decides which jobs are due:
+
+- jobs whose widget is not on screen are skipped (a screen that is not
+  current is detached from the window) and run as soon as it is shown again
+  if they fell due meanwhile; nothing runs while the window is minimized
+- each time a job reports that its data came back unchanged its interval
+  doubles, up to max_interval; a change resets it
+- while the user is actively working (input in the last ACTIVE_WINDOW
+  seconds) intervals are divided by ACTIVE_SPEEDUP, down to min_interval
+- every interval is jittered by +/-JITTER so many clients started together
+  do not poll the backend in lockstep
+"""
+import time
+import random
+from kivy.clock import Clock
+from kivy.core.window import Window
+
+# Seconds since the last touch, key press or mouse movement that count as active use
+ACTIVE_WINDOW = 60.0
+ACTIVE_SPEEDUP = 2.0
+JITTER = 0.2
+
+
+class RefreshJob:
+    """One registered refresh and its current backoff state."""
+
+    def __init__(self, name, callback, interval, min_interval=None, max_interval=None, widget=None):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.min_interval = min_interval or interval / ACTIVE_SPEEDUP
+        self.max_interval = max_interval or interval * 4
+        self.widget = widget
+        self.unchanged = 0
+        self.next_due = 0.0
+
+    def visible(self):
+        return self.widget is None or self.widget.get_root_window() is not None
+
+    def current_interval(self, active):
+        interval = min(self.max_interval, self.interval * (2 ** self.unchanged))
+        if active:
+            interval = max(self.min_interval, interval / ACTIVE_SPEEDUP)
+        return interval * random.uniform(1 - JITTER, 1 + JITTER)
+
+
+class RefreshScheduler:
+    """Owns the GUI's periodic refreshes; see the module docstring for the policy."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.minimized = False
+        self.last_activity = time.monotonic()
+        self._event = None
+
+    def register(self, name, callback, interval, min_interval=None, max_interval=None, widget=None):
+        """Run callback() about every `interval` seconds while `widget` (if given) is on screen.
+
+        The first run is one interval away; the caller does its own initial load.
+        Call report(name, changed) after each refresh to drive the backoff.
+        """
+        job = RefreshJob(name, callback, interval, min_interval, max_interval, widget)
+        job.next_due = time.monotonic() + job.current_interval(self.active)
+        self.jobs[name] = job
+        self._start()
+        return job
+
+    def unregister(self, name):
+        self.jobs.pop(name, None)
+
+    @property
+    def active(self):
+        return time.monotonic() - self.last_activity < ACTIVE_WINDOW
+
+    def report(self, name, changed):
+        """Record the outcome of a refresh of `name` (from any thread) and schedule the next one."""
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        job.unchanged = 0 if changed else min(job.unchanged + 1, 8)
+        job.next_due = time.monotonic() + job.current_interval(self.active)
+
+    def note_activity(self, *args):
+        was_active = self.active
+        self.last_activity = time.monotonic()
+        if not was_active:
+            # Coming back to the app: bring jobs that backed off while idle forward
+            now = time.monotonic()
+            for job in self.jobs.values():
+                job.next_due = min(job.next_due, now + job.current_interval(True))
+
+    def _start(self):
+        if self._event is not None:
+            return
+        Window.bind(on_minimize=self._on_minimize, on_restore=self._on_restore,
+                    on_touch_down=self.note_activity, on_key_down=self.note_activity,
+                    mouse_pos=self.note_activity)
+        self._event = Clock.schedule_interval(self._tick, 1)
+
+    def _on_minimize(self, *args):
+        self.minimized = True
+
+    def _on_restore(self, *args):
+        self.minimized = False
+        self.note_activity()
+
+    def _tick(self, dt):
+        if self.minimized:
+            return
+        now = time.monotonic()
+        active = self.active
+        for job in list(self.jobs.values()):
+            if now < job.next_due or not job.visible():
+                continue
+            # Provisional; report() replaces it once the refresh finishes
+            job.next_due = now + job.current_interval(active)
+            try:
+                job.callback()
+            except Exception as e:
+                print(f"Refresh '{job.name}' failed: {e}")
+
+
+_scheduler = None
+
+
+def get_refresh_scheduler():
+    """The GUI-wide RefreshScheduler; register from the Kivy thread, report from any."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RefreshScheduler()
+    return _scheduler
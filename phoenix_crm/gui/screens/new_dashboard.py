@@ -11,15 +11,75 @@ from kivy.uix.progressbar import ProgressBar
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.metrics import dp
 from kivy.clock import Clock
-from kivy.core.window import Window
 from kivy.animation import Animation
 from kivy.app import App
-import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
 from gui.components.dashboard_card import DashboardCard
 from gui.components.navigation_bar import NavigationBar
+from gui.components.dashboard_rows import AppointmentRow, LeadRow, GoalRow, ListRow, NotificationRow, TrainingRow
+from gui.components.keyed_list import KeyedList
 from gui.components.leaderboard_banner import LeaderboardBanner
+from gui.api_client import get_api_client
+from gui.local_cache import get_local_cache, describe_age
+from gui.refresh_scheduler import get_refresh_scheduler
+from gui.single_flight import SingleFlight
+from gui.tracing import start_span
+
+# (name, endpoint, query params, label); fetched in parallel, each filling <name>_data.
+# `limit` is the number of items the panel shows, so the server returns no more than that.
+DASHBOARD_PANELS = (
+    ("appointments", "/api/appointments/", {"limit": 5, "order": "appointment_time"}, "appointments"),
+    ("leads", "/api/leads/", {"limit": 5, "order": "-created_at"}, "leads"),
+    ("goals", "/api/goals/", {"limit": 3, "order": "-created_at"}, "goals"),
+    ("notifications", "/api/notifications/", {"limit": 5, "order": "-created_at"}, "notifications"),
+    ("worksheets", "/api/worksheets/", {"limit": 3, "order": "-last_modified"}, "worksheets"),
+    ("training", "/api/training/", {"limit": 5, "order": "-created_at"}, "training items"),
+)
+
+# Shared by all refreshes, so overlapping refreshes cannot multiply the connections to the backend
+_fetch_executor = ThreadPoolExecutor(max_workers=len(DASHBOARD_PANELS), thread_name_prefix="dashboard-fetch")
+
+# Notification types to simple ASCII icons that will render
+NOTIFICATION_ICONS = {
+    'lead': '*',
+    'appointment': '>',
+    'reminder': '!',
+    'goal': '+',
+    'update': '#',
+    'system': '@',
+    'message': 'M',
+    'alert': '!',
+    'success': 'V',
+    'task': '-'
+}
+
+# Training categories to simple ASCII icons that will render
+TRAINING_CATEGORY_ICONS = {
+    'software training': 'PC',
+    'sales skills': '$',
+    'sales': '$',
+    'client relations': '<>',
+    'market knowledge': '^',
+    'market': '^',
+    'marketing': '#',
+    'productivity': '++',
+    'legal': 'L',
+    'compliance': 'C',
+    'personal development': '+',
+    'development': 'D',
+    'communication': 'M',
+    'negotiation': '<>',
+    'leadership': 'L',
+    'technology': 'T',
+    'finance': '$',
+    'strategy': 'S',
+    'customer service': '*',
+    'customer': '*',
+    'presentation': 'P',
+    'training': 'T'
+}
 
 
 class NewDashboardScreen(Screen):
@@ -28,7 +88,6 @@ class NewDashboardScreen(Screen):
     def __init__(self, on_logout_callback, **kwargs):
         super().__init__(**kwargs)
         self.on_logout_callback = on_logout_callback
-        self.backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
         
         # Data containers
         self.appointments_data = []
@@ -38,6 +97,11 @@ class NewDashboardScreen(Screen):
         self.worksheets_data = []
         self.training_data = []
         
+        # When each panel's data was fetched (epoch seconds), for the freshness indicator
+        self.fetched_at = {}
+        self.refreshing = False
+        self._flights = SingleFlight()
+        
         # Reference to main layout for adding leaderboard later
         self.main_layout = None
         self.leaderboard_banner = None
@@ -45,9 +109,20 @@ class NewDashboardScreen(Screen):
         
         self._build_ui()
         
-        # Don't schedule data refresh on init - wait until screen is entered
-        # Clock.schedule_interval will still run for periodic refresh
-        Clock.schedule_interval(lambda dt: self.refresh_all_data(), 300)  # Every 5 min
+        # Panel rows are keyed by record id, so a refresh only touches the rows that changed
+        self._panels = {
+            'appointments': KeyedList(self.appointments_list, AppointmentRow),
+            'leads': KeyedList(self.leads_list, LeadRow),
+            'goals': KeyedList(self.goals_content, GoalRow),
+            'notifications': KeyedList(self.notifications_list, NotificationRow),
+            'worksheets': KeyedList(self.worksheets_list, ListRow),
+            'training': KeyedList(self.training_list, TrainingRow),
+        }
+        
+        # The first load happens in on_enter; the scheduler only runs these while the dashboard is shown
+        scheduler = get_refresh_scheduler()
+        scheduler.register("dashboard", self.refresh_all_data, 300, min_interval=60, max_interval=1200, widget=self)
+        scheduler.register("dashboard.freshness", self._update_freshness, 30, widget=self)
     
     def on_enter(self):
         """Called when the screen is entered (after login)."""
@@ -58,16 +133,38 @@ class NewDashboardScreen(Screen):
             app = App.get_running_app()
             if app.user_token:
                 print("🏆 Adding leaderboard banner to dashboard")
-                self.leaderboard_banner = LeaderboardBanner(
-                    backend_url=self.backend_url,
-                    token=app.user_token
-                )
+                self.leaderboard_banner = LeaderboardBanner()
                 # Insert leaderboard between nav bar (index 0) and content (index 1)
                 self.main_layout.add_widget(self.leaderboard_banner, index=len(self.main_layout.children) - 1)
                 print("✅ Leaderboard banner added successfully")
         
-        # Fetch data immediately when entering the screen
+        # Show the last session's data at once, then revalidate in the background
+        self._render_cached()
         self.refresh_all_data()
+    
+    def _render_cached(self):
+        """Fill every panel from the local cache, if it has a copy."""
+        cache = get_local_cache()
+        for name, _, _, _ in DASHBOARD_PANELS:
+            if name in self.fetched_at:
+                continue
+            cached = cache.get(f"dashboard:{name}")
+            if cached:
+                data, fetched_at = cached
+                setattr(self, f"{name}_data", data)
+                self.fetched_at[name] = fetched_at
+                getattr(self, f"_update_{name}")()
+        self._update_freshness()
+    
+    def _update_freshness(self):
+        """Describe the oldest panel's age in the navigation bar."""
+        if not self.fetched_at:
+            text = "Loading…" if self.refreshing else ""
+        else:
+            text = f"Updated {describe_age(min(self.fetched_at.values()))}"
+            if self.refreshing:
+                text += " · refreshing…"
+        self.nav_bar.set_status(text)
 
     def _build_ui(self):
         """Build the dashboard UI."""
@@ -81,12 +178,12 @@ class NewDashboardScreen(Screen):
         self.main_layout.bind(size=lambda i, v: setattr(self.main_layout._bg, 'size', v))
         
         # Navigation bar
-        nav_bar = NavigationBar(
+        self.nav_bar = NavigationBar(
             title="Phoenix CRM",
             show_back=False,
             on_logout=self.logout
         )
-        self.main_layout.add_widget(nav_bar)
+        self.main_layout.add_widget(self.nav_bar)
         
         # NOTE: Leaderboard banner will be added in on_enter() when user_token is available
         
@@ -297,513 +394,87 @@ class NewDashboardScreen(Screen):
         
         return ai_panel
     
-    def _create_appointment_item(self, client_name, time, status="pending"):
-        """Create appointment item with hover effect."""
-        
-        class HoverableItem(BoxLayout):
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self.is_hovering = False
-                
-                with self.canvas.before:
-                    # Border
-                    Color(0.92, 0.92, 0.92, 1)
-                    self._border = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                    # Background with Color instruction
-                    self._bg_color = Color(1, 1, 1, 0)
-                    self._bg = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                
-                self.bind(pos=self._update_graphics, size=self._update_graphics)
-                Window.bind(mouse_pos=self.on_mouse_pos)
-            
-            def _update_graphics(self, *args):
-                self._border.pos = self.pos
-                self._border.size = self.size
-                self._bg.pos = self.pos
-                self._bg.size = self.size
-            
-            def on_mouse_pos(self, window, pos):
-                if not self.get_root_window():
-                    return
-                is_colliding = self.collide_point(*self.to_widget(*pos))
-                if is_colliding != self.is_hovering:
-                    self.is_hovering = is_colliding
-                    if is_colliding:
-                        # Hover: light background
-                        self._bg_color.rgba = (0.98, 0.98, 0.98, 1)
-                    else:
-                        # Normal: transparent
-                        self._bg_color.rgba = (1, 1, 1, 0)
-        
-        item = HoverableItem(
-            size_hint_y=None,
-            height=dp(52),
-            spacing=dp(10),
-            padding=(dp(12), dp(8))
-        )
-        
-        avatar = Label(
-            text="👤",
-            font_size='22sp',
-            size_hint_x=None,
-            width=dp(35)
-        )
-        
-        info = BoxLayout(orientation='vertical', spacing=dp(2))
-        name_label = Label(
-            text=client_name,
-            font_size='15sp',
-            bold=True,
-            color=(0.15, 0.15, 0.15, 1),
-            halign='left',
-            size_hint_y=None,
-            height=dp(20)
-        )
-        name_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        time_label = Label(
-            text=time,
-            font_size='13sp',
-            color=(0.5, 0.5, 0.5, 1),
-            halign='left',
-            size_hint_y=None,
-            height=dp(18)
-        )
-        time_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        info.add_widget(name_label)
-        info.add_widget(time_label)
-        
-        status_colors = {
-            'confirmed': (0.2, 0.8, 0.3, 1),
-            'pending': (1, 0.6, 0, 1),
-            'canceled': (0.9, 0.2, 0.2, 1)
-        }
-        
-        # Modern status indicator
-        status_container = BoxLayout(
-            orientation='vertical',
-            size_hint_x=None,
-            width=dp(8),
-            padding=(0, dp(10), 0, dp(10))
-        )
-        status_bar = BoxLayout(size_hint_y=1)
-        with status_bar.canvas.before:
-            Color(*status_colors.get(status, (0.5, 0.5, 0.5, 1)))
-            status_bar._bg = RoundedRectangle(
-                pos=status_bar.pos,
-                size=status_bar.size,
-                radius=[dp(4)]
-            )
-            status_bar.bind(
-                pos=lambda i, v: setattr(i._bg, 'pos', v),
-                size=lambda i, v: setattr(i._bg, 'size', v)
-            )
-        status_container.add_widget(status_bar)
-        
-        item.add_widget(status_container)
-        item.add_widget(avatar)
-        item.add_widget(info)
-        
-        return item
-    
-    def _create_lead_item(self, name, company, value, stage):
-        """Create lead item with hover effect."""
-        
-        class HoverableLeadItem(BoxLayout):
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self.is_hovering = False
-                
-                with self.canvas.before:
-                    # Shadow with Color instruction
-                    self._shadow_color = Color(0, 0, 0, 0.05)
-                    self._shadow = RoundedRectangle(
-                        pos=(self.x, self.y - dp(2)),
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                    # Border
-                    Color(0.9, 0.9, 0.9, 1)
-                    self._border = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                    # Background
-                    Color(1, 1, 1, 1)
-                    self._bg = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                
-                self.bind(pos=self._update_graphics, size=self._update_graphics)
-                Window.bind(mouse_pos=self.on_mouse_pos)
-            
-            def _update_graphics(self, *args):
-                self._bg.pos = self.pos
-                self._bg.size = self.size
-                self._border.pos = self.pos
-                self._border.size = self.size
-                self._shadow.pos = (self.x, self.y - dp(2))
-                self._shadow.size = self.size
-            
-            def on_mouse_pos(self, window, pos):
-                if not self.get_root_window():
-                    return
-                is_colliding = self.collide_point(*self.to_widget(*pos))
-                if is_colliding != self.is_hovering:
-                    self.is_hovering = is_colliding
-                    if is_colliding:
-                        # Hover: elevate shadow
-                        self._shadow.pos = (self.x, self.y - dp(4))
-                        self._shadow_color.rgba = (0, 0, 0, 0.12)
-                    else:
-                        # Normal
-                        self._shadow.pos = (self.x, self.y - dp(2))
-                        self._shadow_color.rgba = (0, 0, 0, 0.05)
-        
-        item = HoverableLeadItem(
-            size_hint_y=None,
-            height=dp(56),
-            spacing=dp(10),
-            padding=(dp(16), dp(10))
-        )
-        
-        avatar = Label(text="👤", font_size='24sp', size_hint_x=None, width=dp(40))
-        
-        info = BoxLayout(orientation='vertical', spacing=dp(3))
-        name_label = Label(
-            text=name,
-            font_size='15sp',
-            bold=True,
-            color=(0.15, 0.15, 0.15, 1),
-            halign='left',
-            size_hint_y=None,
-            height=dp(20)
-        )
-        name_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        company_label = Label(
-            text=company,
-            font_size='13sp',
-            color=(0.5, 0.5, 0.5, 1),
-            halign='left',
-            size_hint_y=None,
-            height=dp(18)
-        )
-        company_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        info.add_widget(name_label)
-        info.add_widget(company_label)
-        item.add_widget(avatar)
-        item.add_widget(info)
-        return item
-    
-    def _create_goal_item(self, title, progress=0):
-        """Create goal item with proper spacing for progress bar."""
-        container = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80), spacing=dp(12))
-        
-        # Title row with icon
-        title_row = BoxLayout(size_hint_y=None, height=dp(32), spacing=dp(8))
-        
-        target_icon = Label(
-            text="🎯",
-            font_size='18sp',
-            size_hint_x=None,
-            width=dp(28)
-        )
-        
-        title_label = Label(
-            text=title,
-            font_size='14sp',
-            bold=True,
-            color=(0.25, 0.25, 0.25, 1),
-            halign='left',
-            valign='middle'
-        )
-        title_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        progress_text = Label(
-            text=f"{int(progress)}%",
-            font_size='14sp',
-            bold=True,
-            color=(1, 0.4, 0, 1),
-            size_hint_x=None,
-            width=dp(50),
-            halign='right'
-        )
-        
-        title_row.add_widget(target_icon)
-        title_row.add_widget(title_label)
-        title_row.add_widget(progress_text)
-        
-        # Progress bar with custom styling
-        progress_container = BoxLayout(size_hint_y=None, height=dp(14))
-        
-        with progress_container.canvas.before:
-            # Background track
-            Color(0.9, 0.9, 0.9, 1)
-            progress_container._track = RoundedRectangle(
-                pos=progress_container.pos,
-                size=progress_container.size,
-                radius=[dp(7)]
-            )
-            # Progress fill
-            Color(1, 0.4, 0, 1)
-            progress_container._fill = RoundedRectangle(
-                pos=progress_container.pos,
-                size=(progress_container.width * (progress / 100), progress_container.height),
-                radius=[dp(7)]
-            )
-        
-        def update_progress_bar(instance, value):
-            instance._track.pos = instance.pos
-            instance._track.size = instance.size
-            instance._fill.pos = instance.pos
-            instance._fill.size = (instance.width * (progress / 100), instance.height)
-        
-        progress_container.bind(pos=update_progress_bar, size=update_progress_bar)
-        
-        container.add_widget(title_row)
-        container.add_widget(progress_container)
-        return container
-    
-    def _create_list_item(self, text, icon=""):
-        """Create generic list item with modern styling and better icons."""
-        
-        class HoverableListItem(BoxLayout):
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self.is_hovering = False
-                
-                with self.canvas.before:
-                    self._bg_color = Color(0.98, 0.98, 0.98, 0)
-                    self._bg = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                    # Add subtle left border accent
-                    self._accent_color = Color(1, 0.4, 0, 0)
-                    self._accent = RoundedRectangle(
-                        pos=self.pos,
-                        size=(dp(3), self.height),
-                        radius=[dp(2), 0, 0, dp(2)]
-                    )
-                
-                self.bind(pos=self._update_bg, size=self._update_bg)
-                Window.bind(mouse_pos=self.on_mouse_pos)
-            
-            def _update_bg(self, *args):
-                self._bg.pos = self.pos
-                self._bg.size = self.size
-                self._accent.pos = self.pos
-                self._accent.size = (dp(3), self.height)
-            
-            def on_mouse_pos(self, window, pos):
-                if not self.get_root_window():
-                    return
-                is_colliding = self.collide_point(*self.to_widget(*pos))
-                if is_colliding != self.is_hovering:
-                    self.is_hovering = is_colliding
-                    if is_colliding:
-                        self._bg_color.rgba = (0.96, 0.96, 0.96, 1)
-                        self._accent_color.rgba = (1, 0.4, 0, 1)
-                    else:
-                        self._bg_color.rgba = (0.98, 0.98, 0.98, 0)
-                        self._accent_color.rgba = (1, 0.4, 0, 0)
-        
-        item = HoverableListItem(
-            size_hint_y=None,
-            height=dp(42),
-            padding=(dp(12), dp(6)),
-            spacing=dp(10)
-        )
-        
-        # Icon with background circle
-        if icon:
-            icon_container = BoxLayout(
-                size_hint_x=None,
-                width=dp(32),
-                padding=(dp(4), dp(4))
-            )
-            
-            with icon_container.canvas.before:
-                Color(0.95, 0.95, 0.95, 1)
-                icon_container._bg = RoundedRectangle(
-                    pos=icon_container.pos,
-                    size=icon_container.size,
-                    radius=[dp(16)]
-                )
-                icon_container.bind(
-                    pos=lambda i, v: setattr(i._bg, 'pos', v),
-                    size=lambda i, v: setattr(i._bg, 'size', v)
-                )
-            
-            icon_label = Label(
-                text=icon,
-                font_size='18sp',
-                halign='center',
-                valign='middle'
-            )
-            icon_container.add_widget(icon_label)
-            item.add_widget(icon_container)
-        
-        # Text content
-        text_container = BoxLayout(orientation='vertical', spacing=dp(2))
-        
-        main_label = Label(
-            text=text,
-            font_size='13sp',
-            bold=True,
-            color=(0.2, 0.2, 0.2, 1),
-            halign='left',
-            valign='middle',
-            size_hint_y=None,
-            height=dp(18)
-        )
-        main_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        # ADD THE LABEL TO THE CONTAINER - THIS WAS MISSING!
-        text_container.add_widget(main_label)
-        item.add_widget(text_container)
-        
-        # Chevron indicator
-        chevron = Label(
-            text="›",
-            font_size='20sp',
-            color=(0.6, 0.6, 0.6, 1),
-            size_hint_x=None,
-            width=dp(20)
-        )
-        item.add_widget(chevron)
-        
-        return item
-
     def refresh_all_data(self):
-        """Refresh all dashboard data from backend."""
+        """Refresh all dashboard data from backend; joins a refresh that is already running."""
         import threading
-        thread = threading.Thread(target=self._fetch_all_data, daemon=True)
+        flight = self._flights.start("dashboard")
+        if flight is None:
+            print("↪️ Dashboard refresh already in flight")
+            return
+        thread = threading.Thread(target=self._fetch_all_data, args=(flight,), daemon=True)
         thread.start()
     
-    def _fetch_all_data(self):
-        """Fetch data from backend in background thread."""
-        import requests
-        
+    def _fetch_all_data(self, flight):
+        """Fetch every panel concurrently; each panel redraws as soon as its own data arrives."""
         app = App.get_running_app()
         if not app.user_token:
             print("⚠️ No user token available for data fetch")
+            self._flights.finish(flight)
             return
         
-        headers = {"Authorization": f"Bearer {app.user_token}"}
         print(f"🔄 Fetching dashboard data with token: {app.user_token[:20]}...")
         
+        self.refreshing = True
+        Clock.schedule_once(lambda dt: self._update_freshness())
         try:
-            # Fetch appointments
-            print("📅 Fetching appointments...")
-            resp = requests.get(f"{self.backend_url}/api/appointments/", headers=headers, timeout=5)
-            print(f"  Status: {resp.status_code}")
-            if resp.status_code == 200:
-                self.appointments_data = resp.json()[:5]
-                print(f"  ✓ Got {len(self.appointments_data)} appointments")
-                Clock.schedule_once(lambda dt: self._update_appointments())
-            else:
-                print(f"  ✗ Error: {resp.text}")
-        except Exception as e:
-            print(f"  ✗ Exception: {e}")
-        
-        try:
-            # Fetch leads
-            print("👤 Fetching leads...")
-            resp = requests.get(f"{self.backend_url}/api/leads/", headers=headers, timeout=5)
-            print(f"  Status: {resp.status_code}")
-            if resp.status_code == 200:
-                self.leads_data = resp.json()[:5]
-                print(f"  ✓ Got {len(self.leads_data)} leads")
-                Clock.schedule_once(lambda dt: self._update_leads())
-            else:
-                print(f"  ✗ Error: {resp.text}")
-        except Exception as e:
-            print(f"  ✗ Exception: {e}")
-        
-        try:
-            # Fetch goals
-            print("🎯 Fetching goals...")
-            resp = requests.get(f"{self.backend_url}/api/goals/", headers=headers, timeout=5)
-            print(f"  Status: {resp.status_code}")
-            if resp.status_code == 200:
-                self.goals_data = resp.json()[:3]
-                print(f"  ✓ Got {len(self.goals_data)} goals")
-                Clock.schedule_once(lambda dt: self._update_goals())
-            else:
-                print(f"  ✗ Error: {resp.text}")
-        except Exception as e:
-            print(f"  ✗ Exception: {e}")
-        
-        try:
-            # Fetch notifications
-            print("🔔 Fetching notifications...")
-            resp = requests.get(f"{self.backend_url}/api/notifications/", headers=headers, timeout=5)
-            print(f"  Status: {resp.status_code}")
-            if resp.status_code == 200:
-                self.notifications_data = resp.json()[:5]
-                print(f"  ✓ Got {len(self.notifications_data)} notifications")
-                Clock.schedule_once(lambda dt: self._update_notifications())
-            else:
-                print(f"  ✗ Error: {resp.text}")
-        except Exception as e:
-            print(f"  ✗ Exception: {e}")
-        
-        try:
-            # Fetch worksheets
-            print("📄 Fetching worksheets...")
-            resp = requests.get(f"{self.backend_url}/api/worksheets/", headers=headers, timeout=5)
-            print(f"  Status: {resp.status_code}")
-            if resp.status_code == 200:
-                self.worksheets_data = resp.json()[:3]
-                print(f"  ✓ Got {len(self.worksheets_data)} worksheets")
-                Clock.schedule_once(lambda dt: self._update_worksheets())
-            else:
-                print(f"  ✗ Error: {resp.text}")
-        except Exception as e:
-            print(f"  ✗ Exception: {e}")
-        
-        try:
-            # Fetch training
-            print("📚 Fetching training...")
-            resp = requests.get(f"{self.backend_url}/api/training/", headers=headers, timeout=5)
-            print(f"  Status: {resp.status_code}")
-            if resp.status_code == 200:
-                self.training_data = resp.json()[:5]
-                print(f"  ✓ Got {len(self.training_data)} training items")
-                Clock.schedule_once(lambda dt: self._update_training())
-            else:
-                print(f"  ✗ Error: {resp.text}")
-        except Exception as e:
-            print(f"  ✗ Exception: {e}")
+            with start_span("dashboard.refresh") as span:
+                futures = [
+                    _fetch_executor.submit(self._fetch_panel, flight, span, *panel)
+                    for panel in DASHBOARD_PANELS
+                ]
+                wait(futures)
+            if flight.is_current():
+                get_refresh_scheduler().report("dashboard", any(f.result() for f in futures))
+        finally:
+            self._flights.finish(flight)
+            self.refreshing = False
+            Clock.schedule_once(lambda dt: self._update_freshness())
         
         print("✅ Dashboard data fetch complete")
     
+    def _fetch_panel(self, flight, parent_span, name, path, params, label):
+        """Fetch one panel's data on an executor thread and schedule its _update_<name>.
+
+        Returns True if the panel's data changed. Nothing is fetched or applied
+        once `flight` has been cancelled or superseded.
+        """
+        if not flight.is_current():
+            return False
+        with start_span(f"dashboard.{name}", parent=parent_span):
+            try:
+                resp = get_api_client().get(path, params=params, timeout=5)
+                if resp.status_code == 200:
+                    data = resp.json()
+                    if not flight.is_current():
+                        return False
+                    fetched_at = get_local_cache().put(f"dashboard:{name}", data)
+                    print(f"  ✓ Got {len(data)} {label}")
+                    # Compare before scheduling apply, which may run (and replace the data) before we return
+                    changed = data != getattr(self, f"{name}_data")
+                    
+                    def apply(dt):
+                        if not flight.is_current():
+                            return
+                        setattr(self, f"{name}_data", data)
+                        self.fetched_at[name] = fetched_at
+                        getattr(self, f"_update_{name}")()
+                        self._update_freshness()
+                    Clock.schedule_once(apply)
+                    return changed
+                print(f"  ✗ {label}: {resp.status_code} {resp.text}")
+            except Exception as e:
+                print(f"  ✗ {label}: {e}")
+            return False
+    
     def _update_appointments(self):
         """Update appointments UI."""
         print(f"📊 Updating appointments UI with {len(self.appointments_data)} items")
-        self.appointments_list.clear_widgets()
         
         if not self.appointments_data:
             print("  ⚠️ No appointments data to display")
-            return
         
-        for appt in self.appointments_data:
+        items = []
+        for index, appt in enumerate(self.appointments_data):
             try:
                 # Parse datetime more safely
                 time_str = appt.get('appointment_time', '')
@@ -813,290 +484,125 @@ class NewDashboardScreen(Screen):
                 else:
                     time_formatted = "No time"
                 
-                item = self._create_appointment_item(
-                    appt.get('client_name', 'Unknown'),
-                    time_formatted,
-                    appt.get('status', 'pending')
-                )
-                self.appointments_list.add_widget(item)
-                print(f"  ✓ Added appointment: {appt.get('client_name')} at {time_formatted}")
+                items.append((appt.get('id', index), {
+                    'client_name': appt.get('client_name') or 'Unknown',
+                    'time': time_formatted,
+                    'status': appt.get('status', 'pending')
+                }))
             except Exception as e:
                 print(f"  ✗ Error creating appointment item: {e}")
                 print(f"    Appointment data: {appt}")
         
+        self._panels['appointments'].update(items)
         print(f"  ✅ Appointments UI updated with {len(self.appointments_list.children)} widgets")
     
     def _update_leads(self):
         """Update leads UI."""
         print(f"📊 Updating leads UI with {len(self.leads_data)} items")
-        self.leads_list.clear_widgets()
         
         if not self.leads_data:
             print("  ⚠️ No leads data to display")
-            return
         
-        for lead in self.leads_data:
+        items = []
+        for index, lead in enumerate(self.leads_data):
             try:
-                name = f"{lead.get('first_name', '')} {lead.get('last_name', '')}".strip()
+                name = f"{lead.get('first_name') or ''} {lead.get('last_name') or ''}".strip()
                 if not name:
                     name = "Unnamed Lead"
                 
-                item = self._create_lead_item(
-                    name,
-                    lead.get('company', 'No Company'),
-                    lead.get('value', 0),
-                    lead.get('status', 'new')
-                )
-                self.leads_list.add_widget(item)
-                print(f"  ✓ Added lead: {name}")
+                items.append((lead.get('id', index), {
+                    'name': name,
+                    'company': lead.get('company') or 'No Company'
+                }))
             except Exception as e:
                 print(f"  ✗ Error creating lead item: {e}")
                 print(f"    Lead data: {lead}")
         
+        self._panels['leads'].update(items)
         print(f"  ✅ Leads UI updated with {len(self.leads_list.children)} widgets")
     
     def _update_goals(self):
         """Update goals UI."""
         print(f"📊 Updating goals UI with {len(self.goals_data)} items")
-        self.goals_content.clear_widgets()
         
         if not self.goals_data:
             print("  ⚠️ No goals data to display")
-            return
         
-        for goal in self.goals_data:
+        items = []
+        for index, goal in enumerate(self.goals_data):
             try:
-                progress = float(goal.get('progress', 0))
-                item = self._create_goal_item(goal.get('title', 'Untitled Goal'), progress)
-                self.goals_content.add_widget(item)
-                print(f"  ✓ Added goal: {goal.get('title')} ({progress}%)")
+                progress = float(goal.get('progress') or 0)
+                items.append((goal.get('id', index), {
+                    'title': goal.get('title') or 'Untitled Goal',
+                    'progress': progress
+                }))
             except Exception as e:
                 print(f"  ✗ Error creating goal item: {e}")
                 print(f"    Goal data: {goal}")
         
+        self._panels['goals'].update(items)
         print(f"  ✅ Goals UI updated with {len(self.goals_content.children)} widgets")
     
     def _update_worksheets(self):
         """Update worksheets UI."""
         print(f"📊 Updating worksheets UI with {len(self.worksheets_data)} items")
-        self.worksheets_list.clear_widgets()
         
         if not self.worksheets_data:
             print("  ⚠️ No worksheets data to display")
             # Add a placeholder
-            placeholder = self._create_list_item("No worksheets yet", "📄")
-            self.worksheets_list.add_widget(placeholder)
+            self._panels['worksheets'].update([("__empty__", {'text': "No worksheets yet", 'icon': "📄"})])
             return
         
-        for ws in self.worksheets_data:
-            try:
-                item = self._create_list_item(ws.get('title', 'Untitled'), "📄")
-                self.worksheets_list.add_widget(item)
-                print(f"  ✓ Added worksheet: {ws.get('title')}")
-            except Exception as e:
-                print(f"  ✗ Error creating worksheet item: {e}")
-        
+        items = [
+            (ws.get('id', index), {'text': ws.get('title') or 'Untitled', 'icon': "📄"})
+            for index, ws in enumerate(self.worksheets_data)
+        ]
+        self._panels['worksheets'].update(items)
         print(f"  ✅ Worksheets UI updated")
     
     def _update_notifications(self):
         """Update notifications UI with enhanced visuals and proper icons."""
         print(f"📊 Updating notifications UI with {len(self.notifications_data)} items")
-        self.notifications_list.clear_widgets()
         
         if not self.notifications_data:
             print("  ⚠️ No notifications data to display")
-            return
         
-        # Map notification types to simple ASCII icons that will render
-        notification_icons = {
-            'lead': '*',
-            'appointment': '>',
-            'reminder': '!',
-            'goal': '+',
-            'update': '#',
-            'system': '@',
-            'message': 'M',
-            'alert': '!',
-            'success': 'V',
-            'task': '-'
-        }
-        
-        for notif in self.notifications_data:
+        items = []
+        for index, notif in enumerate(self.notifications_data):
             try:
                 notif_type = str(notif.get('type', 'system')).lower()
-                icon = notification_icons.get(notif_type, '*')
-                
-                # Create enhanced notification item
-                item = self._create_notification_item(
-                    notif.get('title', 'No title'),
-                    notif.get('message', ''),
-                    icon,
-                    notif.get('read', False)
-                )
-                self.notifications_list.add_widget(item)
-                print(f"  ✓ Added notification: {notif.get('title')} with icon {icon}")
+                icon = NOTIFICATION_ICONS.get(notif_type, '*')
+                items.append((notif.get('id', index), {
+                    'title': notif.get('title') or 'No title',
+                    'message': str(notif.get('message') or ''),
+                    'icon': icon,
+                    'is_read': bool(notif.get('read', False))
+                }))
             except Exception as e:
                 print(f"  ✗ Error creating notification item: {e}")
         
+        self._panels['notifications'].update(items)
         print(f"  ✅ Notifications UI updated")
     
-    def _create_notification_item(self, title, message, icon, is_read):
-        """Create enhanced notification item with icon and read status."""
-        
-        class HoverableNotification(BoxLayout):
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self.is_hovering = False
-                
-                with self.canvas.before:
-                    self._bg_color = Color(0.98, 0.98, 0.98, 0)
-                    self._bg = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                
-                self.bind(pos=self._update_bg, size=self._update_bg)
-                Window.bind(mouse_pos=self.on_mouse_pos)
-            
-            def _update_bg(self, *args):
-                self._bg.pos = self.pos
-                self._bg.size = self.size
-            
-            def on_mouse_pos(self, window, pos):
-                if not self.get_root_window():
-                    return
-                is_colliding = self.collide_point(*self.to_widget(*pos))
-                if is_colliding != self.is_hovering:
-                    self.is_hovering = is_colliding
-                    self._bg_color.rgba = (0.95, 0.95, 0.95, 1) if is_colliding else (0.98, 0.98, 0.98, 0)
-        
-        item = HoverableNotification(
-            size_hint_y=None,
-            height=dp(65),
-            padding=(dp(12), dp(8)),
-            spacing=dp(10)
-        )
-        
-        # Icon with colored background
-        icon_container = BoxLayout(
-            size_hint_x=None,
-            width=dp(40),
-            padding=(dp(4), dp(4))
-        )
-        
-        bg_color = (0.95, 0.95, 0.95, 1) if is_read else (1, 0.95, 0.9, 1)
-        
-        with icon_container.canvas.before:
-            Color(*bg_color)
-            icon_container._bg = RoundedRectangle(
-                pos=icon_container.pos,
-                size=icon_container.size,
-                radius=[dp(20)]
-            )
-            icon_container.bind(
-                pos=lambda i, v: setattr(i._bg, 'pos', v),
-                size=lambda i, v: setattr(i._bg, 'size', v)
-            )
-        
-        icon_label = Label(
-            text=icon,
-            font_size='22sp',
-            halign='center',
-            valign='middle'
-        )
-        icon_container.add_widget(icon_label)
-        item.add_widget(icon_container)
-        
-        # Text content
-        text_container = BoxLayout(orientation='vertical', spacing=dp(3))
-        
-        title_label = Label(
-            text=title,
-            font_size='14sp',
-            bold=not is_read,
-            color=(0.2, 0.2, 0.2, 1) if not is_read else (0.5, 0.5, 0.5, 1),
-            halign='left',
-            valign='top',
-            size_hint_y=None,
-            height=dp(20)
-        )
-        title_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        message_label = Label(
-            text=message[:60] + "..." if len(message) > 60 else message,
-            font_size='12sp',
-            color=(0.5, 0.5, 0.5, 1),
-            halign='left',
-            valign='top',
-            size_hint_y=None,
-            height=dp(30)
-        )
-        message_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        text_container.add_widget(title_label)
-        text_container.add_widget(message_label)
-        item.add_widget(text_container)
-        
-        # Unread indicator
-        if not is_read:
-            unread_dot = Label(
-                text="●",
-                font_size='12sp',
-                color=(1, 0.4, 0, 1),
-                size_hint_x=None,
-                width=dp(20)
-            )
-            item.add_widget(unread_dot)
-        
-        return item
-    
     def _update_training(self):
         """Update training UI with enhanced visuals and category-specific icons."""
         print(f"📊 Updating training UI with {len(self.training_data)} items")
-        self.training_list.clear_widgets()
         
         if not self.training_data:
             print("  ⚠️ No training data to display")
-            return
         
-        # Map categories to simple ASCII icons that will render
-        category_icons = {
-            'software training': 'PC',
-            'sales skills': '$',
-            'sales': '$',
-            'client relations': '<>',
-            'market knowledge': '^',
-            'market': '^',
-            'marketing': '#',
-            'productivity': '++',
-            'legal': 'L',
-            'compliance': 'C',
-            'personal development': '+',
-            'development': 'D',
-            'communication': 'M',
-            'negotiation': '<>',
-            'leadership': 'L',
-            'technology': 'T',
-            'finance': '$',
-            'strategy': 'S',
-            'customer service': '*',
-            'customer': '*',
-            'presentation': 'P',
-            'training': 'T'
-        }
-        
-        for training in self.training_data:
+        items = []
+        for index, training in enumerate(self.training_data):
             try:
                 category_raw = training.get('category', '')
                 category = str(category_raw).lower() if category_raw else ''
                 
                 # Try exact match first
-                icon = category_icons.get(category)
+                icon = TRAINING_CATEGORY_ICONS.get(category)
                 
                 # If no exact match, try partial match
                 if not icon and category:
-                    for key, value in category_icons.items():
+                    for key, value in TRAINING_CATEGORY_ICONS.items():
                         if key in category or category in key:
                             icon = value
                             break
@@ -1112,143 +618,17 @@ class NewDashboardScreen(Screen):
                 else:
                     created_formatted = ""
                 
-                title = training.get('title', 'Untitled')
-                display_category = training.get('category', 'Training')
-                
-                # Create enhanced training item
-                item = self._create_training_item(title, display_category, icon, created_formatted)
-                self.training_list.add_widget(item)
-                print(f"  ✓ Added training: {title} with icon {icon}")
+                items.append((training.get('id', index), {
+                    'title': training.get('title') or 'Untitled',
+                    'category': category_raw,
+                    'icon': icon,
+                    'date': created_formatted
+                }))
             except Exception as e:
                 print(f"  ✗ Error creating training item: {e}")
         
+        self._panels['training'].update(items)
         print(f"  ✅ Training UI updated")
-    
-    def _create_training_item(self, title, category, icon, date):
-        """Create enhanced training item with icon and category."""
-        
-        class HoverableTraining(BoxLayout):
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self.is_hovering = False
-                
-                with self.canvas.before:
-                    self._bg_color = Color(0.98, 0.98, 0.98, 0)
-                    self._bg = RoundedRectangle(
-                        pos=self.pos,
-                        size=self.size,
-                        radius=[dp(8)]
-                    )
-                
-                self.bind(pos=self._update_bg, size=self._update_bg)
-                Window.bind(mouse_pos=self.on_mouse_pos)
-            
-            def _update_bg(self, *args):
-                self._bg.pos = self.pos
-                self._bg.size = self.size
-            
-            def on_mouse_pos(self, window, pos):
-                if not self.get_root_window():
-                    return
-                is_colliding = self.collide_point(*self.to_widget(*pos))
-                if is_colliding != self.is_hovering:
-                    self.is_hovering = is_colliding
-                    self._bg_color.rgba = (0.95, 0.95, 0.95, 1) if is_colliding else (0.98, 0.98, 0.98, 0)
-        
-        item = HoverableTraining(
-            size_hint_y=None,
-            height=dp(60),
-            padding=(dp(12), dp(8)),
-            spacing=dp(10)
-        )
-        
-        # Icon with gradient-like background
-        icon_container = BoxLayout(
-            size_hint_x=None,
-            width=dp(40),
-            padding=(dp(4), dp(4))
-        )
-        
-        with icon_container.canvas.before:
-            Color(1, 0.95, 0.9, 1)
-            icon_container._bg = RoundedRectangle(
-                pos=icon_container.pos,
-                size=icon_container.size,
-                radius=[dp(20)]
-            )
-            icon_container.bind(
-                pos=lambda i, v: setattr(i._bg, 'pos', v),
-                size=lambda i, v: setattr(i._bg, 'size', v)
-            )
-        
-        icon_label = Label(
-            text=icon,
-            font_size='24sp',  # Increased font size
-            bold=True,
-            color=(1, 0.4, 0, 1),  # Orange color for visibility
-            halign='center',
-            valign='middle'
-        )
-        icon_container.add_widget(icon_label)
-        item.add_widget(icon_container)
-        
-        # Text content
-        text_container = BoxLayout(orientation='vertical', spacing=dp(2))
-        
-        title_label = Label(
-            text=title,
-            font_size='13sp',
-            bold=True,
-            color=(0.2, 0.2, 0.2, 1),
-            halign='left',
-            valign='top',
-            size_hint_y=None,
-            height=dp(20)
-        )
-        title_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        # Category and date row
-        meta_row = BoxLayout(size_hint_y=None, height=dp(18), spacing=dp(8))
-        
-        category_label = Label(
-            text=category if category else "Training",
-            font_size='11sp',
-            color=(0.6, 0.6, 0.6, 1),
-            halign='left',
-            valign='middle'
-        )
-        category_label.bind(width=lambda i, v: setattr(i, 'text_size', (v, None)))
-        
-        if date:
-            date_label = Label(
-                text=f"• {date}",
-                font_size='11sp',
-                color=(0.6, 0.6, 0.6, 1),
-                size_hint_x=None,
-                width=dp(60),
-                halign='right'
-            )
-            meta_row.add_widget(category_label)
-            meta_row.add_widget(date_label)
-        else:
-            meta_row.add_widget(category_label)
-        
-        text_container.add_widget(title_label)
-        text_container.add_widget(meta_row)
-        item.add_widget(text_container)
-        
-        # Play icon
-        play_icon = Label(
-            text="▶",
-            font_size='18sp',  # Increased font size
-            bold=True,
-            color=(1, 0.4, 0, 1),
-            size_hint_x=None,
-            width=dp(24)
-        )
-        item.add_widget(play_icon)
-        
-        return item
 
     def send_ai_message(self, instance):
         """Send AI message."""
@@ -1259,5 +639,11 @@ class NewDashboardScreen(Screen):
         # TODO: Implement AI backend call
     
     def logout(self):
-        """Handle logout."""
+        """Handle logout; nothing of this user's data stays on screen for the next one."""
+        self._flights.cancel()
+        self.fetched_at.clear()
+        for name, panel in self._panels.items():
+            setattr(self, f"{name}_data", [])
+            panel.clear()
+        self._update_freshness()
         self.on_logout_callback()
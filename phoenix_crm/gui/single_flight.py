@@ -0,0 +1,65 @@
+"""
+Single-flight guard for GUI refreshes
+
+Each resource (the dashboard panels, the leaderboard, the leads list) has at
+most one fetch in flight. A refresh requested while an identical fetch is
+running joins it instead of starting another. A refresh with different
+parameters (say, another leaderboard period) supersedes it: the running fetch
+is cancelled, and the new one starts.
+
+requests cannot abort a call already on the wire, so cancelling marks the
+Flight. The worker skips any steps it has not started yet, and every result is
+applied only if its Flight is still the latest for the resource. That way an
+older response can never overwrite newer data.
+"""
+import threading
+
+
+class Flight:
+    """One fetch of a resource; check is_current() before applying its result."""
+
+    def __init__(self, owner, key, params):
+        self._owner = owner
+        self.key = key
+        self.params = params
+        self.cancelled = False
+
+    def is_current(self):
+        return not self.cancelled and self._owner._latest.get(self.key) is self
+
+
+class SingleFlight:
+    """Per-owner registry of in-flight fetches, keyed by resource name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._latest = {}
+
+    def start(self, key, params=None):
+        """Begin fetching `key`; None if an identical fetch is already running."""
+        with self._lock:
+            running = self._in_flight.get(key)
+            if running is not None and not running.cancelled:
+                if running.params == params:
+                    return None
+                running.cancelled = True
+            flight = Flight(self, key, params)
+            self._in_flight[key] = flight
+            self._latest[key] = flight
+            return flight
+
+    def finish(self, flight):
+        """Mark `flight` done; its result may still be applied while it is the latest."""
+        with self._lock:
+            if self._in_flight.get(flight.key) is flight:
+                del self._in_flight[flight.key]
+
+    def cancel(self, key=None):
+        """Cancel the fetch of `key` (or every fetch) so none of its results are applied."""
+        with self._lock:
+            for k in ([key] if key is not None else list(self._latest)):
+                flight = self._latest.pop(k, None)
+                if flight is not None:
+                    flight.cancelled = True
+                self._in_flight.pop(k, None)
@@ -0,0 +1,148 @@
+"""
+Client-side tracing for PhoenixCRM
+
+Every backend call made through the shared ApiClient carries a W3C
+traceparent header, so the API's spans join the same trace. User actions (a
+dashboard refresh, a login) open a root span with start_span() on their worker
+thread; the HTTP calls made inside it, or on threads given it as `parent`,
+become its children.
+
+Finished spans are sent as OTLP/HTTP JSON to OTEL_EXPORTER_OTLP_ENDPOINT.
+Setting PHOENIX_TRACE_FILE (e.g. ~/.phoenix_crm/traces.jsonl) also keeps the
+batches the collector did not take, rotated to PHOENIX_TRACE_FILE.1 past
+TRACE_FILE_MAX_BYTES. With neither set, nothing is exported.
+"""
+import os
+import json
+import time
+import queue
+import random
+import threading
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "").rstrip("/")
+TRACE_FILE = Path(os.environ["PHOENIX_TRACE_FILE"]).expanduser() if os.getenv("PHOENIX_TRACE_FILE") else None
+TRACE_FILE_MAX_BYTES = int(os.getenv("TRACE_FILE_MAX_BYTES", str(50 * 1024 * 1024)))
+TRACING_ENABLED = (os.getenv("TRACING_ENABLED", "true").lower() in ("1", "true", "yes")
+                   and bool(OTLP_ENDPOINT or TRACE_FILE))
+SERVICE_NAME = "phoenix-crm-gui"
+
+_local = threading.local()
+_export_queue = queue.SimpleQueue()
+_exporter_lock = threading.Lock()
+_exporter_thread = None
+
+
+def _new_id(bits):
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+@contextmanager
+def start_span(name, kind=1, parent=None, **attributes):
+    """Open a span on this thread, nested under any span already open here.
+
+    Pass `parent` (a span yielded on another thread) to continue a trace in a
+    worker thread. Spans are buffered until the thread's outermost span ends,
+    then queued for the exporter thread so the worker never waits on it.
+    """
+    previous = getattr(_local, "span", None)
+    parent = parent or previous
+    span = {
+        "traceId": parent["traceId"] if parent else _new_id(128),
+        "spanId": _new_id(64),
+        "name": name,
+        "kind": kind,
+        "startTimeUnixNano": time.time_ns(),
+        "attributes": dict(attributes),
+    }
+    if parent:
+        span["parentSpanId"] = parent["spanId"]
+    _local.span = span
+    try:
+        yield span
+    except Exception as e:
+        span["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span["endTimeUnixNano"] = time.time_ns()
+        _local.span = previous
+        if TRACING_ENABLED:
+            pending = getattr(_local, "pending", None)
+            if pending is None:
+                pending = _local.pending = []
+            pending.append(span)
+            if previous is None:
+                _local.pending = []
+                _submit(pending)
+
+
+def _attribute(key, value):
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _encode(span):
+    encoded = {
+        "traceId": span["traceId"],
+        "spanId": span["spanId"],
+        "name": span["name"],
+        "kind": span["kind"],
+        "startTimeUnixNano": str(span["startTimeUnixNano"]),
+        "endTimeUnixNano": str(span["endTimeUnixNano"]),
+        "attributes": [_attribute(k, v) for k, v in span["attributes"].items() if v is not None],
+        "status": {"code": 2, "message": span["error"]} if "error" in span else {"code": 0},
+    }
+    if "parentSpanId" in span:
+        encoded["parentSpanId"] = span["parentSpanId"]
+    return encoded
+
+
+def _submit(spans):
+    """Queue `spans` for the single exporter thread, starting it on first use."""
+    global _exporter_thread
+    if _exporter_thread is None:
+        with _exporter_lock:
+            if _exporter_thread is None:
+                _exporter_thread = threading.Thread(target=_run_exporter, name="trace-exporter", daemon=True)
+                _exporter_thread.start()
+    _export_queue.put(spans)
+
+
+def _run_exporter():
+    while True:
+        _export(_export_queue.get())
+
+
+def _export(spans):
+    payload = json.dumps({"resourceSpans": [{
+        "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+        "scopeSpans": [{"scope": {"name": "phoenix_crm.gui"}, "spans": [_encode(span) for span in spans]}],
+    }]}, separators=(",", ":"))
+
+    if OTLP_ENDPOINT:
+        request = urllib.request.Request(
+            f"{OTLP_ENDPOINT}/v1/traces", data=payload.encode(),
+            headers={"Content-Type": "application/json"}, method="POST",
+        )
+        try:
+            urllib.request.urlopen(request, timeout=2).close()
+            return
+        except Exception:
+            pass
+    if TRACE_FILE is None:
+        return
+    try:
+        TRACE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        if TRACE_FILE.exists() and TRACE_FILE.stat().st_size >= TRACE_FILE_MAX_BYTES:
+            TRACE_FILE.replace(TRACE_FILE.with_name(TRACE_FILE.name + ".1"))
+        with open(TRACE_FILE, "a", encoding="utf-8") as out:
+            out.write(payload + "\n")
+    except OSError:
+        pass